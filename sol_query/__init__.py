@@ -7,6 +7,17 @@ offering both traditional and Glider-style query capabilities.
 
 __version__ = "0.1.0"
 
-from sol_query.query.engine import SolidityQueryEngine
+__all__ = ["SolidityQueryEngine"]
 
-__all__ = ["SolidityQueryEngine"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    """Import SolidityQueryEngine on first access (PEP 562) to keep `import sol_query` cheap."""
+    if name == "SolidityQueryEngine":
+        from sol_query.query.engine import SolidityQueryEngine
+        globals()[name] = SolidityQueryEngine
+        return SolidityQueryEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
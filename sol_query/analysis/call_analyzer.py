@@ -1,6 +1,10 @@
 """AST-based call analyzer for detecting external calls and asset transfers in Solidity code."""
 
-from typing import List, Set, Dict, Optional, Tuple
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Set, Dict, Optional, Tuple
 from sol_query.core.ast_nodes import (
     ASTNode, FunctionDeclaration, CallExpression, Expression,
     Identifier, Literal, BinaryExpression, Statement, NodeType
@@ -8,27 +12,151 @@ from sol_query.core.ast_nodes import (
 from sol_query.analysis.call_types import CallType, CallTypeDetector
 
 
+# Low-level call function names (by type)
+_DELEGATE_CALLS = frozenset({'delegatecall'})
+_STATIC_CALLS = frozenset({'staticcall'})
+_LOW_LEVEL_CALLS = frozenset({'call', 'send', 'transfer'})
+
+# Low-level method name -> call type, so member calls need a single lookup
+_CALLTYPE_BY_LOW_LEVEL: Dict[str, CallType] = {
+    **{name: CallType.LOW_LEVEL for name in _LOW_LEVEL_CALLS},
+    **{name: CallType.STATIC for name in _STATIC_CALLS},
+    **{name: CallType.DELEGATE for name in _DELEGATE_CALLS},
+}
+
+# Call types that leave the current contract
+_EXTERNAL_CALL_TYPES = frozenset({
+    CallType.EXTERNAL, CallType.LOW_LEVEL, CallType.LIBRARY, CallType.DELEGATE, CallType.STATIC
+})
+
+# Asset transfer function names
+_ASSET_TRANSFER_FUNCTIONS = frozenset({
+    'transfer', 'transferFrom', 'safeTransfer', 'safeTransferFrom',
+    'send', 'withdraw', 'deposit', 'mint', 'burn'
+})
+
+# Attributes that might contain expressions, including try-catch specific attributes
+_CALL_CONTAINER_ATTRIBUTES = (
+    'body', 'expression', 'statements', 'functions', 'initializer',
+    'condition', 'then_statement', 'else_statement',
+    'try_expression', 'try_body', 'catch_clauses', 'catch_body',
+    'return_value', 'update_expression',
+)
+
+# The container attributes each node class actually has, found on its first instance
+_CALL_CONTAINER_ATTRIBUTES_BY_TYPE: Dict[type, Tuple[str, ...]] = {}
+
+# Marks per-node cached values that have not been computed yet
+_UNSET = object()
+
+
+def _clean_method_name(text: str) -> str:
+    """Cut a called name at its first parenthesis, e.g. ``foo(args)`` -> ``foo``."""
+    paren = text.find('(')
+    return text if paren < 0 else text[:paren]
+
+
+def _split_member(call_text: str) -> Optional[Tuple[str, str]]:
+    """
+    Split ``object.method()`` call text into its object and method names.
+
+    The object is the text before the first dot and the method the text after
+    the last one, found with partition/rpartition rather than a full split.
+    Returns None when the text has no dot.
+    """
+    object_name, dot, _ = call_text.partition('.')
+    if not dot:
+        return None
+    return object_name, _clean_method_name(call_text.rpartition('.')[2])
+
+
+@lru_cache(maxsize=4096)
+def _parse_member_call(call_text: str) -> Tuple[str, Optional[CallType], CallType, bool]:
+    """
+    Parse ``object.method`` call text (which must contain a dot) into its
+    context-free classification.
+
+    Returns the interned method name, the low-level call type (None for
+    ordinary calls), the type to fall back on when the method is not a member
+    of the calling contract, and whether the method is an asset transfer.
+    Memoized since the same member calls recur across every function of a
+    codebase.
+    """
+    # Split by dot to get object.method
+    object_name, method_name = _split_member(call_text)
+    method_name = sys.intern(method_name)
+
+    # Check if it's a library call (CamelCase object name, likely library)
+    # that is not an interface (interfaces start with I)
+    if object_name and object_name[0].isupper() and not object_name.startswith('I'):
+        fallback_type = CallType.LIBRARY
+    else:
+        fallback_type = CallType.EXTERNAL
+
+    return (method_name, _CALLTYPE_BY_LOW_LEVEL.get(method_name), fallback_type,
+            method_name in _ASSET_TRANSFER_FUNCTIONS)
+
+
+def _member_call_of(literal: Literal) -> Optional[Tuple[str, Optional[CallType], CallType, bool]]:
+    """
+    Get the parsed member call of a literal callee, or None if its text has
+    no dot. Kept on the node, so each callee is parsed once however many
+    analyses look at it.
+    """
+    parsed = getattr(literal, '_member_call_cache', _UNSET)
+    if parsed is _UNSET:
+        text = literal.value
+        parsed = _parse_member_call(text) if '.' in text else None
+        literal._member_call_cache = parsed
+    return parsed
+
+
+@dataclass(frozen=True, slots=True)
+class _CallInfo:
+    """Everything analyze_function needs to know about one call."""
+    call_type: CallType
+    target: Optional[str]
+    is_asset_transfer: bool
+    transfer_type: Optional[str]
+
+
+_UNKNOWN_CALL = _CallInfo(CallType.UNKNOWN, None, False, None)
+
+
 class CallAnalyzer:
     """Analyzes function calls using AST traversal (no regex patterns)."""
 
+    __slots__ = (
+        'call_type_detector', 'delegate_calls', 'static_calls', 'low_level_calls',
+        'asset_transfer_functions', '_functions_source', '_functions_length', '_functions_token',
+        '_reaching_cache', '_func_map', '_call_graph', '_reverse_graph',
+    )
+
     def __init__(self):
         """Initialize the call analyzer."""
         self.call_type_detector = CallTypeDetector()
 
-        # Low-level call function names (by type)
-        self.delegate_calls = {'delegatecall'}
-        self.static_calls = {'staticcall'}
-        self.low_level_calls = {'call', 'send', 'transfer'}
+        # Aliases of the module-level name sets, kept for existing callers
+        self.delegate_calls = _DELEGATE_CALLS
+        self.static_calls = _STATIC_CALLS
+        self.low_level_calls = _LOW_LEVEL_CALLS
+        self.asset_transfer_functions = _ASSET_TRANSFER_FUNCTIONS
 
-        # Asset transfer function names
-        self.asset_transfer_functions = {
-            'transfer', 'transferFrom', 'safeTransfer', 'safeTransferFrom',
-            'send', 'withdraw', 'deposit', 'mint', 'burn'
-        }
+        # The all_functions list the caches below were built from, its length at
+        # the time and a token that changes whenever either of them changes
+        self._functions_source: Optional[List[FunctionDeclaration]] = None
+        self._functions_length = 0
+        self._functions_token = object()
 
-        # Cache for transitive analysis results
-        self._external_calls_cache: Dict[str, bool] = {}
-        self._asset_transfers_cache: Dict[str, bool] = {}
+        # Transitive flag reachability per flag name
+        self._reaching_cache: Dict[str, Set[str]] = {}
+
+        # Name -> function map
+        self._func_map: Optional[Dict[str, FunctionDeclaration]] = None
+
+        # Function name -> callee names and its reverse
+        self._call_graph: Optional[Dict[str, List[str]]] = None
+        self._reverse_graph: Optional[Dict[str, List[str]]] = None
 
     def analyze_function(self, function: FunctionDeclaration, contract_context: Optional[Dict] = None) -> None:
         """
@@ -47,7 +175,7 @@ class CallAnalyzer:
             contract_context = self._build_basic_context(function)
 
         # Find all call expressions in function body
-        calls = self._find_all_calls(function.body)
+        calls = self._find_body_calls(function)
 
         # Analyze each call
         has_external_calls = False
@@ -55,24 +183,20 @@ class CallAnalyzer:
         external_call_targets = []
         asset_transfer_types = []
 
-        for call in calls:
-            call_type = self._classify_call_ast(call, contract_context)
-
+        for info in self._inspect_calls(calls, contract_context):
             # Check if it's an external call
-            if self._is_external_call(call_type):
+            if info.call_type in _EXTERNAL_CALL_TYPES:
                 has_external_calls = True
-                # Extract call target for external_call_targets list
-                call_target = self._extract_call_target(call)
-                if call_target:
-                    external_call_targets.append(call_target)
+                # Call target for external_call_targets list
+                if info.target:
+                    external_call_targets.append(info.target)
 
             # Check if it's an asset transfer
-            if self._is_asset_transfer(call, contract_context):
+            if info.is_asset_transfer:
                 has_asset_transfers = True
-                # Extract transfer type for asset_transfer_types list
-                transfer_type = self._extract_transfer_type(call)
-                if transfer_type:
-                    asset_transfer_types.append(transfer_type)
+                # Transfer type for asset_transfer_types list
+                if info.transfer_type:
+                    asset_transfer_types.append(info.transfer_type)
 
         # Update function metadata (both boolean flags and lists)
         function.has_external_calls = has_external_calls
@@ -80,53 +204,190 @@ class CallAnalyzer:
         function.external_call_targets = external_call_targets
         function.asset_transfer_types = asset_transfer_types
 
+    def analyze_many(self, functions: List[FunctionDeclaration],
+                     contract_context: Optional[Dict] = None,
+                     max_workers: Optional[int] = None) -> None:
+        """
+        Analyze several functions, optionally on a thread pool.
+
+        Each function is analyzed independently and only its own metadata is
+        updated, so the result is the same as calling analyze_function on each.
+        Analysis is pure Python and holds the GIL, so functions run serially
+        unless more than one worker is requested explicitly.
+
+        Args:
+            functions: The functions to analyze
+            contract_context: Context shared by all functions; built per function if omitted
+            max_workers: Number of analysis threads (default: 1)
+        """
+        workers = min(len(functions), max_workers or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(lambda f: self.analyze_function(f, contract_context), functions):
+                    pass
+        else:
+            for function in functions:
+                self.analyze_function(function, contract_context)
+
+    def _find_body_calls(self, function: FunctionDeclaration) -> List[CallExpression]:
+        """
+        Find all call expressions in a function body.
+        The list is computed once and kept on the function, since every
+        analysis of the function walks the same body.
+        """
+        calls = getattr(function, '_cached_calls', None)
+        if calls is None:
+            calls = self._find_all_calls(function.body)
+            function._cached_calls = calls
+        return calls
+
     def _find_all_calls(self, node: ASTNode) -> List[CallExpression]:
         """
-        Recursively find all call expressions in an AST node.
+        Find all call expressions in an AST node.
         Pure AST traversal, no text matching.
         """
-        calls = []
+        return self._collect_calls(node, self._statement_and_body_nodes)
 
-        if isinstance(node, CallExpression):
-            calls.append(node)
-
-        # Recursively search in children
-        if hasattr(node, 'get_children'):
-            for child in node.get_children():
-                calls.extend(self._find_all_calls(child))
+    @staticmethod
+    def _statement_and_body_nodes(node: ASTNode) -> List[ASTNode]:
+        """Nested expressions of statements and the statements of function bodies."""
+        nested = []
 
         # Handle specific node types with nested expressions
         if isinstance(node, Statement):
-            if hasattr(node, 'expression') and node.expression:
-                calls.extend(self._find_all_calls(node.expression))
+            expression = getattr(node, 'expression', None)
+            if expression:
+                nested.append(expression)
 
         if isinstance(node, FunctionDeclaration) and node.body:
-            if hasattr(node.body, 'statements'):
-                for stmt in node.body.statements:
-                    calls.extend(self._find_all_calls(stmt))
+            statements = getattr(node.body, 'statements', None)
+            if statements is not None:
+                nested.extend(statements)
+
+        return nested
+
+    @staticmethod
+    def _collect_calls(root: ASTNode,
+                       nested_nodes: Callable[[ASTNode], List[ASTNode]]) -> List[CallExpression]:
+        """
+        Collect call expressions under root with an explicit stack.
+
+        Nodes are visited in the same pre-order as a recursive walk: each
+        node, then its get_children(), then whatever nested_nodes returns.
+        """
+        calls = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if type(node) is CallExpression:
+                calls.append(node)
+
+            pending = []
+            get_children = getattr(node, 'get_children', None)
+            if get_children is not None:
+                try:
+                    pending.extend(get_children())
+                except Exception:
+                    pass
+            pending.extend(nested_nodes(node))
+
+            # Push in reverse so the first child is popped next
+            stack.extend(child for child in reversed(pending) if child)
 
         return calls
 
+    def classify_calls(self, calls: List[CallExpression], context: Dict) -> List[CallType]:
+        """
+        Classify a batch of calls against one contract context.
+
+        Args:
+            calls: Call expressions to classify
+            context: Contract context for classification
+
+        Returns:
+            The call type of each call, in order
+        """
+        return [info.call_type for info in self._inspect_calls(calls, context)]
+
+    def _inspect_calls(self, calls: List[CallExpression], context: Dict) -> List[_CallInfo]:
+        """
+        Inspect a batch of calls against one contract context.
+
+        What a call is depends only on the form and text of the called
+        expression, so each distinct callee in the batch is inspected once
+        and the result reused for every other call to it.
+        """
+        inspected: Dict[Tuple, _CallInfo] = {}
+        infos = []
+        for call in calls:
+            function_expr = getattr(call, 'function', None)
+            if type(function_expr) is Literal:
+                key = (Literal, function_expr.node_type, function_expr.value)
+            elif type(function_expr) is Identifier:
+                key = (Identifier, function_expr.name)
+            else:
+                infos.append(_UNKNOWN_CALL)
+                continue
+
+            info = inspected.get(key)
+            if info is None:
+                info = inspected[key] = self._inspect_call(function_expr, context)
+            infos.append(info)
+        return infos
+
+    def _inspect_call(self, function_expr: Expression, context: Dict) -> _CallInfo:
+        """
+        Classify a called expression and extract its reporting target and
+        transfer type in a single pass over it.
+        """
+        if type(function_expr) is Literal:
+            text = function_expr.value
+            parsed = _member_call_of(function_expr)
+            if parsed is not None:
+                call_type = self._classify_parsed_member_call(text, parsed, context)
+                method_name, _, _, is_asset_transfer = parsed
+                transfer_type = method_name if is_asset_transfer else None
+            else:
+                if function_expr.node_type == NodeType.MEMBER_ACCESS:
+                    call_type = CallType.UNKNOWN
+                else:
+                    call_type = self._classify_from_text(text, context)
+                is_asset_transfer = _clean_method_name(text) in _ASSET_TRANSFER_FUNCTIONS
+                transfer_type = None
+            target_name = text
+        elif type(function_expr) is Identifier:
+            call_type = self._classify_direct_call(function_expr, context)
+            target_name = function_expr.name
+            is_asset_transfer = target_name in _ASSET_TRANSFER_FUNCTIONS
+            transfer_type = target_name if is_asset_transfer else None
+        else:
+            return _UNKNOWN_CALL
+
+        target = f"external_call:{target_name}" if call_type in _EXTERNAL_CALL_TYPES else None
+        return _CallInfo(call_type, target, is_asset_transfer, transfer_type)
+
     def _classify_call_ast(self, call: CallExpression, context: Dict) -> CallType:
         """
         Classify a call using AST structure analysis.
         Works with current AST structure where member access is stored in function field.
         """
-        if not hasattr(call, 'function') or not call.function:
+        function_expr = getattr(call, 'function', None)
+        if not function_expr:
             return CallType.UNKNOWN
 
-        function_expr = call.function
-
         # Check for member access (stored as Literal with MEMBER_ACCESS type or as text)
-        if isinstance(function_expr, Literal) and function_expr.node_type == NodeType.MEMBER_ACCESS:
-            return self._classify_member_call_from_text(function_expr.value, context)
+        if type(function_expr) is Literal and function_expr.node_type == NodeType.MEMBER_ACCESS:
+            parsed = _member_call_of(function_expr)
+            if parsed is None:
+                return CallType.UNKNOWN
+            return self._classify_parsed_member_call(function_expr.value, parsed, context)
 
         # Check for identifier (direct function call)
-        if isinstance(function_expr, Identifier):
+        if type(function_expr) is Identifier:
             return self._classify_direct_call(function_expr, context)
 
         # If function is stored as text, analyze it
-        if isinstance(function_expr, Literal):
+        if type(function_expr) is Literal:
             return self._classify_from_text(function_expr.value, context)
 
         return CallType.UNKNOWN
@@ -136,53 +397,41 @@ class CallAnalyzer:
         if not call_text or '.' not in call_text:
             return CallType.UNKNOWN
 
-        # Split by dot to get object.method
-        parts = call_text.split('.')
-        if len(parts) < 2:
-            return CallType.UNKNOWN
-
-        # Get object and method name
-        object_name = parts[0]
-        method_name = parts[-1].strip('()')
+        return self._classify_parsed_member_call(call_text, _parse_member_call(call_text), context)
 
-        # Check for delegate calls first (most specific)
-        if method_name in self.delegate_calls:
-            return CallType.DELEGATE
+    def _classify_parsed_member_call(self, call_text: str,
+                                     parsed: Tuple[str, Optional[CallType], CallType, bool],
+                                     context: Dict) -> CallType:
+        """Classify a member access call from its parsed text."""
+        method_name, low_level_type, fallback_type, _ = parsed
 
-        # Check for static calls
-        if method_name in self.static_calls:
-            return CallType.STATIC
-
-        # Check for other low-level calls
-        if method_name in self.low_level_calls:
-            return CallType.LOW_LEVEL
+        # Check for delegate, static and other low-level calls
+        if low_level_type is not None:
+            return low_level_type
 
         # Check if method exists in current contract
-        if method_name in context.get('contract_functions', []):
+        if method_name in context.get('contract_functions', ()):
             # Could be internal or this.method() style external
             if call_text.startswith('this.'):
                 return CallType.EXTERNAL
             return CallType.INTERNAL
 
-        # Check if it's a library call (CamelCase object name, likely library)
-        if object_name and object_name[0].isupper():
-            # Check for common library patterns (SafeMath, Math, etc.)
-            if not object_name.startswith('I'):  # Not interface (interfaces start with I)
-                return CallType.LIBRARY
-
-        # Otherwise, it's an external call
-        return CallType.EXTERNAL
+        # Otherwise a library call or an external call
+        return fallback_type
 
     def _classify_direct_call(self, callee: Identifier, context: Dict) -> CallType:
         """Classify direct function calls."""
-        function_name = callee.name if hasattr(callee, 'name') else str(callee)
-
-        # Check if it's an internal function
-        if function_name in context.get('contract_functions', []):
-            return CallType.INTERNAL
-
-        # Check if it's a modifier
-        if function_name in context.get('contract_modifiers', []):
+        function_name = getattr(callee, 'name', None)
+        if function_name is None:
+            function_name = str(callee)
+
+        # Check if it's an internal function or a modifier
+        callables = context.get('contract_callables')
+        if callables is not None:
+            if function_name in callables:
+                return CallType.INTERNAL
+        elif (function_name in context.get('contract_functions', ())
+              or function_name in context.get('contract_modifiers', ())):
             return CallType.INTERNAL
 
         # Check if it's a type conversion (starts with capital letter, likely interface/contract/type name)
@@ -203,51 +452,50 @@ class CallAnalyzer:
             return self._classify_member_call_from_text(text, context)
 
         # Check for direct function call
-        function_name = text.strip('()')
-        if function_name in context.get('contract_functions', []):
+        function_name = _clean_method_name(text)
+        if function_name in context.get('contract_functions', ()):
             return CallType.INTERNAL
 
         return CallType.UNKNOWN
 
-    def _is_external_call(self, call_type: CallType) -> bool:
+    @staticmethod
+    def _is_external_call(call_type: CallType) -> bool:
         """Check if call type represents an external call."""
-        return call_type in [CallType.EXTERNAL, CallType.LOW_LEVEL, CallType.LIBRARY, CallType.DELEGATE, CallType.STATIC]
+        return call_type in _EXTERNAL_CALL_TYPES
 
     def _extract_call_target(self, call: CallExpression) -> Optional[str]:
         """Extract a string representation of the call target for reporting."""
-        if not hasattr(call, 'function') or not call.function:
+        function_expr = getattr(call, 'function', None)
+        if not function_expr:
             return None
 
-        function_expr = call.function
-
         # For member access (e.g., token.transfer, target.call)
-        if isinstance(function_expr, Literal) and hasattr(function_expr, 'value'):
+        if type(function_expr) is Literal:
             return f"external_call:{function_expr.value}"
 
         # For identifiers (e.g., SomeContract())
-        if isinstance(function_expr, Identifier) and hasattr(function_expr, 'name'):
+        if type(function_expr) is Identifier:
             return f"external_call:{function_expr.name}"
 
         return None
 
     def _extract_transfer_type(self, call: CallExpression) -> Optional[str]:
         """Extract a string representation of the transfer type for reporting."""
-        if not hasattr(call, 'function') or not call.function:
+        function_expr = getattr(call, 'function', None)
+        if not function_expr:
             return None
 
-        function_expr = call.function
-
         # For member access (e.g., token.transfer, token.transferFrom)
-        if isinstance(function_expr, Literal) and hasattr(function_expr, 'value'):
-            call_text = function_expr.value
-            if '.' in call_text:
-                method_name = call_text.split('.')[-1].strip('()')
-                if method_name in self.asset_transfer_functions:
+        if type(function_expr) is Literal:
+            parsed = _member_call_of(function_expr)
+            if parsed is not None:
+                method_name, _, _, is_asset_transfer = parsed
+                if is_asset_transfer:
                     return method_name
 
         # For identifiers
-        if isinstance(function_expr, Identifier) and hasattr(function_expr, 'name'):
-            if function_expr.name in self.asset_transfer_functions:
+        if type(function_expr) is Identifier:
+            if function_expr.name in _ASSET_TRANSFER_FUNCTIONS:
                 return function_expr.name
 
         return None
@@ -256,42 +504,30 @@ class CallAnalyzer:
         """
         Check if a call represents an asset transfer using AST analysis.
         """
-        if not hasattr(call, 'function') or not call.function:
+        function_expr = getattr(call, 'function', None)
+        if not function_expr:
             return False
 
-        function_expr = call.function
-
-        # Check for member access (e.g., token.transfer())
-        if isinstance(function_expr, Literal) and function_expr.node_type == NodeType.MEMBER_ACCESS:
-            call_text = function_expr.value
-            if '.' in call_text:
-                method_name = call_text.split('.')[-1].strip('()')
-                if method_name in self.asset_transfer_functions:
-                    return True
-
         # Check for identifier (direct calls)
-        if isinstance(function_expr, Identifier):
-            if hasattr(function_expr, 'name') and function_expr.name in self.asset_transfer_functions:
-                return True
+        if type(function_expr) is Identifier:
+            return function_expr.name in _ASSET_TRANSFER_FUNCTIONS
 
-        # Check for text representation
-        if isinstance(function_expr, Literal):
-            text = function_expr.value
-            if '.' in text:
-                method_name = text.split('.')[-1].strip('()')
-                if method_name in self.asset_transfer_functions:
-                    return True
-            elif text.strip('()') in self.asset_transfer_functions:
-                return True
+        # Check for member access (e.g., token.transfer()) or other text representation
+        if type(function_expr) is Literal:
+            parsed = _member_call_of(function_expr)
+            if parsed is not None:
+                return parsed[3]
+            return _clean_method_name(function_expr.value) in _ASSET_TRANSFER_FUNCTIONS
 
         return False
 
     def _build_basic_context(self, function: FunctionDeclaration) -> Dict:
         """Build basic context for a function."""
         context = {
-            'contract_functions': [],
-            'contract_modifiers': [],
-            'state_variables': [],
+            'contract_functions': set(),
+            'contract_modifiers': set(),
+            'contract_callables': set(),
+            'state_variables': set(),
             'local_variables': [],
             'parameters': []
         }
@@ -305,12 +541,13 @@ class CallAnalyzer:
             parent = function.parent_contract
             if parent:
                 if hasattr(parent, 'functions'):
-                    context['contract_functions'] = [f.name for f in parent.functions if hasattr(f, 'name')]
+                    context['contract_functions'] = {f.name for f in parent.functions if hasattr(f, 'name')}
                 if hasattr(parent, 'modifiers'):
-                    context['contract_modifiers'] = [m.name for m in parent.modifiers if hasattr(m, 'name')]
+                    context['contract_modifiers'] = {m.name for m in parent.modifiers if hasattr(m, 'name')}
                 if hasattr(parent, 'variables'):
-                    context['state_variables'] = [v.name for v in parent.variables if hasattr(v, 'name')]
+                    context['state_variables'] = {v.name for v in parent.variables if hasattr(v, 'name')}
 
+        context['contract_callables'] = context['contract_functions'] | context['contract_modifiers']
         return context
 
     def analyze_call_expressions(self, call_expressions: List[CallExpression], context: Dict) -> None:
@@ -321,13 +558,10 @@ class CallAnalyzer:
             call_expressions: List of call expressions to analyze
             context: Contract context for classification
         """
-        for call_expr in call_expressions:
-            if not isinstance(call_expr, CallExpression):
-                continue
-
-            # Classify the call
-            call_type = self._classify_call_ast(call_expr, context)
+        call_expressions = [c for c in call_expressions if isinstance(c, CallExpression)]
 
+        # Classify the calls
+        for call_expr, call_type in zip(call_expressions, self.classify_calls(call_expressions, context)):
             # Set the call_type field as string
             call_expr.call_type = call_type.value if call_type else None
 
@@ -339,16 +573,11 @@ class CallAnalyzer:
             ast_root: Root AST node to start traversal
             context: Contract context for classification
         """
-        # Find all call expressions recursively
-        calls = self._find_all_calls_recursive(ast_root)
+        # Find all call expressions recursively, skipping those already classified
+        calls = [c for c in self._find_all_calls_recursive(ast_root) if c.call_type is None]
 
-        # Analyze each call
-        for call_expr in calls:
-            # Skip if already classified
-            if call_expr.call_type is not None:
-                continue
-
-            call_type = self._classify_call_ast(call_expr, context)
+        # Analyze all calls in one batch
+        for call_expr, call_type in zip(calls, self.classify_calls(calls, context)):
             # Set call_type, defaulting to UNKNOWN if None
             if call_type:
                 call_expr.call_type = call_type.value
@@ -356,39 +585,28 @@ class CallAnalyzer:
                 call_expr.call_type = CallType.UNKNOWN.value
 
     def _find_all_calls_recursive(self, node: ASTNode) -> List[CallExpression]:
-        """Recursively find all call expressions in any AST node."""
-        calls = []
-
-        # Check if this node is a call expression
-        if isinstance(node, CallExpression):
-            calls.append(node)
-
-        # Recursively search in all children
-        if hasattr(node, 'get_children'):
-            try:
-                for child in node.get_children():
-                    if child:
-                        calls.extend(self._find_all_calls_recursive(child))
-            except:
-                pass
-
-        # Also check common attributes that might contain expressions
-        # Include try-catch specific attributes and _nested_expressions from generic statements
-        for attr_name in ['body', 'expression', 'statements', 'functions', 'initializer',
-                          'condition', 'then_statement', 'else_statement',
-                          'try_expression', 'try_body', 'catch_clauses', 'catch_body',
-                          'return_value', 'update_expression', '_nested_expressions']:
-            if hasattr(node, attr_name):
-                attr = getattr(node, attr_name)
-                if attr:
-                    if isinstance(attr, list):
-                        for item in attr:
-                            if item:
-                                calls.extend(self._find_all_calls_recursive(item))
-                    else:
-                        calls.extend(self._find_all_calls_recursive(attr))
-
-        return calls
+        """Find all call expressions in any AST node."""
+        return self._collect_calls(node, self._call_container_nodes)
+
+    @staticmethod
+    def _call_container_nodes(node: ASTNode) -> List[ASTNode]:
+        """Nodes held by the common attributes that might contain expressions."""
+        node_class = type(node)
+        attr_names = _CALL_CONTAINER_ATTRIBUTES_BY_TYPE.get(node_class)
+        if attr_names is None:
+            attr_names = tuple(a for a in _CALL_CONTAINER_ATTRIBUTES if hasattr(node, a))
+            _CALL_CONTAINER_ATTRIBUTES_BY_TYPE[node_class] = attr_names
+
+        # _nested_expressions is set per instance on generic statements, not per class
+        nested = []
+        for attr_name in (*attr_names, '_nested_expressions'):
+            attr = getattr(node, attr_name, None)
+            if attr:
+                if isinstance(attr, list):
+                    nested.extend(attr)
+                else:
+                    nested.append(attr)
+        return nested
 
     def analyze_enhanced_call_patterns(self, function: FunctionDeclaration) -> Dict:
         """
@@ -413,7 +631,7 @@ class CallAnalyzer:
             }
 
         # Find all calls
-        calls = self._find_all_calls(function.body)
+        calls = self._find_body_calls(function)
 
         # Initialize result
         result = {
@@ -460,64 +678,16 @@ class CallAnalyzer:
 
         Returns:
             True if the function or any function it calls (transitively) makes external calls
-        """
-        # Check cache first
-        func_name = function.name if hasattr(function, 'name') else None
-        if func_name and func_name in self._external_calls_cache:
-            return self._external_calls_cache[func_name]
 
+        Results are cached per function list and rebuilt when a different list
+        is passed or the list grows or shrinks. After replacing elements of the
+        list in place, pass a new list.
+        """
         # Check if function itself has external calls
         if function.has_external_calls:
-            if func_name:
-                self._external_calls_cache[func_name] = True
             return True
 
-        # Build a map of function names to functions for quick lookup
-        func_map = {f.name: f for f in all_functions if hasattr(f, 'name')}
-
-        # Track visited functions to avoid infinite recursion
-        visited = set()
-
-        result = self._has_external_calls_recursive(function, func_map, visited)
-
-        # Cache the result
-        if func_name:
-            self._external_calls_cache[func_name] = result
-
-        return result
-
-    def _has_external_calls_recursive(self, function: FunctionDeclaration,
-                                       func_map: Dict[str, FunctionDeclaration],
-                                       visited: Set[str]) -> bool:
-        """Recursively check if function or its callees have external calls."""
-        if not hasattr(function, 'name'):
-            return False
-
-        func_name = function.name
-
-        # Avoid infinite recursion
-        if func_name in visited:
-            return False
-        visited.add(func_name)
-
-        # Check if this function has external calls
-        if function.has_external_calls:
-            return True
-
-        # Find internal function calls and check them recursively
-        if not function.body:
-            return False
-
-        calls = self._find_all_calls(function.body)
-        for call in calls:
-            # Get the called function name
-            called_func_name = self._extract_called_function_name(call)
-            if called_func_name and called_func_name in func_map:
-                called_func = func_map[called_func_name]
-                if self._has_external_calls_recursive(called_func, func_map, visited):
-                    return True
-
-        return False
+        return self._call_tree_has_flag(function, all_functions, 'has_external_calls', '_external_calls_transitive')
 
     def analyze_call_tree_asset_transfers(self, function: FunctionDeclaration, all_functions: List[FunctionDeclaration]) -> bool:
         """
@@ -529,83 +699,167 @@ class CallAnalyzer:
 
         Returns:
             True if the function or any function it calls (transitively) transfers assets
-        """
-        # Check cache first
-        func_name = function.name if hasattr(function, 'name') else None
-        if func_name and func_name in self._asset_transfers_cache:
-            return self._asset_transfers_cache[func_name]
 
+        Results are cached per function list and rebuilt when a different list
+        is passed or the list grows or shrinks. After replacing elements of the
+        list in place, pass a new list.
+        """
         # Check if function itself has asset transfers
         if function.has_asset_transfers:
-            if func_name:
-                self._asset_transfers_cache[func_name] = True
             return True
 
-        # Build a map of function names to functions for quick lookup
-        func_map = {f.name: f for f in all_functions if hasattr(f, 'name')}
-
-        # Track visited functions to avoid infinite recursion
-        visited = set()
-
-        result = self._has_asset_transfers_recursive(function, func_map, visited)
+        return self._call_tree_has_flag(function, all_functions, 'has_asset_transfers', '_asset_transfers_transitive')
 
-        # Cache the result
-        if func_name:
-            self._asset_transfers_cache[func_name] = result
-
-        return result
-
-    def _has_asset_transfers_recursive(self, function: FunctionDeclaration,
-                                        func_map: Dict[str, FunctionDeclaration],
-                                        visited: Set[str]) -> bool:
-        """Recursively check if function or its callees have asset transfers."""
-        if not hasattr(function, 'name'):
-            return False
+    def _call_tree_has_flag(self, function: FunctionDeclaration,
+                            all_functions: List[FunctionDeclaration], flag: str, attr: str) -> bool:
+        """
+        Check if any function called by this one (transitively) has the given flag set.
 
-        func_name = function.name
+        The first query for a function list answers it for every function in the
+        list and keeps each result on the function under ``attr``, so later
+        queries are a single attribute lookup.
+        """
+        token = self._functions_key(all_functions)
+        cached = getattr(function, attr, None)
+        if cached is None or cached[0] is not token:
+            self._mark_call_tree_flag(all_functions, flag, attr)
+            cached = getattr(function, attr, None)
+            if cached is None or cached[0] is not token:
+                # Function outside the list: resolve its own callees directly
+                reaching = self._names_reaching(all_functions, flag)
+                return any(name in reaching for name in self._find_callee_names(function))
+        return cached[1]
+
+    def _mark_call_tree_flag(self, all_functions: List[FunctionDeclaration], flag: str, attr: str) -> None:
+        """Store the transitive result of a flag on every function of the list."""
+        reaching = self._names_reaching(all_functions, flag)
+        token = self._functions_token
+        for f in all_functions:
+            result = any(name in reaching for name in self._find_callee_names(f))
+            setattr(f, attr, (token, result))
+
+    def _functions_key(self, all_functions: List[FunctionDeclaration]) -> object:
+        """
+        Token identifying the function list the caches were built from.
 
-        # Avoid infinite recursion
-        if func_name in visited:
-            return False
-        visited.add(func_name)
+        A different list object or a change in its length drops every cached
+        call graph result and yields a new token, so results marked on the
+        functions with the old token are recomputed.
+        """
+        if self._functions_source is not all_functions or self._functions_length != len(all_functions):
+            self._functions_source = all_functions
+            self._functions_length = len(all_functions)
+            self._functions_token = object()
+            self._reaching_cache = {}
+            self._func_map = None
+            self._call_graph = None
+            self._reverse_graph = None
+        return self._functions_token
+
+    def precompute_call_graph(self, all_functions: List[FunctionDeclaration]) -> Dict[str, List[str]]:
+        """
+        Build the call graph of a function list in one upfront pass.
 
-        # Check if this function has asset transfers
-        if function.has_asset_transfers:
-            return True
+        Args:
+            all_functions: List of all functions in the codebase for call resolution
 
-        # Find internal function calls and check them recursively
-        if not function.body:
-            return False
+        Returns:
+            Dict mapping each function name to the names of the functions it calls
+        """
+        self._functions_key(all_functions)
+        if self._call_graph is None:
+            self._call_graph = {name: self._find_callee_names(f)
+                                for name, f in self._function_map(all_functions).items()}
+        return self._call_graph
 
-        calls = self._find_all_calls(function.body)
-        for call in calls:
-            # Get the called function name
-            called_func_name = self._extract_called_function_name(call)
-            if called_func_name and called_func_name in func_map:
-                called_func = func_map[called_func_name]
-                if self._has_asset_transfers_recursive(called_func, func_map, visited):
-                    return True
+    def _names_reaching(self, all_functions: List[FunctionDeclaration], flag: str) -> Set[str]:
+        """
+        Names of the functions whose call tree reaches one with the given flag set.
 
-        return False
+        Computed once per function list for every function at the same time:
+        starting from the flagged functions, callers are added by walking the
+        reversed call graph with an explicit stack, so cycles and deep call
+        chains need no recursion.
+        """
+        self._functions_key(all_functions)
+        cached = self._reaching_cache.get(flag)
+        if cached is not None:
+            return cached
+
+        callers = self._reverse_call_graph(all_functions)
+        stack = [name for name, f in self._function_map(all_functions).items() if getattr(f, flag)]
+        reaching = set(stack)
+        while stack:
+            for caller in callers.get(stack.pop(), ()):
+                if caller not in reaching:
+                    reaching.add(caller)
+                    stack.append(caller)
+
+        self._reaching_cache[flag] = reaching
+        return reaching
+
+    def _reverse_call_graph(self, all_functions: List[FunctionDeclaration]) -> Dict[str, List[str]]:
+        """
+        Map each function name to the names of the functions calling it.
+        Built once per function list and shared by the external call and
+        asset transfer analyses.
+        """
+        graph = self.precompute_call_graph(all_functions)
+        if self._reverse_graph is None:
+            callers: Dict[str, List[str]] = {}
+            for caller, called_names in graph.items():
+                for called_func_name in called_names:
+                    if called_func_name in graph:
+                        callers.setdefault(called_func_name, []).append(caller)
+            self._reverse_graph = callers
+        return self._reverse_graph
+
+    def _find_callee_names(self, function: FunctionDeclaration) -> List[str]:
+        """
+        Names of the functions called from a function body, without repeats.
+        Kept on the function so call tree walks follow call edges directly
+        instead of re-reading every call expression.
+        """
+        names = getattr(function, '_cached_callee_names', None)
+        if names is None:
+            names = list(dict.fromkeys(
+                name for name in map(self._extract_called_function_name, self._find_body_calls(function))
+                if name
+            ))
+            function._cached_callee_names = names
+        return names
+
+    def _function_map(self, all_functions: List[FunctionDeclaration]) -> Dict[str, FunctionDeclaration]:
+        """Map function names to functions, rebuilt only when the function list changes."""
+        self._functions_key(all_functions)
+        if self._func_map is None:
+            self._func_map = {f.name: f for f in all_functions if hasattr(f, 'name')}
+        return self._func_map
 
     def _extract_called_function_name(self, call: CallExpression) -> Optional[str]:
-        """Extract the name of the function being called."""
-        if not hasattr(call, 'function') or not call.function:
+        """Extract the name of the function being called, cached on the call."""
+        name = getattr(call, '_callee_name_cache', _UNSET)
+        if name is _UNSET:
+            name = self._parse_called_function_name(call)
+            call._callee_name_cache = name
+        return name
+
+    def _parse_called_function_name(self, call: CallExpression) -> Optional[str]:
+        """Parse the name of the function being called."""
+        function_expr = getattr(call, 'function', None)
+        if not function_expr:
             return None
 
-        function_expr = call.function
-
         # For identifiers (direct calls like foo())
-        if isinstance(function_expr, Identifier) and hasattr(function_expr, 'name'):
+        if type(function_expr) is Identifier:
             return function_expr.name
 
         # For member access (like this.foo()), extract the method name
-        if isinstance(function_expr, Literal) and hasattr(function_expr, 'value'):
-            call_text = function_expr.value
+        if type(function_expr) is Literal:
+            parsed = _member_call_of(function_expr)
             # For this.method() or obj.method(), we want the method name
-            if '.' in call_text:
-                parts = call_text.split('.')
-                method_name = parts[-1].strip('()')
+            if parsed is not None:
+                method_name = parsed[0]
                 # Only return if it looks like a simple function name (not a complex expression)
                 if method_name.isidentifier():
                     return method_name
@@ -621,25 +875,29 @@ class CallAnalyzer:
             all_contracts: Optional list of all contracts (for inheritance resolution)
 
         Returns:
-            Dict with contract functions, modifiers, and variables
+            Dict with sets of contract function, modifier, and variable names
         """
         context = {
-            'contract_functions': [],
-            'contract_modifiers': [],
-            'state_variables': [],
+            'contract_functions': set(),
+            'contract_modifiers': set(),
+            'contract_callables': set(),
+            'state_variables': set(),
             'local_variables': [],
             'parameters': []
         }
 
         # Add current contract members
         if hasattr(contract, 'functions'):
-            context['contract_functions'] = [f.name for f in contract.functions if hasattr(f, 'name')]
+            context['contract_functions'] = {f.name for f in contract.functions if hasattr(f, 'name')}
 
         if hasattr(contract, 'modifiers'):
-            context['contract_modifiers'] = [m.name for m in contract.modifiers if hasattr(m, 'name')]
+            context['contract_modifiers'] = {m.name for m in contract.modifiers if hasattr(m, 'name')}
 
         if hasattr(contract, 'variables'):
-            context['state_variables'] = [v.name for v in contract.variables if hasattr(v, 'name')]
+            context['state_variables'] = {v.name for v in contract.variables if hasattr(v, 'name')}
+
+        # Functions and modifiers together, for the "known internal call" check
+        context['contract_callables'] = context['contract_functions'] | context['contract_modifiers']
 
         # TODO: Add inherited members from base contracts
         # This would require traversing the inheritance tree
@@ -1,7 +1,9 @@
 """Call analyzer for detecting external calls and asset transfers in Solidity code."""
 
 import re
-from typing import List, Set, Dict, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+from typing import Callable, List, Set, Dict, Optional, Tuple
 from sol_query.core.ast_nodes import (
     ASTNode, FunctionDeclaration, CallExpression, Expression,
     Identifier, Literal, BinaryExpression
@@ -9,9 +11,48 @@ from sol_query.core.ast_nodes import (
 from sol_query.analysis.call_types import CallType, CallTypeDetector
 
 
+# {value: ...} options or payable(...).transfer/send
+_ETH_VALUE_RE = re.compile(r'\{value:\s*[^}]+\}|payable\([^)]+\)\.(?:transfer|send)\(')
+
+
+@lru_cache(maxsize=4096)
+def _is_eth_value_text(source: str) -> bool:
+    """Check source text for an ETH value transfer, memoized since snippets repeat."""
+    return _ETH_VALUE_RE.search(source) is not None
+
+
 class CallAnalyzer:
     """Analyzes function calls to detect external calls and asset transfers."""
 
+    __slots__ = (
+        'call_type_detector', 'external_call_patterns', 'asset_transfer_patterns',
+        'external_function_names', 'asset_transfer_function_names',
+        '_external_call_matchers', '_asset_transfer_matchers', '_classify_external',
+        '_classify_transfer', '_known_external_re',
+        '_external_match_cache', '_transfer_match_cache', '_func_index_source', '_func_index',
+    )
+
+    # Fixed patterns, compiled once for every instance
+    _LIBRARY_CALL_RE = re.compile(r'^[A-Z]\w*\.\w+\s*\(')
+    _TRY_RE = re.compile(r'\btry\s+')
+    _ASSEMBLY_RE = re.compile(r'\bassembly\s*\{')
+    _ASSEMBLY_DELEGATECALL_RE = re.compile(r'\bdelegatecall\s*\(')
+    _ASSEMBLY_STATICCALL_RE = re.compile(r'\bstaticcall\s*\(')
+    _ASSEMBLY_CALL_RE = re.compile(r'\bcall\s*\(')
+    _INTERFACE_TARGET_PATTERNS = (
+        re.compile(r'I[A-Z][a-zA-Z0-9]*\('),  # IERC20(address)
+        re.compile(r'[A-Z][a-zA-Z0-9]*\('),   # Contract(address)
+    )
+    _EXTERNAL_TARGET_PATTERNS = (
+        re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*\['),  # array access
+        re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*\.'),  # member access
+        re.compile(r'address\('),                  # address casting
+        re.compile(r'payable\('),                  # payable casting
+    )
+
+    # Entries kept per match cache before it is cleared
+    _MATCH_CACHE_SIZE = 4096
+
     def __init__(self):
         """Initialize the call analyzer."""
         # Initialize call type detector
@@ -68,6 +109,36 @@ class CallAnalyzer:
             ]
         }
 
+        # Compile the pattern tables once instead of on every match
+        self.external_call_patterns = {
+            call_type: [re.compile(p) for p in patterns]
+            for call_type, patterns in self.external_call_patterns.items()
+        }
+        self.asset_transfer_patterns = {
+            transfer_type: [re.compile(p) for p in patterns]
+            for transfer_type, patterns in self.asset_transfer_patterns.items()
+        }
+
+        # Per category: plain substrings plus one alternation of the real regexes,
+        # tried in category order
+        self._external_call_matchers = self._split_patterns(self.external_call_patterns)
+        self._asset_transfer_matchers = self._split_patterns(self.asset_transfer_patterns)
+        self._classify_external = self._build_classifier(self._external_call_matchers)
+        self._classify_transfer = self._build_classifier(self._asset_transfer_matchers)
+
+        # Any known external contract name as a substring, in one scan
+        self._known_external_re = re.compile('|'.join(
+            re.escape(p.pattern) for p in self.external_call_patterns['known_external']
+        ))
+
+        # Match results by source text; nested expressions repeat the same text
+        self._external_match_cache: Dict[str, Optional[str]] = {}
+        self._transfer_match_cache: Dict[str, Optional[str]] = {}
+
+        # Name -> (position, function) entries of the last all_functions list seen
+        self._func_index_source: Optional[List[FunctionDeclaration]] = None
+        self._func_index: Dict[str, List[Tuple[int, FunctionDeclaration]]] = {}
+
         # Known function names that indicate external calls
         self.external_function_names = {
             'call', 'delegatecall', 'staticcall', 'send', 'transfer',
@@ -82,6 +153,68 @@ class CallAnalyzer:
             'withdraw', 'deposit', 'mint', 'burn'
         }
 
+    @staticmethod
+    def _literal_of(pattern: str) -> Optional[str]:
+        """Return the fixed text a pattern matches, or None if it needs the regex engine."""
+        chars = []
+        escaped = False
+        for char in pattern:
+            if escaped:
+                if char.isalnum():
+                    return None
+                chars.append(char)
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char in '.^$*+?{}[]()|':
+                return None
+            else:
+                chars.append(char)
+        return None if escaped else ''.join(chars)
+
+    @classmethod
+    def _split_patterns(cls, pattern_table: Dict[str, List[re.Pattern]]
+                        ) -> Tuple[Tuple[str, Tuple[str, ...], Optional[re.Pattern]], ...]:
+        """Split each category's patterns into substrings and a single compiled alternation."""
+        matchers = []
+        for category, patterns in pattern_table.items():
+            literals = []
+            regexes = []
+            for p in patterns:
+                literal = cls._literal_of(p.pattern)
+                if literal is None:
+                    regexes.append(f'(?:{p.pattern})')
+                else:
+                    literals.append(literal)
+            combined = re.compile('|'.join(regexes)) if regexes else None
+            matchers.append((category, tuple(literals), combined))
+        return tuple(matchers)
+
+    @staticmethod
+    def _build_classifier(matchers: Tuple[Tuple[str, Tuple[str, ...], Optional[re.Pattern]], ...]
+                          ) -> Callable[[str], Optional[str]]:
+        """
+        Specialize a matcher table into one function returning the first
+        matching category for a source string. Each step closes over its
+        literals and the bound search method of its regex, so classifying
+        does no attribute lookups or None checks on the regexes.
+        """
+        steps = tuple(
+            (category, literals, combined.search if combined is not None else None)
+            for category, literals, combined in matchers
+        )
+
+        def classify(source_code: str) -> Optional[str]:
+            for category, literals, search in steps:
+                for literal in literals:
+                    if literal in source_code:
+                        return category
+                if search is not None and search(source_code):
+                    return category
+            return None
+
+        return classify
+
     def analyze_function(self, function: FunctionDeclaration, contract_context: Optional[Dict] = None) -> None:
         """
         Analyze a function for external calls and asset transfers.
@@ -94,13 +227,22 @@ class CallAnalyzer:
         if not function.body:
             return
 
+        # Extract all expressions from the function
+        expressions = self._extract_all_expressions(function)
+
+        # Without calls only an ETH value pattern could be detected; expression
+        # text comes from the body, so checking the body text once is enough
+        if function._legacy_call_count == 0 and not self._is_eth_value_transfer(function.body):
+            function.has_external_calls = False
+            function.external_call_targets = []
+            function.has_asset_transfers = False
+            function.asset_transfer_types = []
+            return
+
         # Build contract context if not provided
         if contract_context is None:
             contract_context = self._build_basic_context(function)
 
-        # Extract all expressions from the function
-        expressions = self._extract_all_expressions(function)
-
         # Analyze for external calls with context
         external_calls = self._detect_external_calls_contextual(expressions, function, contract_context)
         function.has_external_calls = len(external_calls) > 0
@@ -167,7 +309,7 @@ class CallAnalyzer:
             context['is_external_contract'] = True
 
         # Check for library patterns
-        if re.search(r'^[A-Z]\w*\.\w+\s*\(', source_code):
+        if self._LIBRARY_CALL_RE.search(source_code):
             context['is_library_call'] = True
 
         return context
@@ -179,7 +321,7 @@ class CallAnalyzer:
         for expr in expressions:
             source = expr.get_source_code()
             # Look for try patterns
-            if re.search(r'\btry\s+', source):
+            if self._TRY_RE.search(source):
                 try_catch_calls.append(expr)
 
         return try_catch_calls
@@ -196,12 +338,12 @@ class CallAnalyzer:
         for expr in expressions:
             source = expr.get_source_code()
 
-            if re.search(r'\bassembly\s*\{', source):
-                if re.search(r'\bdelegatecall\s*\(', source):
+            if self._ASSEMBLY_RE.search(source):
+                if self._ASSEMBLY_DELEGATECALL_RE.search(source):
                     assembly_calls['delegatecall'].append(expr)
-                elif re.search(r'\bstaticcall\s*\(', source):
+                elif self._ASSEMBLY_STATICCALL_RE.search(source):
                     assembly_calls['staticcall'].append(expr)
-                elif re.search(r'\bcall\s*\(', source):
+                elif self._ASSEMBLY_CALL_RE.search(source):
                     assembly_calls['call'].append(expr)
                 else:
                     assembly_calls['other'].append(expr)
@@ -234,24 +376,39 @@ class CallAnalyzer:
         return analysis
 
     def _extract_all_expressions(self, function: FunctionDeclaration) -> List[Expression]:
-        """Extract all expressions from a function recursively."""
+        """
+        Extract all expressions from a function recursively, cached on the function
+        along with the number of call expressions among them.
+        """
+        cached = getattr(function, '_legacy_expressions', None)
+        if cached is not None:
+            return cached
+
         expressions = []
+        call_count = 0
 
-        def extract_from_node(node: ASTNode):
+        # Pre-order walk with an explicit stack; children are pushed reversed
+        # so they come out in their original order
+        stack = [function.body] if function.body else []
+        while stack:
+            node = stack.pop()
             if isinstance(node, Expression):
                 expressions.append(node)
+                if isinstance(node, CallExpression):
+                    call_count += 1
 
             # Handle nested expressions in statements
-            if hasattr(node, '_nested_expressions'):
-                expressions.extend(node._nested_expressions)
+            nested = getattr(node, '_nested_expressions', None)
+            if nested:
+                expressions.extend(nested)
+                call_count += sum(isinstance(expr, CallExpression) for expr in nested)
 
-            # Recursively extract from children
-            for child in node.get_children():
-                extract_from_node(child)
-
-        if function.body:
-            extract_from_node(function.body)
+            children = node.get_children()
+            if children:
+                stack.extend(reversed(children))
 
+        function._legacy_call_count = call_count
+        function._legacy_expressions = expressions
         return expressions
 
     def _detect_external_calls(self, expressions: List[Expression], function: FunctionDeclaration) -> Set[str]:
@@ -266,6 +423,7 @@ class CallAnalyzer:
             Set of external call targets/types detected
         """
         external_calls = set()
+        sources = []
 
         for expr in expressions:
             # Analyze call expressions
@@ -274,12 +432,14 @@ class CallAnalyzer:
                 if call_info:
                     external_calls.add(call_info)
 
-            # Check source code patterns
-            if hasattr(expr, 'get_source_code'):
-                source_code = expr.get_source_code()
-                call_type = self._match_external_call_patterns(source_code)
-                if call_type:
-                    external_calls.add(call_type)
+            get_source_code = getattr(expr, 'get_source_code', None)
+            if get_source_code is not None:
+                sources.append(get_source_code())
+
+        # Check source code patterns for the whole batch
+        external_calls.update(self._classify_sources(
+            sources, self._external_match_cache, self._classify_external,
+            len(self._external_call_matchers)))
 
         return external_calls
 
@@ -295,6 +455,7 @@ class CallAnalyzer:
             Set of asset transfer types detected
         """
         asset_transfers = set()
+        sources = []
 
         for expr in expressions:
             # Analyze call expressions for transfer methods
@@ -303,16 +464,21 @@ class CallAnalyzer:
                 if transfer_info:
                     asset_transfers.add(transfer_info)
 
+            get_source_code = getattr(expr, 'get_source_code', None)
+            if get_source_code is None:
+                continue
+            source_code = get_source_code()
+
+            sources.append(source_code)
+
             # Check for ETH value transfers in call expressions
-            if self._is_eth_value_transfer(expr):
+            if self._is_eth_value_source(source_code):
                 asset_transfers.add('eth_transfer')
 
-            # Check source code patterns
-            if hasattr(expr, 'get_source_code'):
-                source_code = expr.get_source_code()
-                transfer_type = self._match_asset_transfer_patterns(source_code)
-                if transfer_type:
-                    asset_transfers.add(transfer_type)
+        # Check source code patterns for the whole batch
+        asset_transfers.update(self._classify_sources(
+            sources, self._transfer_match_cache, self._classify_transfer,
+            len(self._asset_transfer_matchers)))
 
         return asset_transfers
 
@@ -340,18 +506,18 @@ class CallAnalyzer:
             return f'external_call_{function_name}'
 
         # Check for member access patterns (contract.method())
-        if hasattr(call.function, 'get_source_code'):
-            source = call.function.get_source_code()
+        get_source_code = getattr(call.function, 'get_source_code', None)
+        if get_source_code is not None:
+            source = get_source_code()
             if '.' in source:
-                # This might be a contract call
-                parts = source.split('.')
-                if len(parts) >= 2:
-                    method_name = parts[-1]
-                    if method_name in self.external_function_names:
-                        return f'external_call_{method_name}'
-                    # Check if it looks like a contract interface call
-                    if any(pattern in parts[0] for pattern in self.external_call_patterns['known_external']):
-                        return f'interface_call_{method_name}'
+                # This might be a contract call: text after the last dot is the method,
+                # text before the first dot is the receiver
+                method_name = source.rpartition('.')[2]
+                if method_name in self.external_function_names:
+                    return f'external_call_{method_name}'
+                # Check if it looks like a contract interface call
+                if self._known_external_re.search(source.partition('.')[0]) is not None:
+                    return f'interface_call_{method_name}'
 
         return None
 
@@ -398,17 +564,16 @@ class CallAnalyzer:
         Returns:
             True if this is an ETH value transfer
         """
-        if hasattr(expr, 'get_source_code'):
-            source = expr.get_source_code()
-            # Look for {value: ...} patterns
-            if re.search(r'\{value:\s*[^}]+\}', source):
-                return True
-            # Look for payable(...).transfer/send patterns
-            if re.search(r'payable\([^)]+\)\.(transfer|send)\(', source):
-                return True
+        get_source_code = getattr(expr, 'get_source_code', None)
+        if get_source_code is not None:
+            return self._is_eth_value_source(get_source_code())
 
         return False
 
+    def _is_eth_value_source(self, source: str) -> bool:
+        """Check if source text sends ETH through {value: ...} or payable(...).transfer/send."""
+        return _is_eth_value_text(source)
+
     def _has_value_parameter(self, call: CallExpression) -> bool:
         """
         Check if a call expression has a value parameter (indicating ETH transfer).
@@ -421,8 +586,9 @@ class CallAnalyzer:
         """
         # This is a simplified check - in practice, we'd need to analyze
         # the call syntax more carefully
-        if hasattr(call, 'get_source_code'):
-            source = call.get_source_code()
+        get_source_code = getattr(call, 'get_source_code', None)
+        if get_source_code is not None:
+            source = get_source_code()
             return '{value:' in source or 'msg.value' in source
 
         return False
@@ -437,12 +603,7 @@ class CallAnalyzer:
         Returns:
             String describing the external call type, or None if no match
         """
-        for call_type, patterns in self.external_call_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, source_code):
-                    return call_type
-
-        return None
+        return self._match_cached(self._external_match_cache, self._classify_external, source_code)
 
     def _match_asset_transfer_patterns(self, source_code: str) -> Optional[str]:
         """
@@ -454,12 +615,38 @@ class CallAnalyzer:
         Returns:
             String describing the transfer type, or None if no match
         """
-        for transfer_type, patterns in self.asset_transfer_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, source_code):
-                    return transfer_type
+        return self._match_cached(self._transfer_match_cache, self._classify_transfer, source_code)
 
-        return None
+    def _classify_sources(self, sources: List[str], cache: Dict[str, Optional[str]],
+                          classify: Callable[[str], Optional[str]], category_count: int) -> Set[str]:
+        """
+        Match a batch of source texts, returning every category found.
+        Each distinct text is matched once, and the scan stops as soon as
+        all categories have been seen.
+        """
+        found = set()
+        for source_code in dict.fromkeys(sources):
+            category = self._match_cached(cache, classify, source_code)
+            if category:
+                found.add(category)
+                if len(found) == category_count:
+                    break
+        return found
+
+    def _match_cached(self, cache: Dict[str, Optional[str]],
+                      classify: Callable[[str], Optional[str]],
+                      source_code: str) -> Optional[str]:
+        """Return the first matching category for the source text, memoized by text."""
+        try:
+            return cache[source_code]
+        except KeyError:
+            pass
+
+        result = classify(source_code)
+        if len(cache) >= self._MATCH_CACHE_SIZE:
+            cache.clear()
+        cache[source_code] = result
+        return result
 
     def analyze_call_tree_external_calls(self, function: FunctionDeclaration,
                                        all_functions: List[FunctionDeclaration],
@@ -475,26 +662,7 @@ class CallAnalyzer:
         Returns:
             True if the function or any function it calls has external calls
         """
-        if visited is None:
-            visited = set()
-
-        # Avoid infinite recursion
-        if function.name in visited:
-            return False
-
-        visited.add(function.name)
-
-        # Check if this function directly has external calls
-        if function.has_external_calls:
-            return True
-
-        # Check functions called by this function
-        called_functions = self._get_called_functions(function, all_functions)
-        for called_func in called_functions:
-            if self.analyze_call_tree_external_calls(called_func, all_functions, visited.copy()):
-                return True
-
-        return False
+        return self._call_tree_has_flag(function, all_functions, 'has_external_calls', visited)
 
     def analyze_call_tree_asset_transfers(self, function: FunctionDeclaration,
                                         all_functions: List[FunctionDeclaration],
@@ -510,27 +678,110 @@ class CallAnalyzer:
         Returns:
             True if the function or any function it calls has asset transfers
         """
-        if visited is None:
-            visited = set()
+        return self._call_tree_has_flag(function, all_functions, 'has_asset_transfers', visited)
 
-        # Avoid infinite recursion
-        if function.name in visited:
+    def _call_tree_has_flag(self, function: FunctionDeclaration,
+                            all_functions: List[FunctionDeclaration], flag: str,
+                            visited: Optional[Set[str]] = None) -> bool:
+        """
+        Walk the call tree breadth-first, expanding each function at most once.
+        Functions are tracked by identity, not name, so a callee sharing its
+        name with another function (e.g. foo in two contracts) is still
+        walked. Names in a caller-supplied visited set are not entered.
+        Flags precomputed for this function list are read directly.
+        """
+        if visited is None:
+            precomputed = getattr(function, '_tree_flags', None)
+            if precomputed is not None and precomputed[0] is all_functions:
+                return precomputed[1][flag]
+        elif function.name in visited:
             return False
 
-        visited.add(function.name)
-
-        # Check if this function directly has asset transfers
-        if function.has_asset_transfers:
-            return True
-
-        # Check functions called by this function
-        called_functions = self._get_called_functions(function, all_functions)
-        for called_func in called_functions:
-            if self.analyze_call_tree_asset_transfers(called_func, all_functions, visited.copy()):
+        excluded = visited or ()
+        seen = {id(function)}
+        queue = deque([function])
+        while queue:
+            current = queue.popleft()
+            if getattr(current, flag):
                 return True
 
+            for called_func in self._get_called_functions(current, all_functions):
+                if id(called_func) not in seen and called_func.name not in excluded:
+                    seen.add(id(called_func))
+                    queue.append(called_func)
+
         return False
 
+    def precompute_call_tree_flags(self, all_functions: List[FunctionDeclaration]) -> None:
+        """
+        Compute the call tree flags of every function in one pass.
+
+        Strongly connected components of the call graph are found with an
+        iterative Tarjan walk. Components come out callees first, so each one
+        takes the union of its own flags and those of the components it
+        calls. Results are stored on each function for this function list,
+        and later analyze_call_tree_* queries read them directly.
+
+        Args:
+            all_functions: All functions in the codebase
+        """
+        flags = ('has_external_calls', 'has_asset_transfers')
+        callees = {id(f): self._get_called_functions(f, all_functions) for f in all_functions}
+        index: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        on_stack: Set[int] = set()
+        scc_stack: List[FunctionDeclaration] = []
+        component_of: Dict[int, int] = {}
+        component_flags: List[Dict[str, bool]] = []
+
+        for root in all_functions:
+            if id(root) in index:
+                continue
+            index[id(root)] = low[id(root)] = len(index)
+            scc_stack.append(root)
+            on_stack.add(id(root))
+            work = [(root, iter(callees[id(root)]))]
+
+            while work:
+                node, successors = work[-1]
+                for succ in successors:
+                    if id(succ) not in index:
+                        index[id(succ)] = low[id(succ)] = len(index)
+                        scc_stack.append(succ)
+                        on_stack.add(id(succ))
+                        work.append((succ, iter(callees[id(succ)])))
+                        break
+                    if id(succ) in on_stack:
+                        low[id(node)] = min(low[id(node)], index[id(succ)])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[id(parent)] = min(low[id(parent)], low[id(node)])
+                    if low[id(node)] == index[id(node)]:
+                        # node roots a component; its callees' components are done
+                        members = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack.discard(id(member))
+                            component_of[id(member)] = len(component_flags)
+                            members.append(member)
+                            if member is node:
+                                break
+                        member_ids = {id(m) for m in members}
+                        result = {}
+                        for flag in flags:
+                            result[flag] = (
+                                any(getattr(m, flag) for m in members)
+                                or any(component_flags[component_of[id(c)]][flag]
+                                       for m in members for c in callees[id(m)]
+                                       if id(c) not in member_ids)
+                            )
+                        component_flags.append(result)
+
+        for function in all_functions:
+            function._tree_flags = (all_functions, component_flags[component_of[id(function)]])
+
     def _get_called_functions(self, function: FunctionDeclaration,
                             all_functions: List[FunctionDeclaration]) -> List[FunctionDeclaration]:
         """
@@ -546,9 +797,20 @@ class CallAnalyzer:
         if not function.body:
             return []
 
-        called_functions = []
+        # Reuse the callees kept on the function for this same function list
+        cached = getattr(function, '_legacy_callees', None)
+        if cached is not None and cached[0] is all_functions:
+            return cached[1]
+
         expressions = self._extract_all_expressions(function)
 
+        # Leaf functions call nothing
+        if function._legacy_call_count == 0:
+            function._legacy_callees = (all_functions, [])
+            return []
+
+        called_functions = []
+
         # Extract function names from call expressions
         called_names = set()
         for expr in expressions:
@@ -558,13 +820,28 @@ class CallAnalyzer:
                 elif hasattr(expr.function, 'name'):
                     called_names.add(expr.function.name)
 
-        # Find matching functions
-        for func in all_functions:
-            if func.name in called_names and func != function:
+        # Find matching functions, in the order they appear in all_functions
+        index = self._ensure_index(all_functions)
+        matches = [entry for name in called_names for entry in index.get(name, ())]
+        matches.sort(key=lambda entry: entry[0])
+        for _, func in matches:
+            if func != function:
                 called_functions.append(func)
 
+        function._legacy_callees = (all_functions, called_functions)
         return called_functions
 
+    def _ensure_index(self, all_functions: List[FunctionDeclaration]
+                      ) -> Dict[str, List[Tuple[int, FunctionDeclaration]]]:
+        """Index functions by name, rebuilt only when the function list changes."""
+        if self._func_index_source is not all_functions:
+            index: Dict[str, List[Tuple[int, FunctionDeclaration]]] = {}
+            for position, func in enumerate(all_functions):
+                index.setdefault(func.name, []).append((position, func))
+            self._func_index = index
+            self._func_index_source = all_functions
+        return self._func_index
+
     # ===== CONTEXTUAL ANALYSIS METHODS =====
 
     def _build_basic_context(self, function: FunctionDeclaration) -> Dict:
@@ -832,13 +1109,8 @@ class CallAnalyzer:
             return False
 
         # Interface casting patterns
-        interface_patterns = [
-            r'I[A-Z][a-zA-Z0-9]*\(',  # IERC20(address)
-            r'[A-Z][a-zA-Z0-9]*\(',   # Contract(address)
-        ]
-
-        for pattern in interface_patterns:
-            if re.search(pattern, target):
+        for pattern in self._INTERFACE_TARGET_PATTERNS:
+            if pattern.search(target):
                 return True
 
         return False
@@ -861,15 +1133,8 @@ class CallAnalyzer:
             return False
 
         # Common external patterns
-        external_patterns = [
-            r'[a-zA-Z_][a-zA-Z0-9_]*\[',  # array access
-            r'[a-zA-Z_][a-zA-Z0-9_]*\.',  # member access
-            r'address\(',                  # address casting
-            r'payable\(',                  # payable casting
-        ]
-
-        for pattern in external_patterns:
-            if re.search(pattern, target):
+        for pattern in self._EXTERNAL_TARGET_PATTERNS:
+            if pattern.search(target):
                 return True
 
         return False
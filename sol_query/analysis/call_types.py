@@ -40,9 +40,39 @@ class CallType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Fixed patterns used by the fallback classifiers, compiled once
+_LIBRARY_CALL_RE = re.compile(r'^[A-Z]\w*\.\w+\s*\(', re.IGNORECASE)
+_INTERFACE_CAST_RE = re.compile(r'I[A-Z]\w*\s*\([^)]*\)')
+_KNOWN_LIBRARY_RE = re.compile(r'^(SafeMath|Math|Strings|Address|Arrays|LibraryName)\.\w+')
+_SIMPLE_CALL_RE = re.compile(r'^[a-z_]\w*\s*\(', re.IGNORECASE)
+_MEMBER_CALL_RE = re.compile(r'^\w+\.\w+\s*\(', re.IGNORECASE)
+
+
+def _compiled_group(patterns_attr: str) -> property:
+    """Read-only list of a pattern group compiled one pattern at a time."""
+    def compiled(self) -> List[Pattern]:
+        return [re.compile(p, re.IGNORECASE) for p in getattr(self, patterns_attr)]
+    return property(compiled, doc=f"Compiled patterns of ``{patterns_attr}``.")
+
+
 class CallTypeDetector:
     """Detects and classifies different types of calls in Solidity code."""
 
+    # Per-pattern compiled groups, kept for existing callers; detection itself
+    # uses the fused alternations in fused_patterns
+    compiled_low_level = _compiled_group('low_level_patterns')
+    compiled_delegate = _compiled_group('delegate_patterns')
+    compiled_static = _compiled_group('static_patterns')
+    compiled_event = _compiled_group('event_patterns')
+    compiled_solidity = _compiled_group('solidity_builtin_patterns')
+    compiled_library = _compiled_group('library_patterns')
+    compiled_type_conversion = _compiled_group('type_conversion_patterns')
+    compiled_assembly = _compiled_group('assembly_patterns')
+    compiled_interface = _compiled_group('interface_patterns')
+    compiled_try_catch = _compiled_group('try_catch_patterns')
+    compiled_assembly_delegate = _compiled_group('assembly_delegate_patterns')
+    compiled_assembly_static = _compiled_group('assembly_static_patterns')
+
     def __init__(self):
         """Initialize the call type detector with patterns and rules."""
 
@@ -153,23 +183,35 @@ class CallTypeDetector:
 
     def _compile_patterns(self):
         """Compile regex patterns for better performance."""
-        self.compiled_low_level = [re.compile(p, re.IGNORECASE) for p in self.low_level_patterns]
-        self.compiled_delegate = [re.compile(p, re.IGNORECASE) for p in self.delegate_patterns]
-        self.compiled_static = [re.compile(p, re.IGNORECASE) for p in self.static_patterns]
-        self.compiled_event = [re.compile(p, re.IGNORECASE) for p in self.event_patterns]
-        self.compiled_solidity = [re.compile(p, re.IGNORECASE) for p in self.solidity_builtin_patterns]
-        self.compiled_library = [re.compile(p, re.IGNORECASE) for p in self.library_patterns]
-        self.compiled_type_conversion = [re.compile(p, re.IGNORECASE) for p in self.type_conversion_patterns]
-        self.compiled_assembly = [re.compile(p, re.IGNORECASE) for p in self.assembly_patterns]
-        self.compiled_interface = [re.compile(p, re.IGNORECASE) for p in self.interface_patterns]
-        self.compiled_try_catch = [re.compile(p, re.IGNORECASE) for p in self.try_catch_patterns]
-        self.compiled_assembly_delegate = [re.compile(p, re.IGNORECASE) for p in self.assembly_delegate_patterns]
-        self.compiled_assembly_static = [re.compile(p, re.IGNORECASE) for p in self.assembly_static_patterns]
-
         self.compiled_creation = {}
         for key, pattern in self.creation_patterns.items():
             self.compiled_creation[key] = re.compile(pattern, re.IGNORECASE)
 
+        # One alternation per pattern group, so "matches any" is a single search
+        self.fused_patterns = {
+            name: self._fuse(patterns) for name, patterns in (
+                ('low_level', self.low_level_patterns),
+                ('delegate', self.delegate_patterns),
+                ('static', self.static_patterns),
+                ('event', self.event_patterns),
+                ('solidity', self.solidity_builtin_patterns),
+                ('library', self.library_patterns),
+                ('type_conversion', self.type_conversion_patterns),
+                ('assembly', self.assembly_patterns),
+                ('interface', self.interface_patterns),
+                ('try_catch', self.try_catch_patterns),
+                ('assembly_delegate', self.assembly_delegate_patterns),
+                ('assembly_static', self.assembly_static_patterns),
+            )
+        }
+
+    @staticmethod
+    def _fuse(patterns: Set[str]) -> Pattern:
+        """Compile a pattern group into a single case-insensitive alternation."""
+        if not patterns:
+            return re.compile(r'(?!)')
+        return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
     def detect_call_type(self, source_code: str, context: Optional[Dict] = None) -> CallType:
         """
         Detect the type of call from source code.
@@ -186,39 +228,39 @@ class CallTypeDetector:
         # Priority order matters - check most specific patterns first
 
         # 1. Event emissions
-        if self._matches_any(source_code, self.compiled_event):
+        if self.fused_patterns['event'].search(source_code):
             return CallType.EVENT
 
         # 2. Assembly delegate calls (most specific)
-        if self._matches_any(source_code, self.compiled_assembly_delegate):
+        if self.fused_patterns['assembly_delegate'].search(source_code):
             return CallType.DELEGATE
 
         # 3. Assembly static calls (most specific)
-        if self._matches_any(source_code, self.compiled_assembly_static):
+        if self.fused_patterns['assembly_static'].search(source_code):
             return CallType.STATIC
 
         # 4. Assembly calls (general)
-        if self._matches_any(source_code, self.compiled_assembly):
+        if self.fused_patterns['assembly'].search(source_code):
             return CallType.ASSEMBLY
 
         # 5. Delegate calls (specific)
-        if self._matches_any(source_code, self.compiled_delegate):
+        if self.fused_patterns['delegate'].search(source_code):
             return CallType.DELEGATE
 
         # 4. Static calls (specific)
-        if self._matches_any(source_code, self.compiled_static):
+        if self.fused_patterns['static'].search(source_code):
             return CallType.STATIC
 
         # 5. Low-level calls (general)
-        if self._matches_any(source_code, self.compiled_low_level):
+        if self.fused_patterns['low_level'].search(source_code):
             return CallType.LOW_LEVEL
 
         # 6. Interface/external calls (before built-in functions)
-        if self._matches_any(source_code, self.compiled_interface):
+        if self.fused_patterns['interface'].search(source_code):
             return CallType.EXTERNAL
 
         # 7. Built-in Solidity functions
-        if self._matches_any(source_code, self.compiled_solidity):
+        if self.fused_patterns['solidity'].search(source_code):
             return CallType.SOLIDITY
 
         # 8. Constructor/creation calls
@@ -227,7 +269,7 @@ class CallTypeDetector:
             return creation_type
 
         # 9. Type conversions
-        if self._matches_any(source_code, self.compiled_type_conversion):
+        if self.fused_patterns['type_conversion'].search(source_code):
             return CallType.TYPE_CONVERSION
 
         # 10. Internal calls via this
@@ -245,10 +287,6 @@ class CallTypeDetector:
         # 13. Default classification based on patterns
         return self._classify_default(source_code)
 
-    def _matches_any(self, source_code: str, compiled_patterns: List[Pattern]) -> bool:
-        """Check if source code matches any of the compiled patterns."""
-        return any(pattern.search(source_code) for pattern in compiled_patterns)
-
     def _detect_creation_type(self, source_code: str) -> Optional[CallType]:
         """Detect constructor/creation call types."""
         if self.compiled_creation['new_array'].search(source_code) or \
@@ -266,7 +304,7 @@ class CallTypeDetector:
     def _is_library_call(self, source_code: str, context: Optional[Dict]) -> bool:
         """Determine if this is a library call."""
         # Check for library usage patterns
-        if self._matches_any(source_code, self.compiled_library):
+        if self.fused_patterns['library'].search(source_code):
             return True
 
         # Check context for library information
@@ -274,12 +312,11 @@ class CallTypeDetector:
             return True
 
         # Pattern: LibraryName.function() where LibraryName is CamelCase and not interface patterns
-        library_call_pattern = re.compile(r'^[A-Z]\w*\.\w+\s*\(', re.IGNORECASE)
-        if library_call_pattern.match(source_code):
+        if _LIBRARY_CALL_RE.match(source_code):
             # Exclude known interface patterns
-            if not re.search(r'I[A-Z]\w*\s*\([^)]*\)', source_code):
+            if not _INTERFACE_CAST_RE.search(source_code):
                 # Common library names
-                if re.match(r'^(SafeMath|Math|Strings|Address|Arrays|LibraryName)\.\w+', source_code):
+                if _KNOWN_LIBRARY_RE.match(source_code):
                     return True
 
         return False
@@ -310,8 +347,7 @@ class CallTypeDetector:
     def _classify_default(self, source_code: str) -> CallType:
         """Default classification based on common patterns."""
         # Simple function call pattern: functionName(args)
-        simple_call_pattern = re.compile(r'^[a-z_]\w*\s*\(', re.IGNORECASE)
-        if simple_call_pattern.match(source_code):
+        if _SIMPLE_CALL_RE.match(source_code):
             return CallType.INTERNAL
 
         # this.method() calls are internal
@@ -319,8 +355,7 @@ class CallTypeDetector:
             return CallType.INTERNAL
 
         # Member access pattern: object.method(args)
-        member_call_pattern = re.compile(r'^\w+\.\w+\s*\(', re.IGNORECASE)
-        if member_call_pattern.match(source_code):
+        if _MEMBER_CALL_RE.match(source_code):
             # Could be external or library, default to external
             return CallType.EXTERNAL
 
@@ -2,6 +2,7 @@
 
 import logging
 import re
+import sys
 from typing import Dict, List, Optional, Union, Any
 
 import tree_sitter
@@ -142,8 +143,7 @@ class ASTBuilder:
 
             # Also analyze functions for has_external_calls flags
             if hasattr(contract, 'functions'):
-                for function in contract.functions:
-                    self.call_analyzer.analyze_function(function, context)
+                self.call_analyzer.analyze_many(contract.functions, context)
 
     def build_node(self, node: tree_sitter.Node) -> Optional[ASTNode]:
         """
@@ -249,9 +249,10 @@ class ASTBuilder:
         }
         kind = kind_map.get(node.type, "contract")
 
-        # Get contract name
+        # Get contract name. Declaration names are interned so the many
+        # equality tests and dictionary lookups on them hit the identity check
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else "Unknown"
+        name = sys.intern(self._get_node_text(name_node)) if name_node else "Unknown"
 
         # Get inheritance
         inheritance = []
@@ -261,10 +262,10 @@ class ASTBuilder:
             for type_node in self._find_children_by_type(inheritance_node, "user_defined_type"):
                 identifier = self._find_child_by_type(type_node, "identifier")
                 if identifier:
-                    inheritance.append(self._get_node_text(identifier))
+                    inheritance.append(sys.intern(self._get_node_text(identifier)))
             # Also check for direct identifiers (fallback)
             for identifier in self._find_children_by_type(inheritance_node, "identifier"):
-                inheritance.append(self._get_node_text(identifier))
+                inheritance.append(sys.intern(self._get_node_text(identifier)))
 
         # Create contract
         contract = ContractDeclaration(
@@ -312,7 +313,7 @@ class ASTBuilder:
             name = "constructor"
         else:
             name_node = self._find_child_by_type(node, "identifier")
-            name = self._get_node_text(name_node) if name_node else "unknown"
+            name = sys.intern(self._get_node_text(name_node)) if name_node else "unknown"
 
         # Check for special function types
         is_constructor = (node.type == "constructor_definition" or name == "constructor")
@@ -355,7 +356,9 @@ class ASTBuilder:
             # Extract just the modifier name (before any parentheses)
             modifier_name = modifier_text.split('(')[0].strip()
             if modifier_name:
-                modifiers.append(modifier_name)
+                # Interned: modifier names repeat across many functions and are
+                # compared in membership filters
+                modifiers.append(sys.intern(modifier_name))
 
         # Get parameters - they are direct children of the function node
         parameters = []
@@ -411,11 +414,11 @@ class ASTBuilder:
         """Build a variable declaration."""
         # Get variable name
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else "unknown"
+        name = sys.intern(self._get_node_text(name_node)) if name_node else "unknown"
 
         # Get type
         type_node = self._find_child_by_type(node, "type_name")
-        type_name = self._get_node_text(type_node) if type_node else "unknown"
+        type_name = sys.intern(self._get_node_text(type_node)) if type_node else "unknown"
 
         # Check for state variable modifiers
         visibility = None
@@ -469,7 +472,7 @@ class ASTBuilder:
 
         # Get modifier name
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else "unknown"
+        name = sys.intern(self._get_node_text(name_node)) if name_node else "unknown"
 
         # Get parameters
         parameters = []
@@ -500,7 +503,7 @@ class ASTBuilder:
         """Build an event declaration."""
         # Get event name
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else "unknown"
+        name = sys.intern(self._get_node_text(name_node)) if name_node else "unknown"
 
         # Get parameters
         parameters = []
@@ -522,7 +525,7 @@ class ASTBuilder:
         """Build an error declaration."""
         # Get error name
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else "unknown"
+        name = sys.intern(self._get_node_text(name_node)) if name_node else "unknown"
 
         # Get parameters - error parameters are direct children of error_declaration
         parameters = []
@@ -554,7 +557,7 @@ class ASTBuilder:
 
         # Get struct name
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else "unknown"
+        name = sys.intern(self._get_node_text(name_node)) if name_node else "unknown"
 
         # Get members
         members = []
@@ -583,9 +586,9 @@ class ASTBuilder:
         # Extract member information from children
         for child in node.children:
             if child.type == "identifier":
-                name = self._get_node_text(child)
+                name = sys.intern(self._get_node_text(child))
             elif child.type == "type_name":
-                type_name = self._get_node_text(child)
+                type_name = sys.intern(self._get_node_text(child))
             elif child.type in ["memory", "storage", "calldata"]:
                 storage_location = child.type
 
@@ -608,7 +611,7 @@ class ASTBuilder:
 
         for child in node.children:
             if child.type == "identifier":
-                field_name = self._get_node_text(child)
+                field_name = sys.intern(self._get_node_text(child))
             elif child.type not in [":", "comment"]:
                 field_value = self.build_node(child)
                 if field_value:
@@ -629,7 +632,7 @@ class ASTBuilder:
         """Build an enum declaration."""
         # Get enum name
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else "unknown"
+        name = sys.intern(self._get_node_text(name_node)) if name_node else "unknown"
 
         # Get enum values
         values = []
@@ -649,11 +652,11 @@ class ASTBuilder:
         """Build a parameter."""
         # Get parameter name
         name_node = self._find_child_by_type(node, "identifier")
-        name = self._get_node_text(name_node) if name_node else ""
+        name = sys.intern(self._get_node_text(name_node)) if name_node else ""
 
         # Get type
         type_node = self._find_child_by_type(node, "type_name")
-        type_name = self._get_node_text(type_node) if type_node else "unknown"
+        type_name = sys.intern(self._get_node_text(type_node)) if type_node else "unknown"
 
         # Get storage location
         storage_location = None
@@ -721,7 +724,7 @@ class ASTBuilder:
 
     def _build_identifier(self, node: tree_sitter.Node) -> Identifier:
         """Build an identifier expression."""
-        name = self._get_node_text(node)
+        name = sys.intern(self._get_node_text(node))
 
         return Identifier(
             source_location=self._get_source_location(node),
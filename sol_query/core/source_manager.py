@@ -1,6 +1,11 @@
 """Source management system for handling multiple files and dependencies."""
 
+import hashlib
 import logging
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Union, Tuple
 from dataclasses import dataclass, field
@@ -28,6 +33,7 @@ class SourceFile:
     imports: List[ImportStatement] = field(default_factory=list)
     pragmas: List["PragmaDirective"] = field(default_factory=list)
     parse_errors: List[ParseError] = field(default_factory=list)
+    content_hash: str = ""
 
     def is_parsed(self) -> bool:
         """Check if file has been successfully parsed."""
@@ -67,6 +73,11 @@ class SourceManager:
 
         # Performance optimization
         self._needs_contextual_analysis = False
+        self._thread_state = threading.local()
+
+        # Bumped whenever the set of parsed files changes so that consumers
+        # can invalidate derived indexes
+        self.generation = 0
 
         # Caching
         self.enable_cache = True
@@ -86,46 +97,170 @@ class SourceManager:
             ParseError: If file cannot be read
         """
         path = Path(file_path).resolve()
+        existing = self._get_up_to_date(path)
+        if existing is not None:
+            return existing
 
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        source_file = self._read_file(path)
+        unchanged = self._reuse_unchanged(source_file)
+        if unchanged is not None:
+            return unchanged
+
+        self._parse_file(source_file)
+        self._store_file(source_file)
+        return source_file
+
+    def add_files(self,
+                  file_paths: List[Union[str, Path]],
+                  skip_errors: bool = False,
+                  max_workers: Optional[int] = None) -> List[SourceFile]:
+        """
+        Add several files, reading and parsing them in parallel.
+
+        Files are read and parsed by tree-sitter on a thread pool; tree-sitter
+        releases the GIL while parsing. AST building and registration then run
+        serially in the given order, so the result is the same as calling
+        add_file for each path.
 
-        if not path.is_file():
-            raise ParseError(f"Path is not a file: {path}")
+        Args:
+            file_paths: Paths to the Solidity files
+            skip_errors: Log and skip unreadable files instead of raising
+            max_workers: Maximum number of parser threads (default: CPU count)
 
-        # Check if already loaded and up-to-date
-        if path in self.files and self.enable_cache:
-            existing = self.files[path]
-            current_mtime = datetime.fromtimestamp(path.stat().st_mtime)
-            if existing.last_modified >= current_mtime:
-                return existing
+        Returns:
+            List of successfully loaded SourceFile instances
 
-        # Read file content
+        Raises:
+            FileNotFoundError: If a file does not exist and skip_errors is False
+            ParseError: If a file cannot be read and skip_errors is False
+        """
+        ordered: List[Path] = list(dict.fromkeys(Path(p).resolve() for p in file_paths))
+        loaded: Dict[Path, SourceFile] = {}
+        pending: List[Path] = []
+        for path in ordered:
+            existing = self._get_up_to_date(path)
+            if existing is not None:
+                loaded[path] = existing
+            else:
+                pending.append(path)
+
+        workers = min(len(pending), max_workers or os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                prepared = list(executor.map(self._read_and_parse_tree, pending))
+        else:
+            prepared = [self._read_and_parse_tree(path) for path in pending]
+
+        for path, (source_file, tree, error) in zip(pending, prepared):
+            if source_file is None:
+                if not skip_errors:
+                    raise error
+                logger.warning(f"Failed to add file {path}: {error}")
+                continue
+            unchanged = self._reuse_unchanged(source_file)
+            if unchanged is not None:
+                loaded[path] = unchanged
+                continue
+            if error is not None:
+                source_file.parse_errors.append(error)
+                logger.warning(f"Parse error in {source_file.path}: {error}")
+            else:
+                self._parse_file(source_file, tree)
+            self._store_file(source_file)
+            loaded[path] = source_file
+
+        return [loaded[path] for path in ordered if path in loaded]
+
+    def _get_up_to_date(self, path: Path) -> Optional[SourceFile]:
+        """Get the cached source file for a path if it has not changed on disk."""
+        existing = self.files.get(path)
+        if existing is None or not self.enable_cache:
+            return None
+        # One stat call answers both "is it still a file" and "has it changed"
+        try:
+            file_stat = path.stat()
+        except OSError:
+            return None
+        if (stat.S_ISREG(file_stat.st_mode) and
+                existing.last_modified >= datetime.fromtimestamp(file_stat.st_mtime)):
+            return existing
+        return None
+
+    def _read_file(self, path: Path) -> SourceFile:
+        """Read a file into an unparsed SourceFile."""
+        # Open first and stat the open handle, instead of probing the path
+        # with separate exists/is_file/stat calls
         try:
             with open(path, 'r', encoding='utf-8') as f:
+                file_stat = os.fstat(f.fileno())
+                if not stat.S_ISREG(file_stat.st_mode):
+                    raise ParseError(f"Path is not a file: {path}")
                 content = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+        except IsADirectoryError:
+            raise ParseError(f"Path is not a file: {path}") from None
         except (UnicodeDecodeError, IOError) as e:
             raise ParseError(f"Failed to read file {path}: {e}") from e
 
-        # Create source file
-        source_file = SourceFile(
+        return SourceFile(
             path=path,
             content=content,
-            last_modified=datetime.fromtimestamp(path.stat().st_mtime)
+            last_modified=datetime.fromtimestamp(file_stat.st_mtime),
+            content_hash=hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
         )
 
-        # Parse the file
-        self._parse_file(source_file)
+    def _reuse_unchanged_check(self, source_file: SourceFile) -> bool:
+        """Check, without side effects, whether a freshly read file is already parsed."""
+        existing = self.files.get(source_file.path)
+        return (existing is not None and self.enable_cache and not existing.parse_errors and
+                existing.content_hash == source_file.content_hash)
 
-        # Store in cache
-        self.files[path] = source_file
+    def _reuse_unchanged(self, source_file: SourceFile) -> Optional[SourceFile]:
+        """
+        Get the already parsed file if a freshly read file has identical content.
+
+        A newer modification time alone (e.g. a touch or a branch switch that
+        restores the same text) then does not trigger a reparse.
+        """
+        if not self._reuse_unchanged_check(source_file):
+            return None
+        existing = self.files[source_file.path]
+        existing.last_modified = source_file.last_modified
+        return existing
+
+    def _read_and_parse_tree(self, path: Path) -> Tuple[Optional[SourceFile],
+                                                         Optional[tree_sitter.Tree],
+                                                         Optional[Exception]]:
+        """Read and parse one file on a worker thread, capturing errors."""
+        try:
+            source_file = self._read_file(path)
+        except (ParseError, FileNotFoundError) as e:
+            return None, None, e
+
+        if self._reuse_unchanged_check(source_file):
+            return source_file, None, None
+
+        # tree-sitter parsers are not thread-safe, so each thread gets its own
+        parser = getattr(self._thread_state, "parser", None)
+        if parser is None:
+            parser = SolidityParser()
+            self._thread_state.parser = parser
+
+        try:
+            return source_file, parser.parse_text(source_file.content, source_file.path), None
+        except ParseError as e:
+            return source_file, None, e
+
+    def _store_file(self, source_file: SourceFile) -> None:
+        """Register a parsed source file."""
+        self.files[source_file.path] = source_file
+        self.generation += 1
 
         # Mark that we need to run contextual analysis
         # (will be done in batch after all files are loaded for performance)
         self._needs_contextual_analysis = True
 
-        return source_file
-
     def add_directory(self,
                      directory_path: Union[str, Path],
                      recursive: bool = True,
@@ -153,20 +288,15 @@ class SourceManager:
             raise ParseError(f"Path is not a directory: {path}")
 
         patterns = patterns or self.file_patterns
-        source_files = []
+        file_paths = []
 
         for pattern in patterns:
             if recursive:
-                files = path.rglob(pattern)
+                file_paths.extend(path.rglob(pattern))
             else:
-                files = path.glob(pattern)
+                file_paths.extend(path.glob(pattern))
 
-            for file_path in files:
-                try:
-                    source_file = self.add_file(file_path)
-                    source_files.append(source_file)
-                except (ParseError, FileNotFoundError) as e:
-                    logger.warning(f"Failed to add file {file_path}: {e}")
+        source_files = self.add_files(file_paths, skip_errors=True)
 
         if not source_files:
             logger.warning(f"No Solidity files found in {path}")
@@ -278,17 +408,30 @@ class SourceManager:
         if path not in self.files:
             return None
 
-        # Remove from cache and re-add
-        del self.files[path]
-
         try:
-            return self.add_file(path)
+            source_file = self._read_file(path)
         except (FileNotFoundError, ParseError):
+            del self.files[path]
+            self.generation += 1
             return None
 
+        # Unchanged content keeps the existing parse
+        unchanged = self._reuse_unchanged(source_file)
+        if unchanged is not None:
+            return unchanged
+
+        # Remove from cache and re-add
+        del self.files[path]
+        self.generation += 1
+
+        self._parse_file(source_file)
+        self._store_file(source_file)
+        return source_file
+
     def clear_cache(self) -> None:
         """Clear all cached files and dependencies."""
         self.files.clear()
+        self.generation += 1
         self.dependency_graph.clear()
         self.reverse_dependencies.clear()
         self.parser.clear_cache()
@@ -326,11 +469,12 @@ class SourceManager:
             "success_rate": parsed_files / total_files if total_files > 0 else 0
         }
 
-    def _parse_file(self, source_file: SourceFile) -> None:
-        """Parse a source file and populate its AST."""
+    def _parse_file(self, source_file: SourceFile, tree: Optional[tree_sitter.Tree] = None) -> None:
+        """Parse a source file and populate its AST, reusing a tree parsed ahead of time."""
         try:
             # Parse with tree-sitter
-            tree = self.parser.parse_text(source_file.content, source_file.path)
+            if tree is None:
+                tree = self.parser.parse_text(source_file.content, source_file.path)
             source_file.tree = tree
 
             # Build AST
@@ -2,6 +2,7 @@
 
 import re
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Union, Pattern, Callable, TYPE_CHECKING, Set
 
 from sol_query.core.ast_nodes import (
@@ -10,6 +11,11 @@ from sol_query.core.ast_nodes import (
     Visibility, StateMutability
 )
 from sol_query.analysis.call_types import CallType
+from sol_query.query.indexes import (
+    FunctionFlags, VISIBILITY_FLAGS, OperatorCategory, OPERATOR_CATEGORIES, LOOP_STATEMENT_TYPES,
+    TimeFlags
+)
+from sol_query.utils.pattern_matching import cached_compile
 
 if TYPE_CHECKING:
     from sol_query.query.engine import SolidityQueryEngine
@@ -18,9 +24,21 @@ if TYPE_CHECKING:
     from sol_query.analysis.data_flow import DataFlowAnalyzer
 
 
+def _is_exact_name(pattern: Any) -> bool:
+    """Check whether a name pattern can only ever match the identical name."""
+    return isinstance(pattern, str) and pattern.isidentifier()
+
+
+_get_name = attrgetter("name")
+
+
 class BaseCollection(ABC):
     """Base class for all collections supporting fluent queries."""
 
+    # Every fluent step allocates a collection; slots keep them small and
+    # attribute access off the instance dict. Subclasses declare empty slots.
+    __slots__ = ("_engine", "_materialized", "_source", "_predicates")
+
     def __init__(self, elements: List[ASTNode], engine: "SolidityQueryEngine"):
         """
         Initialize collection.
@@ -32,6 +50,67 @@ class BaseCollection(ABC):
         self._elements = elements
         self._engine = engine
 
+    # Lazily filtered collections keep their source and pending predicates and
+    # only build the element list when a terminal operation needs it
+    @property
+    def _elements(self) -> List[ASTNode]:
+        """Elements of the collection, materialized on first access."""
+        if self._materialized is None:
+            predicates = self._predicates
+            self._materialized = [e for e in self._source
+                                  if all(predicate(e) for predicate in predicates)]
+            self._source = None
+            self._predicates = ()
+        return self._materialized
+
+    @_elements.setter
+    def _elements(self, elements: List[ASTNode]) -> None:
+        self._materialized = elements
+        self._source = None
+        self._predicates = ()
+
+    def _defer(self, predicate: Callable[[ASTNode], bool]) -> "BaseCollection":
+        """Create a collection of the same type that filters by predicate lazily."""
+        collection = self.__class__.__new__(self.__class__)
+        collection._engine = self._engine
+        collection._materialized = None
+        if self._materialized is None:
+            collection._source = self._source
+            collection._predicates = self._predicates + (predicate,)
+        else:
+            collection._source = self._materialized
+            collection._predicates = (predicate,)
+        return collection
+
+    def _with_exact_name(self, name: str, get_all: Callable[[], List[ASTNode]],
+                         get_by_name: Callable[[], Dict[str, List[ASTNode]]]) -> "BaseCollection":
+        """
+        Filter by an exact name.
+
+        On the engine's unfiltered collection the result comes straight from
+        the engine's name dictionary instead of scanning every element.
+        """
+        return self._indexed_filter(get_all, lambda: get_by_name().get(name, []),
+                                    lambda e: e.name == name)
+
+    def _indexed_filter(self, get_all: Callable[[], List[ASTNode]],
+                        lookup: Callable[[], List[ASTNode]],
+                        predicate: Callable[[ASTNode], bool]) -> "BaseCollection":
+        """
+        Filter by predicate, or take a precomputed result from an engine index
+        when this collection is the engine's unfiltered element list.
+        """
+        if self._materialized is not None and self._materialized is get_all():
+            return self._create_new_collection(list(lookup()))
+        return self._defer(predicate)
+
+    def _iter_lazy(self):
+        """Iterate matching elements without materializing the collection."""
+        if self._materialized is not None:
+            return iter(self._materialized)
+        predicates = self._predicates
+        return (e for e in self._source if all(predicate(e) for predicate in predicates))
+
     def __len__(self) -> int:
         """Get number of elements in collection."""
         return len(self._elements)
@@ -54,9 +133,13 @@ class BaseCollection(ABC):
         """Get the underlying list of elements."""
         return list(self._elements)
 
+    def names(self) -> List[str]:
+        """Get the names of all elements (collections of named declarations only)."""
+        return list(map(_get_name, self._iter_lazy()))
+
     def first(self) -> Optional[ASTNode]:
         """Get the first element, or None if empty."""
-        return self._elements[0] if self._elements else None
+        return next(self._iter_lazy(), None)
 
     def count(self) -> int:
         """Get count of elements."""
@@ -64,7 +147,7 @@ class BaseCollection(ABC):
 
     def is_empty(self) -> bool:
         """Check if collection is empty."""
-        return len(self._elements) == 0
+        return self.first() is None
 
     def to_dict(self) -> List[Dict[str, Any]]:
         """Convert all elements to dictionaries for JSON serialization."""
@@ -91,8 +174,7 @@ class BaseCollection(ABC):
             # Find functions with more than 5 parameters
             complex_funcs = engine.functions.where(lambda f: len(f.parameters) > 5)
         """
-        filtered = [element for element in self._elements if predicate(element)]
-        return self._create_new_collection(filtered)
+        return self._defer(predicate)
 
     def and_filter(self, condition: Callable[[ASTNode], bool]) -> "BaseCollection":
         """
@@ -130,8 +212,7 @@ class BaseCollection(ABC):
                 .and_not(lambda f: f.is_view())
             )
         """
-        filtered = [element for element in self._elements if not condition(element)]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda element: not condition(element))
 
     def or_with(self, other_collection: "BaseCollection") -> "BaseCollection":
         """
@@ -218,41 +299,44 @@ class BaseCollection(ABC):
 class ContractCollection(BaseCollection):
     """Collection of contract declarations with fluent query methods."""
 
+    __slots__ = ()
+
     def _create_new_collection(self, elements: List[ASTNode]) -> "ContractCollection":
         contracts = [e for e in elements if isinstance(e, ContractDeclaration)]
         return ContractCollection(contracts, self._engine)
 
     def with_name(self, pattern: Union[str, Pattern]) -> "ContractCollection":
         """Filter contracts by name pattern."""
-        filtered = [c for c in self._elements
-                   if self._engine.pattern_matcher.matches_name_pattern(c.name, pattern)]
-        return self._create_new_collection(filtered)
+        if _is_exact_name(pattern):
+            return self._with_exact_name(pattern, self._engine._get_contract_list,
+                                         self._engine._get_contracts_by_name)
+        name_matches = self._engine.pattern_matcher.name_pattern_matcher(pattern)
+        return self._defer(lambda c: name_matches(c.name))
 
     def with_name_not(self, pattern: Union[str, Pattern]) -> "ContractCollection":
         """Filter contracts excluding name pattern."""
-        filtered = [c for c in self._elements
-                   if not self._engine.pattern_matcher.matches_name_pattern(c.name, pattern)]
+        name_matches = self._engine.pattern_matcher.name_pattern_matcher(pattern)
+        filtered = [c for c in self._elements if not name_matches(c.name)]
         return self._create_new_collection(filtered)
 
     def with_names(self, names: List[str]) -> "ContractCollection":
         """Filter contracts by exact name matches."""
-        filtered = [c for c in self._elements if c.name in names]
-        return self._create_new_collection(filtered)
+        # Snapshot the names: the filter runs lazily, after the caller may
+        # have changed the list it passed in
+        wanted = frozenset(names)
+        return self._defer(lambda c: c.name in wanted)
 
     def with_inheritance(self, base_contract: str) -> "ContractCollection":
         """Filter contracts that inherit from the specified contract."""
-        filtered = [c for c in self._elements if base_contract in c.inheritance]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: base_contract in c.inheritance)
 
     def interfaces(self) -> "ContractCollection":
         """Get only interface contracts."""
-        filtered = [c for c in self._elements if c.is_interface()]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: c.is_interface())
 
     def libraries(self) -> "ContractCollection":
         """Get only library contracts."""
-        filtered = [c for c in self._elements if c.is_library()]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: c.is_library())
 
     def main_contracts(self) -> "ContractCollection":
         """Get only regular contracts (not interfaces or libraries)."""
@@ -290,18 +374,15 @@ class ContractCollection(BaseCollection):
     # Additional negation filters for contracts
     def not_interfaces(self) -> "ContractCollection":
         """Get contracts that are NOT interfaces."""
-        filtered = [c for c in self._elements if not c.is_interface()]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: not c.is_interface())
 
     def not_libraries(self) -> "ContractCollection":
         """Get contracts that are NOT libraries."""
-        filtered = [c for c in self._elements if not c.is_library()]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: not c.is_library())
 
     def not_with_inheritance(self, base_contract: str) -> "ContractCollection":
         """Filter contracts that do NOT inherit from the specified contract."""
-        filtered = [c for c in self._elements if base_contract not in c.inheritance]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: base_contract not in c.inheritance)
 
     def without_function_name(self, name: Union[str, Pattern]) -> "ContractCollection":
         """Filter contracts that do NOT have a function with the specified name."""
@@ -338,8 +419,7 @@ class ContractCollection(BaseCollection):
         matching_contracts = analyzer.get_contracts_using_imports(patterns)
 
         # Filter current collection to only include matching contracts
-        filtered = [c for c in self._elements if c in matching_contracts]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: c in matching_contracts)
 
     def not_using_imports(self, import_patterns: Union[str, List[str]]) -> "ContractCollection":
         """Filter contracts that do NOT use specific imports."""
@@ -348,8 +428,7 @@ class ContractCollection(BaseCollection):
         matching_contracts = analyzer.get_contracts_using_imports(patterns)
 
         # Filter current collection to exclude matching contracts
-        filtered = [c for c in self._elements if c not in matching_contracts]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda c: c not in matching_contracts)
 
     # Navigation methods
     def get_functions(self) -> "FunctionCollection":
@@ -384,25 +463,46 @@ class ContractCollection(BaseCollection):
 class FunctionCollection(BaseCollection):
     """Collection of function declarations with fluent query methods."""
 
+    __slots__ = ()
+
     def _create_new_collection(self, elements: List[ASTNode]) -> "FunctionCollection":
         functions = [e for e in elements if isinstance(e, FunctionDeclaration)]
         return FunctionCollection(functions, self._engine)
 
     def with_name(self, pattern: Union[str, Pattern]) -> "FunctionCollection":
         """Filter functions by name pattern."""
-        filtered = [f for f in self._elements
-                   if self._engine.pattern_matcher.matches_name_pattern(f.name, pattern)]
-        return self._create_new_collection(filtered)
+        if _is_exact_name(pattern):
+            return self._with_exact_name(pattern, lambda: self._engine._get_function_table().functions,
+                                         self._engine._get_functions_by_name)
+        name_matches = self._engine._get_function_name_index().predicate(pattern)
+        return self._defer(lambda f: name_matches(f.name))
+
+    def names(self) -> List[str]:
+        """Get the names of all functions."""
+        table = self._engine._get_function_table()
+        if self._materialized is not None and self._materialized is table.functions:
+            return list(table.names)
+        return super().names()
 
     def with_signature(self, signature: str) -> "FunctionCollection":
         """Filter functions by exact signature."""
-        filtered = [f for f in self._elements if f.get_signature() == signature]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: f.get_signature() == signature)
+
+    def _with_flags(self, require: int = 0, forbid: int = 0) -> "FunctionCollection":
+        """Filter functions by FunctionFlags bits using the engine's function table."""
+        table = self._engine._get_function_table()
+        flags_of = table.flags_of
+        return self._indexed_filter(
+            lambda: table.functions,
+            lambda: table.bucket(require, forbid),
+            lambda f: flags_of(f) & require == require and not flags_of(f) & forbid)
 
     def with_visibility(self, visibility: Visibility) -> "FunctionCollection":
         """Filter functions by visibility."""
-        filtered = [f for f in self._elements if f.visibility == visibility]
-        return self._create_new_collection(filtered)
+        flag = VISIBILITY_FLAGS.get(getattr(visibility, 'value', visibility))
+        if flag is not None:
+            return self._with_flags(require=flag)
+        return self._defer(lambda f: f.visibility == visibility)
 
     def external(self) -> "FunctionCollection":
         """Get only external functions."""
@@ -422,34 +522,28 @@ class FunctionCollection(BaseCollection):
 
     def view(self) -> "FunctionCollection":
         """Get only view functions."""
-        filtered = [f for f in self._elements if f.is_view()]
-        return self._create_new_collection(filtered)
+        return self._with_flags(require=FunctionFlags.VIEW)
 
     def pure(self) -> "FunctionCollection":
         """Get only pure functions."""
-        filtered = [f for f in self._elements if f.is_pure()]
-        return self._create_new_collection(filtered)
+        return self._with_flags(require=FunctionFlags.PURE)
 
     def payable(self) -> "FunctionCollection":
         """Get only payable functions."""
-        filtered = [f for f in self._elements if f.is_payable()]
-        return self._create_new_collection(filtered)
+        return self._with_flags(require=FunctionFlags.PAYABLE)
 
     def constructors(self) -> "FunctionCollection":
         """Get only constructor functions."""
-        filtered = [f for f in self._elements if f.is_constructor]
-        return self._create_new_collection(filtered)
+        return self._with_flags(require=FunctionFlags.CONSTRUCTOR)
 
     def with_modifiers(self, modifiers: Union[str, List[str]]) -> "FunctionCollection":
         """Filter functions that have the specified modifiers."""
-        modifier_list = [modifiers] if isinstance(modifiers, str) else modifiers
-        filtered = [f for f in self._elements
-                   if any(mod in f.modifiers for mod in modifier_list)]
-        return self._create_new_collection(filtered)
+        wanted = [modifiers] if isinstance(modifiers, str) else modifiers
+        return self._defer(self._engine._get_function_table().modifier_predicate(wanted))
 
     def with_modifier_regex(self, pattern: Union[str, Pattern]) -> "FunctionCollection":
         """Filter functions that have modifiers matching the regex pattern."""
-        pattern_obj = re.compile(pattern) if isinstance(pattern, str) else pattern
+        pattern_obj = cached_compile(pattern) if isinstance(pattern, str) else pattern
         filtered = []
         for func in self._elements:
             if any(pattern_obj.search(mod) for mod in func.modifiers):
@@ -458,13 +552,37 @@ class FunctionCollection(BaseCollection):
 
     def without_modifiers(self) -> "FunctionCollection":
         """Get functions without any modifiers."""
-        filtered = [f for f in self._elements if not f.has_modifiers()]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: not f.has_modifiers())
+
+    def with_parameters(self, min_count: int = 1) -> "FunctionCollection":
+        """Filter functions that take at least min_count parameters."""
+        table = self._engine._get_function_table()
+        if min_count == 1:
+            return self._defer(table.has_parameters)
+        param_count = table.param_count
+        return self._defer(lambda f: param_count(f) >= min_count)
+
+    def without_parameters(self) -> "FunctionCollection":
+        """Filter functions that take no parameters."""
+        has_parameters = self._engine._get_function_table().has_parameters
+        return self._defer(lambda f: not has_parameters(f))
+
+    def with_body(self) -> "FunctionCollection":
+        """Filter functions that have an implementation body."""
+        return self._with_flags(require=FunctionFlags.HAS_BODY)
+
+    def without_body(self) -> "FunctionCollection":
+        """Filter functions without a body (e.g. interface or abstract functions)."""
+        return self._with_flags(forbid=FunctionFlags.HAS_BODY)
+
+    def with_loops(self) -> "FunctionCollection":
+        """Filter functions containing for, while or do-while loops."""
+        loop_functions = self._engine._get_function_ids_with_statements(LOOP_STATEMENT_TYPES)
+        return self._defer(lambda f: id(f) in loop_functions)
 
     def with_parameter_count(self, count: int) -> "FunctionCollection":
         """Filter functions by parameter count."""
-        filtered = [f for f in self._elements if len(f.parameters) == count]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: len(f.parameters) == count)
 
     def with_parameter_type(self, type_pattern: Union[str, Pattern]) -> "FunctionCollection":
         """Filter functions that have parameters of the specified type."""
@@ -478,64 +596,56 @@ class FunctionCollection(BaseCollection):
     # Negation filters for visibility
     def not_external(self) -> "FunctionCollection":
         """Get functions that are NOT external."""
-        filtered = [f for f in self._elements if f.visibility != Visibility.EXTERNAL]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.EXTERNAL)
 
     def not_public(self) -> "FunctionCollection":
         """Get functions that are NOT public."""
-        filtered = [f for f in self._elements if f.visibility != Visibility.PUBLIC]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.PUBLIC)
 
     def not_internal(self) -> "FunctionCollection":
         """Get functions that are NOT internal."""
-        filtered = [f for f in self._elements if f.visibility != Visibility.INTERNAL]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.INTERNAL)
 
     def not_private(self) -> "FunctionCollection":
         """Get functions that are NOT private."""
-        filtered = [f for f in self._elements if f.visibility != Visibility.PRIVATE]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.PRIVATE)
 
     # Negation filters for state mutability
     def not_view(self) -> "FunctionCollection":
         """Get functions that are NOT view."""
-        filtered = [f for f in self._elements if not f.is_view()]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.VIEW)
 
     def not_pure(self) -> "FunctionCollection":
         """Get functions that are NOT pure."""
-        filtered = [f for f in self._elements if not f.is_pure()]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.PURE)
 
     def not_payable(self) -> "FunctionCollection":
         """Get functions that are NOT payable."""
-        filtered = [f for f in self._elements if not f.is_payable()]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.PAYABLE)
 
     # Negation filters for special function types
     def not_constructors(self) -> "FunctionCollection":
         """Get functions that are NOT constructors."""
-        filtered = [f for f in self._elements if not f.is_constructor]
-        return self._create_new_collection(filtered)
+        return self._with_flags(forbid=FunctionFlags.CONSTRUCTOR)
 
     # Negation filters for modifiers
     def without_modifier(self, modifier: str) -> "FunctionCollection":
         """Filter functions that do NOT have the specified modifier."""
-        filtered = [f for f in self._elements if modifier not in f.modifiers]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: modifier not in f.modifiers)
 
     def without_any_modifiers_matching(self, modifiers: Union[str, List[str]]) -> "FunctionCollection":
         """Filter functions that do NOT have any of the specified modifiers."""
-        modifier_list = [modifiers] if isinstance(modifiers, str) else modifiers
-        filtered = [f for f in self._elements
-                   if not any(mod in f.modifiers for mod in modifier_list)]
-        return self._create_new_collection(filtered)
+        excluded = [modifiers] if isinstance(modifiers, str) else modifiers
+        has_any = self._engine._get_function_table().modifier_predicate(excluded)
+        return self._defer(lambda f: not has_any(f))
 
     # Generic negation filter
     def not_with_visibility(self, visibility: Visibility) -> "FunctionCollection":
         """Filter functions that do NOT have the specified visibility."""
-        filtered = [f for f in self._elements if f.visibility != visibility]
-        return self._create_new_collection(filtered)
+        flag = VISIBILITY_FLAGS.get(getattr(visibility, 'value', visibility))
+        if flag is not None:
+            return self._with_flags(forbid=flag)
+        return self._defer(lambda f: f.visibility != visibility)
 
     def get_parent_contract(self, function: FunctionDeclaration) -> Optional[ContractDeclaration]:
         """Get the parent contract of a function."""
@@ -543,40 +653,41 @@ class FunctionCollection(BaseCollection):
 
     def from_contract(self, contract_name: str) -> "FunctionCollection":
         """Filter functions from a specific contract."""
-        filtered = [f for f in self._elements
-                   if f.parent_contract and f.parent_contract.name == contract_name]
-        return self._create_new_collection(filtered)
+        # Parent pointers are threaded at parse time; match them by identity
+        # against the loaded contracts of that name instead of comparing names
+        contract_ids = self._engine._get_contract_ids(contract_name)
+        if contract_ids:
+            return self._indexed_filter(
+                lambda: self._engine._get_function_table().functions,
+                lambda: self._engine._get_functions_by_contract().get(contract_name, []),
+                lambda f: id(f.parent_contract) in contract_ids)
+        return self._defer(lambda f: f.parent_contract is not None
+                           and f.parent_contract.name == contract_name)
 
     # External call and asset transfer filters
     def with_external_calls(self) -> "FunctionCollection":
         """Filter functions that directly contain external calls."""
-        filtered = [f for f in self._elements if f.has_external_calls]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: f.has_external_calls)
 
     def without_external_calls(self) -> "FunctionCollection":
         """Filter functions that do NOT directly contain external calls."""
-        filtered = [f for f in self._elements if not f.has_external_calls]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: not f.has_external_calls)
 
     def with_asset_transfers(self) -> "FunctionCollection":
         """Filter functions that directly contain asset transfers (ETH send, token transfers)."""
-        filtered = [f for f in self._elements if f.has_asset_transfers]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: f.has_asset_transfers)
 
     def without_asset_transfers(self) -> "FunctionCollection":
         """Filter functions that do NOT directly contain asset transfers."""
-        filtered = [f for f in self._elements if not f.has_asset_transfers]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: not f.has_asset_transfers)
 
     def with_external_calls_deep(self) -> "FunctionCollection":
         """
         Filter functions whose call tree includes any external calls (deep analysis).
         This analyzes the entire call chain to find functions that may indirectly make external calls.
         """
-        # Import here to avoid circular imports
-        from sol_query.analysis.call_analyzer import CallAnalyzer
-        analyzer = CallAnalyzer()
-        all_functions = self._engine._get_all_functions()
+        analyzer = self._engine._get_call_analyzer()
+        all_functions = self._engine._get_function_table().functions
 
         filtered = []
         for func in self._elements:
@@ -589,10 +700,8 @@ class FunctionCollection(BaseCollection):
         """
         Filter functions whose call tree does NOT include any external calls (deep analysis).
         """
-        # Import here to avoid circular imports
-        from sol_query.analysis.call_analyzer import CallAnalyzer
-        analyzer = CallAnalyzer()
-        all_functions = self._engine._get_all_functions()
+        analyzer = self._engine._get_call_analyzer()
+        all_functions = self._engine._get_function_table().functions
 
         filtered = []
         for func in self._elements:
@@ -606,10 +715,8 @@ class FunctionCollection(BaseCollection):
         Filter functions whose call tree includes any asset transfers (deep analysis).
         This analyzes the entire call chain to find functions that may indirectly transfer assets.
         """
-        # Import here to avoid circular imports
-        from sol_query.analysis.call_analyzer import CallAnalyzer
-        analyzer = CallAnalyzer()
-        all_functions = self._engine._get_all_functions()
+        analyzer = self._engine._get_call_analyzer()
+        all_functions = self._engine._get_function_table().functions
 
         filtered = []
         for func in self._elements:
@@ -622,10 +729,8 @@ class FunctionCollection(BaseCollection):
         """
         Filter functions whose call tree does NOT include any asset transfers (deep analysis).
         """
-        # Import here to avoid circular imports
-        from sol_query.analysis.call_analyzer import CallAnalyzer
-        analyzer = CallAnalyzer()
-        all_functions = self._engine._get_all_functions()
+        analyzer = self._engine._get_call_analyzer()
+        all_functions = self._engine._get_function_table().functions
 
         filtered = []
         for func in self._elements:
@@ -636,78 +741,48 @@ class FunctionCollection(BaseCollection):
 
     def with_external_call_targets(self, targets: Union[str, List[str]]) -> "FunctionCollection":
         """Filter functions that call specific external targets."""
-        target_list = [targets] if isinstance(targets, str) else targets
+        target_set = {targets} if isinstance(targets, str) else set(targets)
         filtered = []
         for func in self._elements:
-            if any(target in func.external_call_targets for target in target_list):
+            if not target_set.isdisjoint(func.external_call_targets):
                 filtered.append(func)
         return self._create_new_collection(filtered)
 
     def with_asset_transfer_types(self, transfer_types: Union[str, List[str]]) -> "FunctionCollection":
         """Filter functions that perform specific types of asset transfers."""
-        type_list = [transfer_types] if isinstance(transfer_types, str) else transfer_types
+        type_set = {transfer_types} if isinstance(transfer_types, str) else set(transfer_types)
         filtered = []
         for func in self._elements:
-            if any(transfer_type in func.asset_transfer_types for transfer_type in type_list):
+            if not type_set.isdisjoint(func.asset_transfer_types):
                 filtered.append(func)
         return self._create_new_collection(filtered)
 
     # Source code content filtering
     def containing_source_pattern(self, pattern: Union[str, Pattern]) -> "FunctionCollection":
         """Filter functions containing specific patterns in their source code."""
-        filtered = []
-        for func in self._elements:
-            source_code = func.get_source_code()
-            if self._engine.pattern_matcher.matches_text_pattern(source_code, pattern):
-                filtered.append(func)
-        return self._create_new_collection(filtered)
+        matches = self._engine.pattern_matcher.text_pattern_matcher(pattern)
+        return self._defer(lambda func: matches(func.get_source_code()))
 
     def with_source_containing(self, text: str) -> "FunctionCollection":
         """Filter functions whose source code contains specific text."""
-        filtered = []
-        for func in self._elements:
-            source_code = func.get_source_code()
-            if text in source_code:
-                filtered.append(func)
-        return self._create_new_collection(filtered)
+        return self._defer(self._engine._get_function_source_index().containing_any([text]))
 
     # Time-related operations
+    def _with_time_flag(self, flag: TimeFlags) -> "FunctionCollection":
+        """Filter functions by a precomputed time-related flag."""
+        return self._defer(self._engine._get_time_flag_table().predicate(flag))
+
     def with_time_operations(self) -> "FunctionCollection":
         """Filter functions that contain time-related operations."""
-        time_patterns = [
-            r"block\.timestamp",
-            r"now\b",
-            r"\btimestamp\b",
-            r"\bduration\b",
-            r"\bdeadline\b",
-            r"\bexpiry\b",
-            r"\btimeout\b"
-        ]
-        filtered = []
-        for func in self._elements:
-            source_code = func.get_source_code()
-            if any(self._engine.pattern_matcher.matches_text_pattern(source_code, pattern)
-                   for pattern in time_patterns):
-                filtered.append(func)
-        return self._create_new_collection(filtered)
+        return self._with_time_flag(TimeFlags.OPERATIONS)
 
     def with_timestamp_usage(self) -> "FunctionCollection":
         """Filter functions that use block.timestamp or now."""
-        return self.containing_source_pattern(r"(block\.timestamp|now\b)")
+        return self._with_time_flag(TimeFlags.TIMESTAMP_USAGE)
 
     def with_time_arithmetic(self) -> "FunctionCollection":
         """Filter functions that perform arithmetic with time values."""
-        time_arithmetic_patterns = [
-            r"(block\.timestamp|now|timestamp|duration)\s*[+\-*/%]",
-            r"[+\-*/%]\s*(block\.timestamp|now|timestamp|duration)"
-        ]
-        filtered = []
-        for func in self._elements:
-            source_code = func.get_source_code()
-            if any(self._engine.pattern_matcher.matches_text_pattern(source_code, pattern)
-                   for pattern in time_arithmetic_patterns):
-                filtered.append(func)
-        return self._create_new_collection(filtered)
+        return self._with_time_flag(TimeFlags.ARITHMETIC)
 
     # Data flow methods
     def with_data_flow_between(self, from_variable: str, to_variable: str) -> "FunctionCollection":
@@ -769,8 +844,7 @@ class FunctionCollection(BaseCollection):
         matching_functions = analyzer.get_functions_calling_imported_symbols(patterns)
 
         # Filter current collection to only include matching functions
-        filtered = [f for f in self._elements if f in matching_functions]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: f in matching_functions)
 
     def not_calling_imported_symbols(self, import_patterns: Union[str, List[str]]) -> "FunctionCollection":
         """Filter functions that do NOT call symbols from specific imports."""
@@ -779,28 +853,31 @@ class FunctionCollection(BaseCollection):
         matching_functions = analyzer.get_functions_calling_imported_symbols(patterns)
 
         # Filter current collection to exclude matching functions
-        filtered = [f for f in self._elements if f not in matching_functions]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda f: f not in matching_functions)
 
 
 class VariableCollection(BaseCollection):
     """Collection of variable declarations with fluent query methods."""
 
+    __slots__ = ()
+
     def _create_new_collection(self, elements: List[ASTNode]) -> "VariableCollection":
         variables = [e for e in elements if isinstance(e, VariableDeclaration)]
         return VariableCollection(variables, self._engine)
 
     def with_name(self, pattern: Union[str, Pattern]) -> "VariableCollection":
         """Filter variables by name pattern."""
-        filtered = [v for v in self._elements
-                   if self._engine.pattern_matcher.matches_name_pattern(v.name, pattern)]
+        name_matches = self._engine.pattern_matcher.name_pattern_matcher(pattern)
+        filtered = [v for v in self._elements if name_matches(v.name)]
         return self._create_new_collection(filtered)
 
     def with_type(self, type_pattern: Union[str, Pattern]) -> "VariableCollection":
         """Filter variables by type pattern."""
-        filtered = [v for v in self._elements
-                   if self._engine.pattern_matcher.matches_name_pattern(v.type_name, type_pattern)]
-        return self._create_new_collection(filtered)
+        table = self._engine._get_variable_table()
+        type_matches = table.type_index.predicate(type_pattern)
+        return self._indexed_filter(lambda: table.variables,
+                                    lambda: table.of_type(type_pattern),
+                                    lambda v: type_matches(v.type_name))
 
     def with_visibility(self, visibility: Visibility) -> "VariableCollection":
         """Filter variables by visibility."""
@@ -822,62 +899,51 @@ class VariableCollection(BaseCollection):
 
     def constants(self) -> "VariableCollection":
         """Get only constant variables."""
-        filtered = [v for v in self._elements if v.is_constant]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: v.is_constant)
 
     def immutable(self) -> "VariableCollection":
         """Get only immutable variables."""
-        filtered = [v for v in self._elements if v.is_immutable]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: v.is_immutable)
 
     def state_variables(self) -> "VariableCollection":
         """Get only state variables."""
-        filtered = [v for v in self._elements if v.is_state_variable()]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: v.is_state_variable())
 
     # Negation filters for visibility
     def not_public(self) -> "VariableCollection":
         """Get variables that are NOT public."""
-        filtered = [v for v in self._elements if v.visibility != Visibility.PUBLIC]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: v.visibility != Visibility.PUBLIC)
 
     def not_private(self) -> "VariableCollection":
         """Get variables that are NOT private."""
-        filtered = [v for v in self._elements if v.visibility != Visibility.PRIVATE]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: v.visibility != Visibility.PRIVATE)
 
     def not_internal(self) -> "VariableCollection":
         """Get variables that are NOT internal."""
-        filtered = [v for v in self._elements if v.visibility != Visibility.INTERNAL]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: v.visibility != Visibility.INTERNAL)
 
     # Negation filters for special variable types
     def not_constants(self) -> "VariableCollection":
         """Get variables that are NOT constants."""
-        filtered = [v for v in self._elements if not v.is_constant]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: not v.is_constant)
 
     def not_immutable(self) -> "VariableCollection":
         """Get variables that are NOT immutable."""
-        filtered = [v for v in self._elements if not v.is_immutable]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: not v.is_immutable)
 
     def not_state_variables(self) -> "VariableCollection":
         """Get variables that are NOT state variables."""
-        filtered = [v for v in self._elements if not v.is_state_variable()]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: not v.is_state_variable())
 
     # Generic negation filters
     def not_with_visibility(self, visibility: Visibility) -> "VariableCollection":
         """Filter variables that do NOT have the specified visibility."""
-        filtered = [v for v in self._elements if v.visibility != visibility]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda v: v.visibility != visibility)
 
     def not_with_type(self, type_pattern: Union[str, Pattern]) -> "VariableCollection":
         """Filter variables that do NOT match the type pattern."""
-        filtered = [v for v in self._elements
-                   if not self._engine.pattern_matcher.matches_name_pattern(v.type_name, type_pattern)]
-        return self._create_new_collection(filtered)
+        type_matches = self._engine._get_variable_table().type_index.predicate(type_pattern)
+        return self._defer(lambda v: not type_matches(v.type_name))
 
     def get_parent_contract(self, variable: VariableDeclaration) -> Optional[ContractDeclaration]:
         """Get the parent contract of a variable."""
@@ -885,74 +951,75 @@ class VariableCollection(BaseCollection):
 
     def from_contract(self, contract_name: str) -> "VariableCollection":
         """Filter variables from a specific contract."""
-        filtered = [v for v in self._elements
-                   if v.parent_contract and v.parent_contract.name == contract_name]
-        return self._create_new_collection(filtered)
+        # Parent pointers are threaded at parse time; match them by identity
+        # against the loaded contracts of that name instead of comparing names
+        contract_ids = self._engine._get_contract_ids(contract_name)
+        if contract_ids:
+            return self._indexed_filter(
+                lambda: self._engine._get_variable_table().variables,
+                lambda: self._engine._get_variables_by_contract().get(contract_name, []),
+                lambda v: id(v.parent_contract) in contract_ids)
+        return self._defer(lambda v: v.parent_contract is not None
+                           and v.parent_contract.name == contract_name)
 
     # Time-related variables
     def time_related(self) -> "VariableCollection":
         """Filter variables that are time-related (timestamp, duration, deadline, etc.)."""
-        time_name_patterns = [
-            "*timestamp*", "*time*", "*duration*", "*deadline*",
-            "*expiry*", "*timeout*", "*delay*", "*period*"
-        ]
-        filtered = []
-        for var in self._elements:
-            if any(self._engine.pattern_matcher.matches_name_pattern(var.name, pattern)
-                   for pattern in time_name_patterns):
-                filtered.append(var)
-        return self._create_new_collection(filtered)
+        return self._defer(self._engine._get_variable_table().time_related)
 
 
 class ModifierCollection(BaseCollection):
     """Collection of modifier declarations with fluent query methods."""
 
+    __slots__ = ()
+
     def _create_new_collection(self, elements: List[ASTNode]) -> "ModifierCollection":
         modifiers = [e for e in elements if isinstance(e, ModifierDeclaration)]
         return ModifierCollection(modifiers, self._engine)
 
     def with_name(self, pattern: Union[str, Pattern]) -> "ModifierCollection":
         """Filter modifiers by name pattern."""
-        filtered = [m for m in self._elements
-                   if self._engine.pattern_matcher.matches_name_pattern(m.name, pattern)]
+        name_matches = self._engine.pattern_matcher.name_pattern_matcher(pattern)
+        filtered = [m for m in self._elements if name_matches(m.name)]
         return self._create_new_collection(filtered)
 
     def with_parameter_count(self, count: int) -> "ModifierCollection":
         """Filter modifiers by parameter count."""
-        filtered = [m for m in self._elements if len(m.parameters) == count]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda m: len(m.parameters) == count)
 
 
 class EventCollection(BaseCollection):
     """Collection of event declarations with fluent query methods."""
 
+    __slots__ = ()
+
     def _create_new_collection(self, elements: List[ASTNode]) -> "EventCollection":
         events = [e for e in elements if isinstance(e, EventDeclaration)]
         return EventCollection(events, self._engine)
 
     def with_name(self, pattern: Union[str, Pattern]) -> "EventCollection":
         """Filter events by name pattern."""
-        filtered = [e for e in self._elements
-                   if self._engine.pattern_matcher.matches_name_pattern(e.name, pattern)]
+        name_matches = self._engine.pattern_matcher.name_pattern_matcher(pattern)
+        filtered = [e for e in self._elements if name_matches(e.name)]
         return self._create_new_collection(filtered)
 
     def with_parameter_count(self, count: int) -> "EventCollection":
         """Filter events by parameter count."""
-        filtered = [e for e in self._elements if len(e.parameters) == count]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda e: len(e.parameters) == count)
 
 
 class StatementCollection(BaseCollection):
     """Collection of statements with fluent query methods."""
 
+    __slots__ = ()
+
     def _create_new_collection(self, elements: List[ASTNode]) -> "StatementCollection":
         statements = [e for e in elements if isinstance(e, Statement)]
         return StatementCollection(statements, self._engine)
 
     def with_type(self, statement_type: str) -> "StatementCollection":
         """Filter statements by type."""
-        filtered = [s for s in self._elements if s.node_type.value == statement_type]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda s: s.node_type.value == statement_type)
 
     def returns(self) -> "StatementCollection":
         """Get only return statements."""
@@ -965,12 +1032,8 @@ class StatementCollection(BaseCollection):
     # Source code content filtering
     def containing_source_pattern(self, pattern: Union[str, Pattern]) -> "StatementCollection":
         """Filter statements containing specific patterns in their source code."""
-        filtered = []
-        for stmt in self._elements:
-            source_code = stmt.get_source_code()
-            if self._engine.pattern_matcher.matches_text_pattern(source_code, pattern):
-                filtered.append(stmt)
-        return self._create_new_collection(filtered)
+        matches = self._engine.pattern_matcher.text_pattern_matcher(pattern)
+        return self._defer(lambda stmt: matches(stmt.get_source_code()))
 
     def with_source_containing(self, text: str) -> "StatementCollection":
         """Filter statements whose source code contains specific text."""
@@ -1111,14 +1174,15 @@ class StatementCollection(BaseCollection):
 class ExpressionCollection(BaseCollection):
     """Collection of expressions with fluent query methods."""
 
+    __slots__ = ()
+
     def _create_new_collection(self, elements: List[ASTNode]) -> "ExpressionCollection":
         expressions = [e for e in elements if isinstance(e, Expression)]
         return ExpressionCollection(expressions, self._engine)
 
     def with_type(self, expression_type: str) -> "ExpressionCollection":
         """Filter expressions by type."""
-        filtered = [e for e in self._elements if e.node_type.value == expression_type]
-        return self._create_new_collection(filtered)
+        return self._defer(lambda e: e.node_type.value == expression_type)
 
     def calls(self) -> "ExpressionCollection":
         """Get only call expressions."""
@@ -1235,12 +1299,8 @@ class ExpressionCollection(BaseCollection):
     # Source code content filtering
     def containing_source_pattern(self, pattern: Union[str, Pattern]) -> "ExpressionCollection":
         """Filter expressions containing specific patterns in their source code."""
-        filtered = []
-        for expr in self._elements:
-            source_code = expr.get_source_code()
-            if self._engine.pattern_matcher.matches_text_pattern(source_code, pattern):
-                filtered.append(expr)
-        return self._create_new_collection(filtered)
+        matches = self._engine.pattern_matcher.text_pattern_matcher(pattern)
+        return self._defer(lambda expr: matches(expr.get_source_code()))
 
     def with_source_containing(self, text: str) -> "ExpressionCollection":
         """Filter expressions whose source code contains specific text."""
@@ -1254,24 +1314,30 @@ class ExpressionCollection(BaseCollection):
     # Operator-specific filtering
     def with_operator(self, operators: Union[str, List[str]]) -> "ExpressionCollection":
         """Filter expressions by specific operators (for binary expressions)."""
-        op_list = [operators] if isinstance(operators, str) else operators
-        filtered = []
-        for expr in self._elements:
-            if (hasattr(expr, 'operator') and expr.operator in op_list):
-                filtered.append(expr)
-        return self._create_new_collection(filtered)
+        wanted = frozenset([operators] if isinstance(operators, str) else operators)
+        return self._defer(lambda expr: getattr(expr, 'operator', None) in wanted)
+
+    def with_operator_category(self, category: OperatorCategory) -> "ExpressionCollection":
+        """Filter expressions whose operator falls in any of the given categories."""
+        mask = int(category)
+        categories = OPERATOR_CATEGORIES
+        return self._defer(lambda expr: categories.get(getattr(expr, 'operator', None), 0) & mask != 0)
 
     def with_arithmetic_operators(self) -> "ExpressionCollection":
         """Filter expressions with arithmetic operators (+, -, *, /, %, **)."""
-        return self.with_operator(["+", "-", "*", "/", "%", "**"])
+        return self.with_operator_category(OperatorCategory.ARITHMETIC)
 
     def with_comparison_operators(self) -> "ExpressionCollection":
         """Filter expressions with comparison operators (==, !=, <, >, <=, >=)."""
-        return self.with_operator(["==", "!=", "<", ">", "<=", ">="])
+        return self.with_operator_category(OperatorCategory.COMPARISON)
 
     def with_logical_operators(self) -> "ExpressionCollection":
         """Filter expressions with logical operators (&&, ||, !)."""
-        return self.with_operator(["&&", "||", "!"])
+        return self.with_operator_category(OperatorCategory.LOGICAL)
+
+    def with_bitwise_operators(self) -> "ExpressionCollection":
+        """Filter expressions with bitwise operators (&, |, ^, ~, <<, >>)."""
+        return self.with_operator_category(OperatorCategory.BITWISE)
 
     # Literal value filtering
     def with_value(self, value: Union[str, int, float]) -> "ExpressionCollection":
@@ -1,8 +1,13 @@
 """Unified query engine supporting both traditional and fluent query styles."""
 
 import re
+import stat
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Pattern, Callable, Type, TYPE_CHECKING
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, Pattern, Callable, Type, TYPE_CHECKING
+)
 
 from sol_query.core.source_manager import SourceManager
 from sol_query.core.ast_nodes import (
@@ -11,9 +16,13 @@ from sol_query.core.ast_nodes import (
     EnumDeclaration, Statement, Expression, Visibility, StateMutability
 )
 from sol_query.query.collections import (
-    ContractCollection, FunctionCollection, VariableCollection,
+    BaseCollection, ContractCollection, FunctionCollection, VariableCollection,
     ModifierCollection, EventCollection, StatementCollection, ExpressionCollection
 )
+from sol_query.query.indexes import (
+    FunctionTable, NameIndex, SourceKeywordIndex, TimeFlags, TimeFlagTable, VariableTable,
+    group_by_name, group_by_parent_contract
+)
 from sol_query.utils.pattern_matching import PatternMatcher
 from sol_query.analysis.call_types import CallType
 
@@ -44,6 +53,10 @@ class SolidityQueryEngine:
         self.source_manager = SourceManager()
         self.pattern_matcher = PatternMatcher()
 
+        # Derived indexes over the loaded ASTs, rebuilt when sources change
+        self._index_cache: Dict[str, Any] = {}
+        self._index_generation = -1
+
         # Load initial sources if provided
         if source_paths:
             self.load_sources(source_paths)
@@ -58,12 +71,21 @@ class SolidityQueryEngine:
         if isinstance(source_paths, (str, Path)):
             source_paths = [source_paths]
 
+        # Consecutive files are parsed as one parallel batch, keeping load order
+        pending_files = []
         for source_path in source_paths:
             path = Path(source_path)
-            if path.is_file():
-                self.source_manager.add_file(path)
-            elif path.is_dir():
+            try:
+                mode = path.stat().st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode):
+                pending_files.append(path)
+            elif stat.S_ISDIR(mode):
+                self.source_manager.add_files(pending_files)
+                pending_files = []
                 self.source_manager.add_directory(path, recursive=True)
+        self.source_manager.add_files(pending_files)
 
     # Traditional finder methods
     def find_contracts(self,
@@ -252,6 +274,16 @@ class SolidityQueryEngine:
         Returns:
             List of matching statements
         """
+        if contract_name is None and function_name is None and statement_types:
+            type_list = [statement_types] if isinstance(statement_types, str) else statement_types
+            if len(type_list) == 1:
+                # Single kind: serve straight from the cached per-kind bucket
+                statements = list(self._get_statement_index()[1].get(type_list[0], []))
+                return self._filter_statements(statements, None, **filters)
+            # Several kinds: one pass over the cached walk, in source order
+            wanted = frozenset(type_list)
+            statements = [s for s in self._get_statement_index()[0] if s.node_type.value in wanted]
+            return self._filter_statements(statements, None, **filters)
         statements = self._get_all_statements(contract_name, function_name)
         return self._filter_statements(statements, statement_types, **filters)
 
@@ -272,9 +304,46 @@ class SolidityQueryEngine:
         Returns:
             List of matching expressions
         """
+        if (contract_name is None and function_name is None and expression_types
+                and (isinstance(expression_types, str) or len(expression_types) == 1)):
+            expression_type = expression_types if isinstance(expression_types, str) else expression_types[0]
+            expressions = self._get_expressions_of_type(expression_type)
+            return self._filter_expressions(expressions, None, **filters)
         expressions = self._get_all_expressions(contract_name, function_name)
         return self._filter_expressions(expressions, expression_types, **filters)
 
+    def iter_expressions(self,
+                         expression_types: Optional[Union[str, List[str]]] = None,
+                         contract_name: Optional[str] = None,
+                         function_name: Optional[str] = None) -> Iterator[Expression]:
+        """
+        Iterate expressions lazily, in the same order as find_expressions().
+
+        Unscoped iteration walks the engine's cached expression index without
+        copying it, so taking only the first few expressions costs nothing
+        for the rest.
+
+        Args:
+            expression_types: Types of expressions to yield
+            contract_name: Name of contract to search in
+            function_name: Name of function to search in
+
+        Returns:
+            Iterator over matching expressions
+        """
+        if contract_name is None and function_name is None:
+            expressions = self._get_expression_index()[0]
+        else:
+            expressions = self._get_all_expressions(contract_name, function_name)
+        if not expression_types:
+            return iter(expressions)
+        type_list = [expression_types] if isinstance(expression_types, str) else expression_types
+        return (e for e in expressions if e.node_type.value in type_list)
+
+    def count_expressions(self) -> int:
+        """Get the number of unique expressions in all loaded functions."""
+        return len(self._get_expression_index()[0])
+
     def find_calls(self,
                   target_patterns: Optional[Union[str, List[str], Pattern]] = None,
                   contract_name: Optional[str] = None,
@@ -292,9 +361,7 @@ class SolidityQueryEngine:
         Returns:
             List of matching call expressions
         """
-        expressions = self._get_all_expressions(contract_name, function_name)
-        calls = [e for e in expressions if hasattr(e, 'node_type') and
-                e.node_type.value == "call_expression"]
+        calls = self._get_expressions_of_type("call_expression", contract_name, function_name)
         return self._filter_calls(calls, target_patterns, **filters)
 
     def find_literals(self,
@@ -314,9 +381,7 @@ class SolidityQueryEngine:
         Returns:
             List of matching literals
         """
-        expressions = self._get_all_expressions(contract_name, function_name)
-        literals = [e for e in expressions if hasattr(e, 'node_type') and
-                   e.node_type.value == "literal"]
+        literals = self._get_expressions_of_type("literal", contract_name, function_name)
         return self._filter_literals(literals, literal_types, **filters)
 
     def find_identifiers(self,
@@ -336,9 +401,7 @@ class SolidityQueryEngine:
         Returns:
             List of matching identifiers
         """
-        expressions = self._get_all_expressions(contract_name, function_name)
-        identifiers = [e for e in expressions if hasattr(e, 'node_type') and
-                      e.node_type.value == "identifier"]
+        identifiers = self._get_expressions_of_type("identifier", contract_name, function_name)
         return self._filter_identifiers(identifiers, name_patterns, **filters)
 
     # Statement-specific finders
@@ -365,8 +428,7 @@ class SolidityQueryEngine:
             type_list = [loop_types] if isinstance(loop_types, str) else loop_types
             loop_types_set = {f"{t}_statement" for t in type_list}
 
-        loops = [s for s in statements if hasattr(s, 'node_type') and
-                s.node_type.value in loop_types_set]
+        loops = [s for s in statements if s.node_type.value in loop_types_set]
         return self._filter_statements(loops, None, **filters)
 
     def find_conditionals(self,
@@ -385,8 +447,7 @@ class SolidityQueryEngine:
             List of matching conditional statements
         """
         statements = self._get_all_statements(contract_name, function_name)
-        conditionals = [s for s in statements if hasattr(s, 'node_type') and
-                       s.node_type.value == "if_statement"]
+        conditionals = [s for s in statements if s.node_type.value == "if_statement"]
         return self._filter_statements(conditionals, None, **filters)
 
     def find_assignments(self,
@@ -405,8 +466,8 @@ class SolidityQueryEngine:
             List of matching assignment statements
         """
         statements = self._get_all_statements(contract_name, function_name)
-        assignments = [s for s in statements if hasattr(s, 'node_type') and
-                      s.node_type.value in {"assignment_statement", "expression_statement"}]
+        assignments = [s for s in statements
+                       if s.node_type.value in {"assignment_statement", "expression_statement"}]
         return self._filter_statements(assignments, None, **filters)
 
     def find_returns(self,
@@ -425,8 +486,7 @@ class SolidityQueryEngine:
             List of matching return statements
         """
         statements = self._get_all_statements(contract_name, function_name)
-        returns = [s for s in statements if hasattr(s, 'node_type') and
-                  s.node_type.value == "return_statement"]
+        returns = [s for s in statements if s.node_type.value == "return_statement"]
         return self._filter_statements(returns, None, **filters)
 
     def find_requires(self,
@@ -448,7 +508,7 @@ class SolidityQueryEngine:
         expressions = self._get_all_expressions(contract_name, function_name)
         requires = []
         for expr in expressions:
-            if (hasattr(expr, 'node_type') and expr.node_type.value == "call_expression" and
+            if (expr.node_type.value == "call_expression" and
                 hasattr(expr, 'function') and hasattr(expr.function, 'name') and
                 expr.function.name == "require"):
                 requires.append(expr)
@@ -470,8 +530,7 @@ class SolidityQueryEngine:
             List of matching emit statements
         """
         statements = self._get_all_statements(contract_name, function_name)
-        emits = [s for s in statements if hasattr(s, 'node_type') and
-                s.node_type.value == "emit_statement"]
+        emits = [s for s in statements if s.node_type.value == "emit_statement"]
         return self._filter_statements(emits, None, **filters)
 
     # Expression-specific finders
@@ -493,8 +552,7 @@ class SolidityQueryEngine:
             List of matching binary expressions
         """
         expressions = self._get_all_expressions(contract_name, function_name)
-        binary_ops = [e for e in expressions if hasattr(e, 'node_type') and
-                     e.node_type.value == "binary_expression"]
+        binary_ops = [e for e in expressions if e.node_type.value == "binary_expression"]
 
         if operators:
             op_list = [operators] if isinstance(operators, str) else operators
@@ -521,8 +579,7 @@ class SolidityQueryEngine:
             List of matching unary expressions
         """
         expressions = self._get_all_expressions(contract_name, function_name)
-        unary_ops = [e for e in expressions if hasattr(e, 'node_type') and
-                    e.node_type.value == "unary_expression"]
+        unary_ops = [e for e in expressions if e.node_type.value == "unary_expression"]
 
         if operators:
             op_list = [operators] if isinstance(operators, str) else operators
@@ -617,11 +674,8 @@ class SolidityQueryEngine:
             List of matching functions
         """
         functions = self._get_all_functions(contract_name)
-        filtered = []
-        for func in functions:
-            source_code = func.get_source_code()
-            if self.pattern_matcher.matches_text_pattern(source_code, pattern):
-                filtered.append(func)
+        matches = self.pattern_matcher.text_pattern_matcher(pattern)
+        filtered = [func for func in functions if matches(func.get_source_code())]
         return self._filter_functions(filtered, None, None, None, None, contract_name, **filters)
 
     def find_functions_with_time_operations(self,
@@ -637,22 +691,9 @@ class SolidityQueryEngine:
         Returns:
             List of matching functions
         """
-        time_patterns = [
-            r"block\.timestamp",
-            r"now\b",
-            r"\btimestamp\b",
-            r"\bduration\b",
-            r"\bdeadline\b",
-            r"\bexpiry\b",
-            r"\btimeout\b"
-        ]
         functions = self._get_all_functions(contract_name)
-        filtered = []
-        for func in functions:
-            source_code = func.get_source_code()
-            if any(self.pattern_matcher.matches_text_pattern(source_code, pattern)
-                   for pattern in time_patterns):
-                filtered.append(func)
+        has_time_operations = self._get_time_flag_table().predicate(TimeFlags.OPERATIONS)
+        filtered = [func for func in functions if has_time_operations(func)]
         return self._filter_functions(filtered, None, None, None, None, contract_name, **filters)
 
     def find_variables_time_related(self,
@@ -669,15 +710,8 @@ class SolidityQueryEngine:
             List of matching variables
         """
         variables = self._get_all_variables(contract_name)
-        time_name_patterns = [
-            "*timestamp*", "*time*", "*duration*", "*deadline*",
-            "*expiry*", "*timeout*", "*delay*", "*period*"
-        ]
-        filtered = []
-        for var in variables:
-            if any(self.pattern_matcher.matches_name_pattern(var.name, pattern)
-                   for pattern in time_name_patterns):
-                filtered.append(var)
+        time_related = self._get_variable_table().time_related
+        filtered = [var for var in variables if time_related(var)]
         return self._filter_variables(filtered, None, None, None, **filters)
 
     def find_statements_with_source_pattern(self,
@@ -727,8 +761,7 @@ class SolidityQueryEngine:
             ...           .with_name_pattern("*Token*")
             ...           .with_inheritance(["ERC20", "Ownable"]))
         """
-        contracts = self.source_manager.get_contracts()
-        return ContractCollection(contracts, self)
+        return ContractCollection(self._get_contract_list(), self)
 
     @property
     def functions(self) -> FunctionCollection:
@@ -756,14 +789,12 @@ class SolidityQueryEngine:
             ...          .view()
             ...          .public_or_external())
         """
-        functions = self._get_all_functions()
-        return FunctionCollection(functions, self)
+        return FunctionCollection(self._get_function_table().functions, self)
 
     @property
     def variables(self) -> VariableCollection:
         """Entry point for fluent variable queries."""
-        variables = self._get_all_variables()
-        return VariableCollection(variables, self)
+        return VariableCollection(self._get_variable_table().variables, self)
 
     @property
     def modifiers(self) -> ModifierCollection:
@@ -921,7 +952,7 @@ class SolidityQueryEngine:
         for stmt in function_statements:
             expressions = self._extract_expressions_from_statement(stmt)
             for expr in expressions:
-                if hasattr(expr, 'node_type') and expr.node_type.value == "call_expression":
+                if expr.node_type.value == "call_expression":
                     function_calls.append(expr)
 
         # Find the functions being called
@@ -1116,22 +1147,29 @@ class SolidityQueryEngine:
         """
         stats = self.source_manager.get_statistics()
 
-        # Add element counts
-        contracts = self.source_manager.get_contracts()
-        total_functions = sum(len(c.functions) for c in contracts)
-        total_modifiers = sum(len(c.modifiers) for c in contracts)
-        total_events = sum(len(c.events) for c in contracts)
-        total_variables = sum(len(c.variables) for c in contracts)
+        # Add element counts; computed once per source generation
+        element_counts = self._get_cached_index("element_counts", self._count_elements)
+        stats.update(element_counts)
+        stats["contracts_by_type"] = dict(element_counts["contracts_by_type"])
+
+        return stats
 
-        stats.update({
+    def _count_elements(self) -> Dict[str, Any]:
+        """Count the loaded contract members and contract kinds in one pass."""
+        total_functions = total_modifiers = total_events = total_variables = 0
+        for contract in self._get_contract_list():
+            total_functions += len(contract.functions)
+            total_modifiers += len(contract.modifiers)
+            total_events += len(contract.events)
+            total_variables += len(contract.variables)
+
+        return {
             "total_functions": total_functions,
             "total_modifiers": total_modifiers,
             "total_events": total_events,
             "total_state_variables": total_variables,
             "contracts_by_type": self._get_contract_type_counts()
-        })
-
-        return stats
+        }
 
     def get_contract_names(self) -> List[str]:
         """
@@ -1216,6 +1254,14 @@ class SolidityQueryEngine:
         if hasattr(node, 'parent_function') and node.parent_function:
             return node.parent_function.name
 
+        # Statements and expressions record their function during the cached walk
+        node_id = id(node)
+        function = self._get_statement_index()[3].get(node_id)
+        if function is None:
+            function = self._get_expression_index()[2].get(node_id)
+        if function is not None:
+            return function.name
+
         # Simple heuristic: check if the node's source location is within a function's range
         # This is a basic implementation - a full implementation would traverse the AST
         if hasattr(node, 'source_location') and node.source_location:
@@ -1270,7 +1316,7 @@ class SolidityQueryEngine:
             node_type = filters['node_type']
             node_types = [node_type] if isinstance(node_type, str) else node_type
             result = [item for item in result
-                     if hasattr(item, 'node_type') and item.node_type.value in node_types]
+                     if item.node_type.value in node_types]
 
         return result
 
@@ -1283,8 +1329,8 @@ class SolidityQueryEngine:
         result = contracts
 
         if name_patterns:
-            result = [c for c in result
-                     if self.pattern_matcher.matches_name_pattern(c.name, name_patterns)]
+            name_matches = self.pattern_matcher.name_pattern_matcher(name_patterns)
+            result = [c for c in result if name_matches(c.name)]
 
         if inheritance:
             inheritance_list = [inheritance] if isinstance(inheritance, str) else inheritance
@@ -1313,8 +1359,8 @@ class SolidityQueryEngine:
         result = functions
 
         if name_patterns:
-            result = [f for f in result
-                     if self.pattern_matcher.matches_name_pattern(f.name, name_patterns)]
+            name_matches = self._get_function_name_index().predicate(name_patterns)
+            result = [f for f in result if name_matches(f.name)]
 
         if visibility:
             visibility_list = [visibility] if isinstance(visibility, Visibility) else visibility
@@ -1326,9 +1372,8 @@ class SolidityQueryEngine:
             result = [f for f in result if f.state_mutability in mutability_list]
 
         if modifiers:
-            modifier_list = [modifiers] if isinstance(modifiers, str) else modifiers
-            result = [f for f in result
-                     if any(mod in f.modifiers for mod in modifier_list)]
+            wanted = {modifiers} if isinstance(modifiers, str) else set(modifiers)
+            result = [f for f in result if not wanted.isdisjoint(f.modifiers)]
 
         # Filter by external calls (shallow)
         if with_external_calls is not None:
@@ -1340,10 +1385,8 @@ class SolidityQueryEngine:
 
         # Filter by external calls (deep)
         if with_external_calls_deep is not None and not (with_external_calls is True and with_external_calls_deep is False):
-             # Import here to avoid circular imports
-             from sol_query.analysis.call_analyzer import CallAnalyzer
-             analyzer = CallAnalyzer()
-             all_functions = self._get_all_functions()
+             analyzer = self._get_call_analyzer()
+             all_functions = self._get_function_table().functions
              filtered = []
              for func in result:
                  has_deep_external_calls = analyzer.analyze_call_tree_external_calls(func, all_functions)
@@ -1355,10 +1398,8 @@ class SolidityQueryEngine:
         # This should return functions that have direct external calls but NOT deep external calls
         # (i.e., functions that only have direct external calls, not through their call tree)
         if (with_external_calls is True and with_external_calls_deep is False):
-            # Import here to avoid circular imports
-            from sol_query.analysis.call_analyzer import CallAnalyzer
-            analyzer = CallAnalyzer()
-            all_functions = self._get_all_functions()
+            analyzer = self._get_call_analyzer()
+            all_functions = self._get_function_table().functions
             filtered = []
             for func in result:
                 # Function must have direct external calls
@@ -1371,10 +1412,8 @@ class SolidityQueryEngine:
 
         # Filter by asset transfers (deep)
         if with_asset_transfers_deep is not None:
-            # Import here to avoid circular imports
-            from sol_query.analysis.call_analyzer import CallAnalyzer
-            analyzer = CallAnalyzer()
-            all_functions = self._get_all_functions()
+            analyzer = self._get_call_analyzer()
+            all_functions = self._get_function_table().functions
             filtered = []
             for func in result:
                 has_deep_asset_transfers = analyzer.analyze_call_tree_asset_transfers(func, all_functions)
@@ -1396,12 +1435,12 @@ class SolidityQueryEngine:
         result = variables
 
         if name_patterns:
-            result = [v for v in result
-                     if self.pattern_matcher.matches_name_pattern(v.name, name_patterns)]
+            name_matches = self.pattern_matcher.name_pattern_matcher(name_patterns)
+            result = [v for v in result if name_matches(v.name)]
 
         if type_patterns:
-            result = [v for v in result
-                     if self.pattern_matcher.matches_name_pattern(v.type_name, type_patterns)]
+            type_matches = self._get_variable_table().type_index.predicate(type_patterns)
+            result = [v for v in result if type_matches(v.type_name)]
 
         if visibility:
             visibility_list = [visibility] if isinstance(visibility, Visibility) else visibility
@@ -1420,8 +1459,8 @@ class SolidityQueryEngine:
         result = modifiers
 
         if name_patterns:
-            result = [m for m in result
-                     if self.pattern_matcher.matches_name_pattern(m.name, name_patterns)]
+            name_matches = self.pattern_matcher.name_pattern_matcher(name_patterns)
+            result = [m for m in result if name_matches(m.name)]
 
         # Apply generic filters
         result = self._apply_generic_filters(result, **filters)
@@ -1435,8 +1474,8 @@ class SolidityQueryEngine:
         result = events
 
         if name_patterns:
-            result = [e for e in result
-                     if self.pattern_matcher.matches_name_pattern(e.name, name_patterns)]
+            name_matches = self.pattern_matcher.name_pattern_matcher(name_patterns)
+            result = [e for e in result if name_matches(e.name)]
 
         # Apply generic filters
         result = self._apply_generic_filters(result, **filters)
@@ -1445,14 +1484,13 @@ class SolidityQueryEngine:
 
     def _get_contract_type_counts(self) -> Dict[str, int]:
         """Get counts of contracts by type."""
-        contracts = self.source_manager.get_contracts()
         counts = {"contract": 0, "interface": 0, "library": 0, "abstract": 0}
 
-        for contract in contracts:
-            if contract.kind in counts:
-                counts[contract.kind] += 1
+        for kind, count in Counter(c.kind for c in self._get_contract_list()).items():
+            if kind in counts:
+                counts[kind] += count
             else:
-                counts["contract"] += 1  # Default to contract
+                counts["contract"] += count  # Default to contract
 
         return counts
 
@@ -1490,9 +1528,147 @@ class SolidityQueryEngine:
 
         return errors
 
+    def _get_cached_index(self, key: str, builder: Callable[[], Any]) -> Any:
+        """Return a derived index, rebuilding all indexes if the loaded sources changed."""
+        generation = self.source_manager.generation
+        if self._index_generation != generation:
+            self._index_cache.clear()
+            self._index_generation = generation
+        if key not in self._index_cache:
+            self._index_cache[key] = builder()
+        return self._index_cache[key]
+
+    def _get_contract_list(self) -> List[ContractDeclaration]:
+        """Get all loaded contracts; the shared list must not be mutated."""
+        return self._get_cached_index("contracts", self.source_manager.get_contracts)
+
+    def _get_contracts_by_name(self) -> Dict[str, List[ContractDeclaration]]:
+        """Get all loaded contracts grouped by name."""
+        return self._get_cached_index(
+            "contracts_by_name", lambda: group_by_name(self._get_contract_list()))
+
+    def _get_functions_by_contract(self) -> Dict[str, List[FunctionDeclaration]]:
+        """Get all loaded functions grouped by the name of their parent contract."""
+        return self._get_cached_index(
+            "functions_by_contract",
+            lambda: group_by_parent_contract(self._get_function_table().functions))
+
+    def _get_variables_by_contract(self) -> Dict[str, List[VariableDeclaration]]:
+        """Get all loaded variables grouped by the name of their parent contract."""
+        return self._get_cached_index(
+            "variables_by_contract",
+            lambda: group_by_parent_contract(self._get_variable_table().variables))
+
+    def _get_functions_by_name(self) -> Dict[str, List[FunctionDeclaration]]:
+        """Get all loaded functions grouped by name."""
+        return self._get_cached_index(
+            "functions_by_name", lambda: group_by_name(self._get_function_table().functions))
+
+    def _get_contract_ids(self, contract_name: str) -> Set[int]:
+        """Get the identities of the loaded contracts with the given name."""
+        return {id(c) for c in self._get_contracts_by_name().get(contract_name, [])}
+
+    def _get_function_table(self) -> FunctionTable:
+        """Get the column-oriented table of all loaded functions."""
+        return self._get_cached_index("functions", lambda: FunctionTable(self._get_all_functions()))
+
+    def _get_variable_table(self) -> VariableTable:
+        """Get the column-oriented table of all loaded variables."""
+        return self._get_cached_index(
+            "variables", lambda: VariableTable(self._get_all_variables(), self.pattern_matcher))
+
+    def _get_function_source_index(self) -> SourceKeywordIndex:
+        """Get the source keyword index over all loaded functions."""
+        return self._get_cached_index(
+            "function_sources", lambda: SourceKeywordIndex(self._get_function_table().functions))
+
+    def _get_time_flag_table(self) -> TimeFlagTable:
+        """Get the time-related classification of all loaded functions."""
+        return self._get_cached_index(
+            "time_flags", lambda: TimeFlagTable(self._get_function_table().functions))
+
+    def _get_function_name_index(self) -> NameIndex:
+        """Get the name-pattern index over all loaded function names."""
+        return self._get_cached_index(
+            "function_names",
+            lambda: NameIndex(self._get_function_table().names, self.pattern_matcher))
+
+    def _get_call_analyzer(self) -> "CallAnalyzer":
+        """
+        Get a call analyzer shared by the deep call filters, so its call graph
+        and transitive results are built once per set of loaded sources.
+        """
+        # Import here to avoid circular imports
+        from sol_query.analysis.call_analyzer import CallAnalyzer
+        return self._get_cached_index("call_analyzer", CallAnalyzer)
+
+    def _get_statement_index(self) -> Tuple[List[Statement], Dict[str, List[Statement]],
+                                            Dict[int, Set[str]], Dict[int, FunctionDeclaration]]:
+        """
+        Get all statements in source order, the same statements bucketed by node
+        type, the statement types occurring in each function (keyed by id), and
+        the function containing each statement (keyed by statement id).
+
+        Built by a single iterative walk over every function body so that the
+        statement finders share one traversal instead of each re-walking the AST.
+        """
+        def build() -> Tuple[List[Statement], Dict[str, List[Statement]],
+                             Dict[int, Set[str]], Dict[int, FunctionDeclaration]]:
+            ordered: List[Statement] = []
+            by_type: Dict[str, List[Statement]] = {}
+            kinds_by_function: Dict[int, Set[str]] = {}
+            function_by_statement: Dict[int, FunctionDeclaration] = {}
+            for function in self._get_all_functions():
+                if not function.body:
+                    continue
+                kinds: Set[str] = set()
+                kinds_by_function[id(function)] = kinds
+                stack = list(reversed(getattr(function.body, 'statements', [])))
+                while stack:
+                    stmt = stack.pop()
+                    ordered.append(stmt)
+                    function_by_statement[id(stmt)] = function
+                    kind = stmt.node_type.value
+                    kinds.add(kind)
+                    bucket = by_type.get(kind)
+                    if bucket is None:
+                        by_type[kind] = [stmt]
+                    else:
+                        bucket.append(stmt)
+                    body = getattr(stmt, 'body', None)
+                    if body:
+                        stack.extend(reversed(getattr(body, 'statements', [])))
+            return ordered, by_type, kinds_by_function, function_by_statement
+
+        return self._get_cached_index("statements", build)
+
+    def _get_function_ids_with_statements(self, statement_types: List[str]) -> Set[int]:
+        """Get the identities of functions containing any of the given statement types."""
+        wanted = set(statement_types)
+        kinds_by_function = self._get_statement_index()[2]
+        return {function_id for function_id, kinds in kinds_by_function.items()
+                if not wanted.isdisjoint(kinds)}
+
+    def collect_statements(self, statement_types: List[str]) -> Dict[str, List[Statement]]:
+        """
+        Collect statements of several kinds at once.
+
+        Args:
+            statement_types: Statement node type values to collect
+
+        Returns:
+            Dictionary mapping each requested type to its statements (in source order)
+        """
+        by_type = self._get_statement_index()[1]
+        return {statement_type: list(by_type.get(statement_type, []))
+                for statement_type in statement_types}
+
     def _get_all_statements(self, contract_name: Optional[str] = None,
                            function_name: Optional[str] = None) -> List[Statement]:
         """Get all statements, optionally filtered by contract and function."""
+        if contract_name is None and function_name is None:
+            return list(self._get_statement_index()[0])
+
         statements = []
         functions = self._get_all_functions(contract_name)
 
@@ -1503,12 +1679,52 @@ class SolidityQueryEngine:
 
         return statements
 
+    def _get_expression_index(self) -> Tuple[List[Expression], Dict[str, List[Expression]],
+                                             Dict[int, FunctionDeclaration]]:
+        """
+        Get all unique expressions in source order, the same expressions bucketed
+        by node type, and the function containing each expression (keyed by id).
+        """
+        def build() -> Tuple[List[Expression], Dict[str, List[Expression]],
+                             Dict[int, FunctionDeclaration]]:
+            statements, _, _, function_by_statement = self._get_statement_index()
+            ordered: List[Expression] = []
+            function_by_expression: Dict[int, FunctionDeclaration] = {}
+            for statement in statements:
+                function = function_by_statement[id(statement)]
+                for expr in self._extract_expressions_from_statement(statement):
+                    # The first containing statement wins, as in _collect_expressions
+                    if id(expr) not in function_by_expression:
+                        function_by_expression[id(expr)] = function
+                        ordered.append(expr)
+            by_type: Dict[str, List[Expression]] = {}
+            for expr in ordered:
+                node_type = getattr(expr, 'node_type', None)
+                if node_type is not None:
+                    by_type.setdefault(node_type.value, []).append(expr)
+            return ordered, by_type, function_by_expression
+
+        return self._get_cached_index("expressions", build)
+
+    def _get_expressions_of_type(self, expression_type: str,
+                                 contract_name: Optional[str] = None,
+                                 function_name: Optional[str] = None) -> List[Expression]:
+        """Get expressions of one node type, using the cached index when unscoped."""
+        if contract_name is None and function_name is None:
+            return list(self._get_expression_index()[1].get(expression_type, []))
+        return [e for e in self._get_all_expressions(contract_name, function_name)
+                if e.node_type.value == expression_type]
+
     def _get_all_expressions(self, contract_name: Optional[str] = None,
                             function_name: Optional[str] = None) -> List[Expression]:
         """Get all expressions, optionally filtered by contract and function."""
-        expressions = []
-        statements = self._get_all_statements(contract_name, function_name)
+        if contract_name is None and function_name is None:
+            return list(self._get_expression_index()[0])
+        return self._collect_expressions(self._get_all_statements(contract_name, function_name))
 
+    def _collect_expressions(self, statements: List[Statement]) -> List[Expression]:
+        """Extract the unique expressions of the given statements."""
+        expressions = []
         for statement in statements:
             expressions.extend(self._extract_expressions_from_statement(statement))
 
@@ -1573,8 +1789,8 @@ class SolidityQueryEngine:
         result = structs
 
         if name_patterns:
-            result = [s for s in result
-                     if self.pattern_matcher.matches_name_pattern(s.name, name_patterns)]
+            name_matches = self.pattern_matcher.name_pattern_matcher(name_patterns)
+            result = [s for s in result if name_matches(s.name)]
 
         # Apply generic filters
         result = self._apply_generic_filters(result, **filters)
@@ -1588,8 +1804,8 @@ class SolidityQueryEngine:
         result = enums
 
         if name_patterns:
-            result = [e for e in result
-                     if self.pattern_matcher.matches_name_pattern(e.name, name_patterns)]
+            name_matches = self.pattern_matcher.name_pattern_matcher(name_patterns)
+            result = [e for e in result if name_matches(e.name)]
 
         # Apply generic filters
         result = self._apply_generic_filters(result, **filters)
@@ -1603,8 +1819,8 @@ class SolidityQueryEngine:
         result = errors
 
         if name_patterns:
-            result = [e for e in result
-                     if self.pattern_matcher.matches_name_pattern(e.name, name_patterns)]
+            name_matches = self.pattern_matcher.name_pattern_matcher(name_patterns)
+            result = [e for e in result if name_matches(e.name)]
 
         # Apply generic filters
         result = self._apply_generic_filters(result, **filters)
@@ -1620,7 +1836,7 @@ class SolidityQueryEngine:
         if statement_types:
             type_list = [statement_types] if isinstance(statement_types, str) else statement_types
             result = [s for s in result
-                     if hasattr(s, 'node_type') and s.node_type.value in type_list]
+                     if s.node_type.value in type_list]
 
         # Apply generic filters
         result = self._apply_generic_filters(result, **filters)
@@ -1636,7 +1852,7 @@ class SolidityQueryEngine:
         if expression_types:
             type_list = [expression_types] if isinstance(expression_types, str) else expression_types
             result = [e for e in result
-                     if hasattr(e, 'node_type') and e.node_type.value in type_list]
+                     if e.node_type.value in type_list]
 
         # Apply generic filters
         result = self._apply_generic_filters(result, **filters)
@@ -1732,39 +1948,14 @@ class SolidityQueryEngine:
         if not element_sets:
             return []
 
-        # Convert all sets to lists of elements with IDs for comparison
-        element_lists = []
-        for element_set in element_sets:
-            elements = []
-            if hasattr(element_set, 'list'):
-                # Collection object
-                elements = element_set.list()
-            elif isinstance(element_set, (list, tuple)):
-                elements = list(element_set)
-            else:
-                elements = [element_set]
-            element_lists.append(elements)
-
-        if not element_lists:
-            return []
+        element_lists = [self._as_element_list(element_set) for element_set in element_sets]
 
-        # Find intersection by comparing element IDs
-        result = []
+        # Compare by integer node identity; build each id set only once
+        other_id_sets = [{id(elem) for elem in other_list} for other_list in element_lists[1:]]
         first_set_ids = {id(elem): elem for elem in element_lists[0]}
 
-        for element_id, element in first_set_ids.items():
-            # Check if this element is in all other sets
-            in_all_sets = True
-            for other_list in element_lists[1:]:
-                other_ids = {id(elem) for elem in other_list}
-                if element_id not in other_ids:
-                    in_all_sets = False
-                    break
-
-            if in_all_sets:
-                result.append(element)
-
-        return result
+        return [element for element_id, element in first_set_ids.items()
+                if all(element_id in other_ids for other_ids in other_id_sets)]
 
     def union(self, *element_sets) -> List[ASTNode]:
         r"""
@@ -1797,27 +1988,12 @@ class SolidityQueryEngine:
         if not element_sets:
             return []
 
-        result_list = []
-        seen_ids = set()
+        # One pass over all sets; dict keeps first occurrences in order (by id for uniqueness)
+        unique: Dict[int, ASTNode] = {}
+        for element in chain.from_iterable(map(self._iter_elements, element_sets)):
+            unique.setdefault(id(element), element)
 
-        for element_set in element_sets:
-            elements = []
-            if hasattr(element_set, 'list'):
-                # Collection object
-                elements = element_set.list()
-            elif isinstance(element_set, (list, tuple)):
-                elements = list(element_set)
-            else:
-                elements = [element_set]
-
-            # Add elements that haven't been seen yet (using id for uniqueness)
-            for element in elements:
-                element_id = id(element)
-                if element_id not in seen_ids:
-                    seen_ids.add(element_id)
-                    result_list.append(element)
-
-        return result_list
+        return list(unique.values())
 
     def difference(self, base_set, subtract_set) -> List[ASTNode]:
         """
@@ -1845,33 +2021,28 @@ class SolidityQueryEngine:
             >>> with_guards = engine.find_functions(modifiers=["nonReentrant", "onlyOwner"])
             >>> unprotected = engine.difference(all_external, with_guards)
         """
-        # Convert to lists
-        base_elements = []
-        if hasattr(base_set, 'list'):
-            base_elements = base_set.list()
-        elif isinstance(base_set, (list, tuple)):
-            base_elements = list(base_set)
-        else:
-            base_elements = [base_set]
-
-        subtract_elements = []
-        if hasattr(subtract_set, 'list'):
-            subtract_elements = subtract_set.list()
-        elif isinstance(subtract_set, (list, tuple)):
-            subtract_elements = list(subtract_set)
-        else:
-            subtract_elements = [subtract_set]
-
         # Create set of IDs to subtract
-        subtract_ids = {id(elem) for elem in subtract_elements}
+        subtract_ids = {id(elem) for elem in self._as_element_list(subtract_set)}
 
         # Return elements from base that are not in subtract
-        result = []
-        for elem in base_elements:
-            if id(elem) not in subtract_ids:
-                result.append(elem)
-
-        return result
+        return [elem for elem in self._as_element_list(base_set) if id(elem) not in subtract_ids]
+
+    def _iter_elements(self, element_set: Any) -> Iterable[ASTNode]:
+        """Iterate a collection, list/tuple or single element without materializing lazy collections."""
+        if isinstance(element_set, BaseCollection):
+            return element_set._iter_lazy()
+        return self._as_element_list(element_set)
+
+    def _as_element_list(self, element_set: Any) -> List[ASTNode]:
+        """Normalize a collection, list/tuple or single element to a list of elements."""
+        if hasattr(element_set, 'list'):
+            # Collection object
+            return element_set._elements if isinstance(element_set, BaseCollection) else element_set.list()
+        if isinstance(element_set, list):
+            return element_set
+        if isinstance(element_set, tuple):
+            return list(element_set)
+        return [element_set]
 
     def filter_elements(self, elements, **filter_conditions) -> List[ASTNode]:
         """
@@ -1986,7 +2157,7 @@ class SolidityQueryEngine:
         # If pattern is a string, match by node type
         if isinstance(pattern, str):
             for node in all_nodes:
-                if hasattr(node, 'node_type') and node.node_type.value == pattern:
+                if node.node_type.value == pattern:
                     matching_nodes.append(node)
 
         return matching_nodes
@@ -4,11 +4,13 @@ SolidityQueryEngineV2: LLM-friendly code query API with 3 core functions.
 Implements the exact API specification from new-code-query-api-requirements.md
 """
 
+import copy
 import logging
 import re
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from sol_query.core.source_manager import SourceManager
 from sol_query.core.ast_nodes import (
@@ -28,6 +30,21 @@ from sol_query.analysis.variable_tracker import VariableTracker
 from sol_query.utils.serialization import serialize_enum_value, LLMSerializer
 
 
+def _freeze(obj: Any) -> Any:
+    """Convert query arguments into a hashable cache key component."""
+    if isinstance(obj, dict):
+        return tuple(sorted(((str(k), _freeze(v)) for k, v in obj.items()), key=lambda item: item[0]))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(item) for item in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(_freeze(item) for item in obj)
+    try:
+        hash(obj)
+    except TypeError:
+        return repr(obj)
+    return obj
+
+
 class SolidityQueryEngineV2:
     """
     LLM-friendly Solidity query engine implementing 3 core functions:
@@ -36,8 +53,16 @@ class SolidityQueryEngineV2:
     3. find_references() - Reference and relationship analysis
     """
 
-    def __init__(self, source_paths: Optional[Union[str, Path, List[Union[str, Path]]]] = None):
-        """Initialize the V2 query engine."""
+    def __init__(self, source_paths: Optional[Union[str, Path, List[Union[str, Path]]]] = None,
+                 query_cache_size: int = 256):
+        """
+        Initialize the V2 query engine.
+
+        Args:
+            source_paths: Source files or directories to load
+            query_cache_size: Maximum number of query responses kept (least
+                recently used are dropped first; 0 disables caching)
+        """
         self.source_manager = SourceManager()
         self.pattern_matcher = PatternMatcher()
 
@@ -51,6 +76,13 @@ class SolidityQueryEngineV2:
         # Performance optimization: cache frequently accessed data
         self._all_nodes_cache = None
         self._nodes_by_type_cache = {}
+        self._elements_by_name_cache: Optional[Dict[Any, ASTNode]] = None
+
+        # Successful responses of the public query functions, keyed by
+        # function, source generation and frozen arguments
+        self.query_cache_size = query_cache_size
+        self._query_cache: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        self._query_cache_enabled = True
 
         if source_paths:
             self.load_sources(source_paths)
@@ -88,12 +120,17 @@ class SolidityQueryEngineV2:
         if isinstance(source_paths, (str, Path)):
             source_paths = [source_paths]
 
+        # Consecutive files are parsed as one parallel batch, keeping load order
+        pending_files = []
         for source_path in source_paths:
             path = Path(source_path)
             if path.is_file():
-                self.source_manager.add_file(path)
+                pending_files.append(path)
             elif path.is_dir():
+                self.source_manager.add_files(pending_files)
+                pending_files = []
                 self.source_manager.add_directory(path, recursive=True)
+        self.source_manager.add_files(pending_files)
 
         # Invalidate caches after loading new sources
         self._invalidate_caches()
@@ -102,6 +139,51 @@ class SolidityQueryEngineV2:
         """Invalidate all internal caches."""
         self._all_nodes_cache = None
         self._nodes_by_type_cache.clear()
+        self._elements_by_name_cache = None
+        self._query_cache.clear()
+
+    def enable_query_cache(self, enabled: bool = True) -> None:
+        """
+        Enable or disable caching of query_code/get_details/find_references results.
+
+        Disabling also drops all cached results.
+
+        Args:
+            enabled: Whether repeated identical queries may be served from the cache
+        """
+        self._query_cache_enabled = enabled
+        if not enabled:
+            self._query_cache.clear()
+
+    def _cached_response(self, function_name: str, parameters: Dict[str, Any],
+                         compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Serve a response from the query cache, computing and storing it on a miss.
+
+        Only successful responses are cached. Callers always get a deep copy,
+        so mutating a returned response cannot change what later calls see.
+        """
+        if not self._query_cache_enabled or self.query_cache_size <= 0:
+            return compute()
+
+        start_time = time.time()
+        key = (function_name, self.source_manager.generation, _freeze(parameters))
+        cache = self._query_cache
+        cached = cache.get(key)
+        if cached is None:
+            response = compute()
+            if response.get("success"):
+                cache[key] = copy.deepcopy(response)
+                while len(cache) > self.query_cache_size:
+                    cache.popitem(last=False)
+            return response
+
+        cache.move_to_end(key)
+
+        response = copy.deepcopy(cached)
+        response["query_info"]["cache_hit"] = True
+        response["query_info"]["execution_time"] = time.time() - start_time
+        return response
 
     def query_code(self,
                    query_type: str,
@@ -122,6 +204,22 @@ class SolidityQueryEngineV2:
         Returns:
             Standardized response dictionary with query results
         """
+        return self._cached_response("query_code", {
+            "query_type": query_type,
+            "filters": filters,
+            "scope": scope,
+            "include": include,
+            "options": options
+        }, lambda: self._query_code_uncached(
+            query_type, filters, scope, include, options))
+
+    def _query_code_uncached(self,
+                             query_type: str,
+                             filters: Dict[str, Any],
+                             scope: Dict[str, Any],
+                             include: List[str],
+                             options: Dict[str, Any]) -> Dict[str, Any]:
+        """Run query_code() without consulting the result cache."""
         start_time = time.time()
 
         try:
@@ -207,6 +305,20 @@ class SolidityQueryEngineV2:
         Returns:
             Comprehensive analysis results for specified elements
         """
+        return self._cached_response("get_details", {
+            "element_type": element_type,
+            "identifiers": identifiers,
+            "include_context": include_context,
+            "options": options
+        }, lambda: self._get_details_uncached(
+            element_type, identifiers, include_context, options))
+
+    def _get_details_uncached(self,
+                              element_type: str,
+                              identifiers: List[str],
+                              include_context: bool,
+                              options: Dict[str, Any]) -> Dict[str, Any]:
+        """Run get_details() without consulting the result cache."""
         start_time = time.time()
 
         try:
@@ -294,6 +406,26 @@ class SolidityQueryEngineV2:
         Returns:
             Reference and relationship analysis results
         """
+        return self._cached_response("find_references", {
+            "target": target,
+            "target_type": target_type,
+            "reference_type": reference_type,
+            "direction": direction,
+            "max_depth": max_depth,
+            "filters": filters,
+            "options": options
+        }, lambda: self._find_references_uncached(
+            target, target_type, reference_type, direction, max_depth, filters, options))
+
+    def _find_references_uncached(self,
+                                 target: str,
+                                 target_type: str,
+                                 reference_type: str,
+                                 direction: str,
+                                 max_depth: int,
+                                 filters: Dict[str, Any],
+                                 options: Dict[str, Any]) -> Dict[str, Any]:
+        """Run find_references() without consulting the result cache."""
         start_time = time.time()
 
         try:
@@ -4139,7 +4271,9 @@ class SolidityQueryEngineV2:
         visited = set()
         current_chain = [element_name]
 
-        self._build_call_chain_recursive(element, current_chain, call_chains, visited, max_depth, 0)
+        # Calls of each element and elements by name, looked up once per build
+        self._build_call_chain_recursive(element, current_chain, call_chains, visited, max_depth, 0,
+                                         calls_by_element={}, elements_by_name={})
 
         return call_chains
 
@@ -4246,8 +4380,21 @@ class SolidityQueryEngineV2:
         return aggregation
 
     def _build_call_chain_recursive(self, current_element: ASTNode, current_chain: List[str],
-                                   all_chains: List[List[str]], visited: set, max_depth: int, depth: int):
-        """Recursively build call chains."""
+                                   all_chains: List[List[str]], visited: set, max_depth: int, depth: int,
+                                   calls_by_element: Optional[Dict[int, List[Dict[str, Any]]]] = None,
+                                   elements_by_name: Optional[Dict[str, Optional[ASTNode]]] = None):
+        """
+        Recursively build call chains. The visited set holds the names on the
+        current path: each call adds its element on entry and removes it on
+        exit, so one set is shared by the whole walk. The optional dicts
+        memoize element calls and name lookups, since the same functions
+        appear on many chains.
+        """
+        if calls_by_element is None:
+            calls_by_element = {}
+        if elements_by_name is None:
+            elements_by_name = {}
+
         if depth >= max_depth:
             if len(current_chain) > 1:
                 all_chains.append(current_chain.copy())
@@ -4260,7 +4407,9 @@ class SolidityQueryEngineV2:
         visited.add(element_name)
 
         # Find what this element calls
-        calls = self._get_element_calls(current_element)
+        calls = calls_by_element.get(id(current_element))
+        if calls is None:
+            calls = calls_by_element[id(current_element)] = self._get_element_calls(current_element)
 
         if not calls:
             # End of chain
@@ -4271,11 +4420,15 @@ class SolidityQueryEngineV2:
                 call_name = call.get('name', '')
                 if call_name and call_name not in visited:
                     # Find the called element
-                    called_element = self._find_element_by_name(call_name)
+                    if call_name in elements_by_name:
+                        called_element = elements_by_name[call_name]
+                    else:
+                        called_element = elements_by_name[call_name] = self._find_element_by_name(call_name)
                     if called_element:
                         current_chain.append(call_name)
                         self._build_call_chain_recursive(called_element, current_chain, all_chains,
-                                                        visited.copy(), max_depth, depth + 1)
+                                                        visited, max_depth, depth + 1,
+                                                        calls_by_element, elements_by_name)
                         current_chain.pop()
 
         visited.remove(element_name)
@@ -4672,22 +4825,28 @@ class SolidityQueryEngineV2:
 
     def _find_element_by_name(self, name: str) -> Optional[ASTNode]:
         """Find an element by name across all node types."""
-        # Search functions first
-        all_nodes = self._get_all_nodes()
-        functions = [node for node in all_nodes if isinstance(node, FunctionDeclaration)]
-        for func in functions:
-            if getattr(func, 'name', '') == name:
-                return func
+        return self._get_elements_by_name().get(name)
 
-        # Search contracts
-        contracts = self.source_manager.get_contracts()
-        for contract in contracts:
-            if getattr(contract, 'name', '') == name:
-                return contract
+    def _get_elements_by_name(self) -> Dict[Any, ASTNode]:
+        """
+        Map each name to the element _find_element_by_name resolves it to:
+        the first function with that name, else the first contract, else
+        the first node of any type. Built once until caches are invalidated.
+        """
+        if self._elements_by_name_cache is not None:
+            return self._elements_by_name_cache
 
-        # Search other node types
-        for node in all_nodes:
-            if getattr(node, 'name', '') == name:
-                return node
+        all_nodes = self._get_all_nodes()
+        index: Dict[Any, ASTNode] = {}
+        # Lowest priority first, so higher priorities overwrite; reversed so
+        # the first node of each kind wins
+        for node in reversed(all_nodes):
+            index[getattr(node, 'name', '')] = node
+        for contract in reversed(self.source_manager.get_contracts()):
+            index[getattr(contract, 'name', '')] = contract
+        for node in reversed(all_nodes):
+            if isinstance(node, FunctionDeclaration):
+                index[getattr(node, 'name', '')] = node
 
-        return None
\ No newline at end of file
+        self._elements_by_name_cache = index
+        return index
\ No newline at end of file
@@ -0,0 +1,539 @@
+"""Column-oriented indexes over loaded AST nodes for fast fluent filtering."""
+
+import os
+from bisect import bisect_left, bisect_right
+from enum import IntFlag
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from sol_query.core.ast_nodes import (
+    ASTNode, FunctionDeclaration, VariableDeclaration, Visibility, StateMutability
+)
+from sol_query.utils.pattern_matching import PatternMatcher, cached_compile
+
+# Characters that make a glob more than a plain prefix/substring pattern
+_GLOB_SPECIALS = frozenset('*?[')
+
+# Mixed-case text with a separator, left unchanged only by a no-op os.path.normcase
+_NORMCASE_PROBE = 'aB/'
+
+# Characters that make PatternMatcher treat a string as more than an exact name
+_REGEX_SPECIALS = frozenset(r'.*+?[]{}()|\^$')
+
+# Name patterns identifying time-related variables
+TIME_VARIABLE_NAME_PATTERNS = [
+    "*timestamp*", "*time*", "*duration*", "*deadline*",
+    "*expiry*", "*timeout*", "*delay*", "*period*"
+]
+
+
+# Source patterns for the time-related function filters
+TIME_OPERATION_PATTERNS = [
+    r"block\.timestamp",
+    r"now\b",
+    r"\btimestamp\b",
+    r"\bduration\b",
+    r"\bdeadline\b",
+    r"\bexpiry\b",
+    r"\btimeout\b"
+]
+TIMESTAMP_USAGE_PATTERNS = [r"(block\.timestamp|now\b)"]
+TIME_ARITHMETIC_PATTERNS = [
+    r"(block\.timestamp|now|timestamp|duration)\s*[+\-*/%]",
+    r"[+\-*/%]\s*(block\.timestamp|now|timestamp|duration)"
+]
+
+# Every time pattern above needs one of these substrings to match
+_TIME_KEYWORDS = ("timestamp", "now", "duration", "deadline", "expiry", "timeout")
+
+# Statement node types that are loops
+LOOP_STATEMENT_TYPES = ["for_statement", "while_statement", "do_while_statement"]
+
+# Source substrings pre-scanned for every function when the keyword index is built
+SOURCE_KEYWORDS = (
+    "require", "assert", "revert", "emit", "balance", "timestamp", "block.timestamp",
+    "now", "duration", "deadline", "expiry", "timeout", "msg.sender", "msg.value",
+    "tx.origin", ".call", ".transfer", ".send", "delegatecall", "selfdestruct",
+    "assembly", "+", "-", "*", "/", "%",
+)
+
+# Upper bound on keywords learned from ad-hoc queries before falling back to scans
+_MAX_SOURCE_KEYWORDS = 256
+
+
+class FunctionFlags(IntFlag):
+    """Bit flags encoding a function's visibility, state mutability, kind and body."""
+    NONE = 0
+    EXTERNAL = 1
+    PUBLIC = 2
+    INTERNAL = 4
+    PRIVATE = 8
+    VIEW = 16
+    PURE = 32
+    PAYABLE = 64
+    CONSTRUCTOR = 128
+    HAS_BODY = 256
+
+
+# Keyed by enum value so plain strings such as "external" resolve as well
+VISIBILITY_FLAGS: Dict[str, FunctionFlags] = {
+    Visibility.EXTERNAL.value: FunctionFlags.EXTERNAL,
+    Visibility.PUBLIC.value: FunctionFlags.PUBLIC,
+    Visibility.INTERNAL.value: FunctionFlags.INTERNAL,
+    Visibility.PRIVATE.value: FunctionFlags.PRIVATE,
+}
+
+MUTABILITY_FLAGS: Dict[str, FunctionFlags] = {
+    StateMutability.VIEW.value: FunctionFlags.VIEW,
+    StateMutability.PURE.value: FunctionFlags.PURE,
+    StateMutability.PAYABLE.value: FunctionFlags.PAYABLE,
+}
+
+
+class OperatorCategory(IntFlag):
+    """Bit flags classifying expression operators."""
+    NONE = 0
+    ARITHMETIC = 1
+    COMPARISON = 2
+    LOGICAL = 4
+    BITWISE = 8
+
+
+# Operator classification table; one dict lookup replaces a list scan per expression
+OPERATOR_CATEGORIES: Dict[str, int] = {
+    **dict.fromkeys(("+", "-", "*", "/", "%", "**"), int(OperatorCategory.ARITHMETIC)),
+    **dict.fromkeys(("==", "!=", "<", ">", "<=", ">="), int(OperatorCategory.COMPARISON)),
+    **dict.fromkeys(("&&", "||", "!"), int(OperatorCategory.LOGICAL)),
+    **dict.fromkeys(("&", "|", "^", "~", "<<", ">>"), int(OperatorCategory.BITWISE)),
+}
+
+
+def compute_function_flags(function: FunctionDeclaration) -> int:
+    """Encode a function's visibility, mutability, constructor kind and body as an int."""
+    flags = VISIBILITY_FLAGS.get(getattr(function.visibility, 'value', function.visibility), 0)
+    flags |= MUTABILITY_FLAGS.get(getattr(function.state_mutability, 'value', function.state_mutability), 0)
+    if function.is_constructor:
+        flags |= FunctionFlags.CONSTRUCTOR
+    if function.body:
+        flags |= FunctionFlags.HAS_BODY
+    return int(flags)
+
+
+class TimeFlags(IntFlag):
+    """Bit flags recording which time-related source patterns a function matches."""
+    NONE = 0
+    OPERATIONS = 1
+    TIMESTAMP_USAGE = 2
+    ARITHMETIC = 4
+
+
+_TIME_FLAG_REGEXES = [
+    (TimeFlags.OPERATIONS, cached_compile("|".join(TIME_OPERATION_PATTERNS))),
+    (TimeFlags.TIMESTAMP_USAGE, cached_compile("|".join(TIMESTAMP_USAGE_PATTERNS))),
+    (TimeFlags.ARITHMETIC, cached_compile("|".join(TIME_ARITHMETIC_PATTERNS))),
+]
+
+
+def compute_time_flags(source: str) -> int:
+    """Classify source code against all time-related patterns at once."""
+    if not any(keyword in source for keyword in _TIME_KEYWORDS):
+        return 0
+    flags = 0
+    for flag, regex in _TIME_FLAG_REGEXES:
+        if regex.search(source):
+            flags |= flag
+    return int(flags)
+
+
+def group_by_name(nodes: Iterable[Any]) -> Dict[str, List[Any]]:
+    """Group named nodes by exact name, preserving order within each group."""
+    by_name: Dict[str, List[Any]] = {}
+    for node in nodes:
+        by_name.setdefault(node.name, []).append(node)
+    return by_name
+
+
+def group_by_parent_contract(nodes: Iterable[Any]) -> Dict[str, List[Any]]:
+    """Group contract members by their parent contract's name, preserving order."""
+    by_contract: Dict[str, List[Any]] = {}
+    for node in nodes:
+        if node.parent_contract is not None:
+            by_contract.setdefault(node.parent_contract.name, []).append(node)
+    return by_contract
+
+
+class FunctionTable:
+    """
+    Struct-of-arrays view over all loaded functions.
+
+    Hot per-function attributes are extracted once into parallel lists, so
+    fluent filters test plain ints instead of re-reading model fields on every
+    query. Rows are looked up by node identity; functions that were not part
+    of the table (e.g. built by hand) fall back to reading the node directly.
+    """
+
+    def __init__(self, functions: List[FunctionDeclaration]):
+        """
+        Build the table.
+
+        Args:
+            functions: All functions, in engine order
+        """
+        self.functions = functions
+        self.rows: Dict[int, int] = {id(f): row for row, f in enumerate(functions)}
+        self.names: List[str] = [f.name for f in functions]
+        self.param_counts: List[int] = [len(f.parameters) for f in functions]
+        # One byte per row; the common "has any parameters" test needs no int compare
+        self.has_params = bytearray(1 if count else 0 for count in self.param_counts)
+        self.flags: List[int] = [compute_function_flags(f) for f in functions]
+        # One bit per distinct modifier name; each row ORs the bits of its modifiers
+        self.modifier_bits: Dict[str, int] = {}
+        self.modifier_masks: List[int] = [self._modifier_mask_of(f) for f in functions]
+        self._buckets: Dict[Tuple[int, int], List[FunctionDeclaration]] = {}
+
+    def param_count(self, function: FunctionDeclaration) -> int:
+        """Get the number of parameters of a function."""
+        row = self.rows.get(id(function))
+        if row is None:
+            return len(function.parameters)
+        return self.param_counts[row]
+
+    def has_parameters(self, function: FunctionDeclaration) -> bool:
+        """Check whether a function takes any parameters."""
+        row = self.rows.get(id(function))
+        if row is None:
+            return len(function.parameters) > 0
+        return self.has_params[row] == 1
+
+    def has_implementation(self, function: FunctionDeclaration) -> bool:
+        """Check whether a function has a body."""
+        return self.flags_of(function) & FunctionFlags.HAS_BODY != 0
+
+    def flags_of(self, function: FunctionDeclaration) -> int:
+        """Get the FunctionFlags bits of a function."""
+        row = self.rows.get(id(function))
+        if row is None:
+            return compute_function_flags(function)
+        return self.flags[row]
+
+    def _modifier_mask_of(self, function: FunctionDeclaration) -> int:
+        bits = self.modifier_bits
+        mask = 0
+        for modifier in function.modifiers:
+            bit = bits.get(modifier)
+            if bit is None:
+                bit = 1 << len(bits)
+                bits[modifier] = bit
+            mask |= bit
+        return mask
+
+    def modifier_predicate(self, modifiers: Iterable[str]) -> Callable[[FunctionDeclaration], bool]:
+        """
+        Build a predicate testing whether a function uses any of the given modifiers.
+
+        Functions of the table are answered with one mask test against the
+        OR of the modifiers' bits; other functions fall back to a set test.
+        """
+        wanted = frozenset(modifiers)
+        guard = 0
+        for modifier in wanted:
+            guard |= self.modifier_bits.get(modifier, 0)
+        rows = self.rows
+        masks = self.modifier_masks
+
+        def has_any(function: FunctionDeclaration) -> bool:
+            row = rows.get(id(function))
+            if row is None:
+                return not wanted.isdisjoint(function.modifiers)
+            return masks[row] & guard != 0
+
+        return has_any
+
+    def bucket(self, require: int = 0, forbid: int = 0) -> List[FunctionDeclaration]:
+        """
+        Get all functions of the table matching the flags, memoized per combination.
+
+        The returned list is shared and must not be mutated.
+        """
+        key = (require, forbid)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self.select(self.functions, require, forbid)
+            self._buckets[key] = bucket
+        return bucket
+
+    def select(self, functions: List[FunctionDeclaration],
+               require: int = 0, forbid: int = 0) -> List[FunctionDeclaration]:
+        """
+        Select functions whose flags contain all of require and none of forbid.
+
+        Args:
+            functions: Functions to filter, in order
+            require: Flags that must all be set
+            forbid: Flags that must all be clear
+
+        Returns:
+            Matching functions, order preserved
+        """
+        rows = self.rows
+        flags = self.flags
+        selected = []
+        for function in functions:
+            row = rows.get(id(function))
+            value = flags[row] if row is not None else compute_function_flags(function)
+            if value & require == require and not value & forbid:
+                selected.append(function)
+        return selected
+
+
+class NameIndex:
+    """
+    Index over a set of names answering name-pattern queries.
+
+    Matching is done once per distinct name and pattern and memoized, so the
+    same with_name("*process*") query does not rescan every element. Plain
+    "prefix*" globs are answered by binary search over the sorted names and
+    "*substring*" globs by str.find over one newline-joined buffer of all
+    names; other patterns fall back to PatternMatcher. The fast paths are
+    skipped where os.path.normcase changes names (Windows), keeping the
+    case-insensitive glob semantics there.
+    """
+
+    def __init__(self, names: Iterable[str], matcher: PatternMatcher):
+        """
+        Build the index.
+
+        Args:
+            names: Names to index (duplicates are ignored)
+            matcher: Pattern matcher defining the matching semantics
+        """
+        self.names: List[str] = sorted({name for name in names if isinstance(name, str)})
+        self._known = frozenset(self.names)
+        self._matcher = matcher
+        self._cache: Dict[Any, FrozenSet[str]] = {}
+
+        self._offsets: List[int] = []
+        offset = 0
+        for name in self.names:
+            self._offsets.append(offset)
+            offset += len(name) + 1
+        self._buffer = "\n".join(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._known
+
+    def matching(self, pattern: Any) -> FrozenSet[str]:
+        """Get the indexed names matching a pattern."""
+        key = tuple(pattern) if isinstance(pattern, list) else pattern
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = frozenset(self._match(pattern))
+            self._cache[key] = cached
+        return cached
+
+    def predicate(self, pattern: Any) -> Callable[[str], bool]:
+        """Build a name predicate that consults the index for known names."""
+        matched = self.matching(pattern)
+        known = self._known
+        matches_name_pattern = self._matcher.matches_name_pattern
+        return lambda name: name in matched if name in known else matches_name_pattern(name, pattern)
+
+    def _match(self, pattern: Any) -> Iterable[str]:
+        # Glob matching compares os.path.normcase() forms; the literal fast
+        # paths compare names as they are, so they apply only where the two agree
+        if (isinstance(pattern, str) and pattern not in self._known
+                and os.path.normcase(_NORMCASE_PROBE) == _NORMCASE_PROBE):
+            literal = pattern.strip('*')
+            if literal and '\n' not in literal and not _GLOB_SPECIALS.intersection(literal):
+                if pattern == literal + '*':
+                    return self._match_prefix(literal)
+                if pattern == '*' + literal + '*':
+                    return self._match_substring(literal)
+
+        matches_name_pattern = self._matcher.matches_name_pattern
+        return [name for name in self.names if matches_name_pattern(name, pattern)]
+
+    def _match_prefix(self, prefix: str) -> List[str]:
+        names = self.names
+        start = bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return names[start:end]
+
+    def _match_substring(self, literal: str) -> List[str]:
+        buffer = self._buffer
+        offsets = self._offsets
+        found = []
+        position = buffer.find(literal)
+        while position != -1:
+            row = bisect_right(offsets, position) - 1
+            found.append(self.names[row])
+            # Skip the rest of this name, it already matched
+            next_row = row + 1
+            if next_row >= len(offsets):
+                break
+            position = buffer.find(literal, offsets[next_row])
+        return found
+
+
+class VariableTable:
+    """
+    Struct-of-arrays view over all loaded variables.
+
+    Holds the derived per-variable facts that are expensive to recompute on
+    every query: variables grouped by exact type name, a NameIndex over type
+    names for with_type() and the time-related classification of each
+    variable name.
+    """
+
+    def __init__(self, variables: List[VariableDeclaration], matcher: PatternMatcher):
+        """
+        Build the table.
+
+        Args:
+            variables: All variables, in engine order
+            matcher: Pattern matcher defining the matching semantics
+        """
+        self.variables = variables
+        self.rows: Dict[int, int] = {id(v): row for row, v in enumerate(variables)}
+        self.type_names: List[str] = [v.type_name for v in variables]
+        self.type_index = NameIndex(self.type_names, matcher)
+        self.by_type: Dict[str, List[VariableDeclaration]] = {}
+        for variable in variables:
+            self.by_type.setdefault(variable.type_name, []).append(variable)
+        self._type_cache: Dict[Any, List[VariableDeclaration]] = {}
+
+        name_index = NameIndex((v.name for v in variables), matcher)
+        self._time_name_predicate = name_index.predicate(TIME_VARIABLE_NAME_PATTERNS)
+        self.is_time_related: List[bool] = [self._time_name_predicate(v.name) for v in variables]
+
+    def of_type(self, pattern: Any) -> List[VariableDeclaration]:
+        """
+        Get all variables of the table whose type matches a pattern, in order.
+
+        A literal type name is a single dictionary lookup; other patterns
+        collect the groups of every matching type name, memoized per pattern.
+        The returned list is shared and must not be mutated.
+        """
+        if isinstance(pattern, str) and not _REGEX_SPECIALS.intersection(pattern):
+            return self.by_type.get(pattern, [])
+
+        key = tuple(pattern) if isinstance(pattern, list) else pattern
+        cached = self._type_cache.get(key)
+        if cached is None:
+            matched = self.type_index.matching(pattern)
+            if len(matched) == 1:
+                cached = self.by_type.get(next(iter(matched)), [])
+            else:
+                rows = self.rows
+                cached = sorted((v for name in matched for v in self.by_type.get(name, ())),
+                                key=lambda v: rows[id(v)])
+            self._type_cache[key] = cached
+        return cached
+
+    def time_related(self, variable: VariableDeclaration) -> bool:
+        """Check whether a variable's name marks it as time-related."""
+        row = self.rows.get(id(variable))
+        if row is None:
+            return self._time_name_predicate(variable.name)
+        return self.is_time_related[row]
+
+
+class SourceKeywordIndex:
+    """
+    Per-node bitmask of which keywords occur in each node's source code.
+
+    Every node's source is scanned once per keyword when the keyword is
+    first seen, after which "does this source contain X" is a single mask
+    test. Keywords not in SOURCE_KEYWORDS are added on first use, so
+    repeated with_source_containing() calls with the same text are only
+    paid for once.
+    """
+
+    def __init__(self, nodes: List[ASTNode], keywords: Iterable[str] = SOURCE_KEYWORDS):
+        """
+        Build the index.
+
+        Args:
+            nodes: Nodes whose source code is indexed, in engine order
+            keywords: Keywords to scan for up front
+        """
+        self.rows: Dict[int, int] = {id(n): row for row, n in enumerate(nodes)}
+        self.sources: List[str] = [n.get_source_code() for n in nodes]
+        self.masks: List[int] = [0] * len(nodes)
+        self._bits: Dict[str, int] = {}
+        for keyword in keywords:
+            self._add_keyword(keyword)
+
+    def _add_keyword(self, keyword: str) -> int:
+        bit = 1 << len(self._bits)
+        self._bits[keyword] = bit
+        masks = self.masks
+        for row, source in enumerate(self.sources):
+            if keyword in source:
+                masks[row] |= bit
+        return bit
+
+    def keyword_mask(self, keywords: Iterable[str]) -> Optional[int]:
+        """Get the combined bit mask for keywords, or None if they cannot be indexed."""
+        mask = 0
+        for keyword in keywords:
+            bit = self._bits.get(keyword)
+            if bit is None:
+                if len(self._bits) >= _MAX_SOURCE_KEYWORDS:
+                    return None
+                bit = self._add_keyword(keyword)
+            mask |= bit
+        return mask
+
+    def containing_any(self, keywords: Iterable[str]) -> Callable[[ASTNode], bool]:
+        """Build a predicate testing whether a node's source contains any of the keywords."""
+        keywords = list(keywords)
+        mask = self.keyword_mask(keywords)
+        if mask is None:
+            return lambda node: any(k in node.get_source_code() for k in keywords)
+
+        rows = self.rows
+        masks = self.masks
+
+        def predicate(node: ASTNode) -> bool:
+            row = rows.get(id(node))
+            if row is None:
+                source = node.get_source_code()
+                return any(k in source for k in keywords)
+            return masks[row] & mask != 0
+
+        return predicate
+
+
+class TimeFlagTable:
+    """
+    Time-related classification of every loaded function.
+
+    Each function's source is classified against the time operation,
+    timestamp usage and time arithmetic patterns in one pass, so the
+    fluent and traditional time filters only read a flag column.
+    """
+
+    def __init__(self, functions: List[FunctionDeclaration]):
+        """
+        Build the table.
+
+        Args:
+            functions: All functions, in engine order
+        """
+        self.rows: Dict[int, int] = {id(f): row for row, f in enumerate(functions)}
+        self.flags: List[int] = [compute_time_flags(f.get_source_code()) for f in functions]
+
+    def predicate(self, flag: TimeFlags) -> Callable[[FunctionDeclaration], bool]:
+        """Build a predicate testing whether a function has the given time flag."""
+        rows = self.rows
+        flags = self.flags
+        mask = int(flag)
+
+        def has_flag(function: FunctionDeclaration) -> bool:
+            row = rows.get(id(function))
+            value = flags[row] if row is not None else compute_time_flags(function.get_source_code())
+            return value & mask != 0
+
+        return has_flag
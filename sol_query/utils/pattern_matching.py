@@ -1,8 +1,38 @@
 """Pattern matching utilities for flexible querying."""
 
+import os
 import re
 import fnmatch
-from typing import Union, List, Pattern, Any
+from functools import lru_cache
+from typing import Union, List, Pattern, Any, Callable
+
+
+@lru_cache(maxsize=256)
+def cached_compile(pattern: str, flags: int = 0) -> Pattern:
+    """Compile a regex pattern, reusing the compiled object for repeated patterns."""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=512)
+def compile_glob(pattern: str) -> Pattern:
+    """Compile a shell-style glob once; match os.path.normcase(name) against it."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+@lru_cache(maxsize=128)
+def compile_glob_union(patterns: tuple) -> Pattern:
+    """
+    Compile several shell-style globs into one regex matching any of them.
+
+    Equivalent to trying fnmatch.fnmatch with each glob in turn, but the
+    name is scanned once by a single compiled alternation.
+    """
+    return re.compile("|".join(
+        f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns))
+
+
+def _is_glob(pattern: Any) -> bool:
+    return isinstance(pattern, str) and ('*' in pattern or '?' in pattern or '[' in pattern)
 
 
 class PatternMatcher:
@@ -35,6 +65,9 @@ class PatternMatcher:
         
         # Handle lists of patterns (OR logic)
         if isinstance(pattern, list):
+            if len(pattern) > 1 and all(_is_glob(p) for p in pattern):
+                return (name in pattern or
+                        compile_glob_union(tuple(pattern)).match(os.path.normcase(name)) is not None)
             return any(self.matches_name_pattern(name, p) for p in pattern)
         
         # Handle regex Pattern objects
@@ -49,7 +82,7 @@ class PatternMatcher:
             
             # Check for shell-style wildcards
             if '*' in pattern or '?' in pattern or '[' in pattern:
-                return fnmatch.fnmatch(name, pattern)
+                return compile_glob(pattern).match(os.path.normcase(name)) is not None
             
             # Check if it looks like a regex (contains regex metacharacters)
             if self._looks_like_regex(pattern):
@@ -65,6 +98,25 @@ class PatternMatcher:
         
         return False
     
+    def name_pattern_matcher(self, pattern: Union[str, List[str], Pattern]) -> Callable[[str], bool]:
+        """
+        Build a reusable predicate equivalent to matches_name_pattern for one pattern.
+
+        Single globs are compiled once up front so filtering many names does
+        not repeat the pattern dispatch per element.
+
+        Args:
+            pattern: Pattern to match against
+
+        Returns:
+            Callable that returns True if the given name matches the pattern
+        """
+        if _is_glob(pattern):
+            regex = compile_glob(pattern)
+            return lambda name: name == pattern or regex.match(os.path.normcase(name)) is not None
+
+        return lambda name: self.matches_name_pattern(name, pattern)
+
     def matches_text_pattern(self, text: str, pattern: Union[str, Pattern]) -> bool:
         """
         Check if text matches a pattern (for source code searching).
@@ -93,6 +145,34 @@ class PatternMatcher:
                 return pattern in text
         
         return False
+
+    def text_pattern_matcher(self, pattern: Union[str, Pattern]) -> Callable[[str], bool]:
+        """
+        Build a reusable predicate equivalent to matches_text_pattern for one pattern.
+
+        Compiles the pattern once so filtering many source texts does not repeat
+        the pattern dispatch and cache lookup per element.
+
+        Args:
+            pattern: Pattern to match (string or compiled regex)
+
+        Returns:
+            Callable that returns True if the given text matches the pattern
+        """
+        if pattern is None:
+            return lambda text: True
+
+        if hasattr(pattern, 'search'):
+            return lambda text: bool(pattern.search(text))
+
+        if isinstance(pattern, str):
+            try:
+                regex = self._get_compiled_regex(pattern)
+            except re.error:
+                return lambda text: pattern in text
+            return lambda text: bool(regex.search(text))
+
+        return lambda text: False
     
     def matches_type_pattern(self, type_name: str, pattern: Union[str, List[str], Pattern]) -> bool:
         """
@@ -223,7 +303,7 @@ class PatternMatcher:
     def _get_compiled_regex(self, pattern: str) -> Pattern:
         """Get a compiled regex from cache or compile and cache it."""
         if pattern not in self._regex_cache:
-            self._regex_cache[pattern] = re.compile(pattern)
+            self._regex_cache[pattern] = cached_compile(pattern)
         return self._regex_cache[pattern]
 
 
@@ -1,10 +1,13 @@
 """JSON serialization utilities for LLM integration."""
 
 import json
+import weakref
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -39,14 +42,26 @@ class SerializationLevel(str, Enum):
 class LLMSerializer:
     """Serializes query results for LLM consumption with configurable detail levels."""
 
-    def __init__(self, level: SerializationLevel = SerializationLevel.DETAILED):
+    def __init__(self, level: SerializationLevel = SerializationLevel.DETAILED,
+                 cache_size: int = 0):
         """
         Initialize serializer.
         
         Args:
             level: Default serialization detail level
+            cache_size: Maximum number of nodes whose serializations are kept
+                (least recently used are dropped first). Caching is off by
+                default; when enabled, cached results are shared between
+                calls and must be treated as read-only.
         """
         self.level = level
+        self.cache_size = cache_size
+        # Serialized nodes keyed by node identity; AST nodes are unhashable, so a
+        # weak reference guards against id reuse and evicts entries on collection
+        self._cache: "OrderedDict[int, Tuple[weakref.ref, Dict[SerializationLevel, Dict[str, Any]]]]" = OrderedDict()
+        # Reused compact encoder for byte output; avoids building an encoder per call
+        self._compact_encoder = json.JSONEncoder(
+            default=self._json_serializer, separators=(",", ":"), ensure_ascii=False)
 
     def serialize_node(self, node: ASTNode,
                       level: Optional[SerializationLevel] = None) -> Dict[str, Any]:
@@ -58,10 +73,49 @@ class LLMSerializer:
             level: Serialization level (uses default if not specified)
             
         Returns:
-            Dictionary representation suitable for JSON
+            Dictionary representation suitable for JSON. With caching enabled
+            the same dictionary is returned for repeated calls, so it must not
+            be modified; copy it first if needed.
         """
         level = level or self.level
 
+        if self.cache_size <= 0:
+            return self._build_node(node, level)
+
+        entry = self._cache.get(id(node))
+        if entry is not None and entry[0]() is node:
+            self._cache.move_to_end(id(node))
+            cached = entry[1].get(level)
+            if cached is not None:
+                return cached
+        else:
+            entry = self._new_cache_entry(node)
+
+        result = self._build_node(node, level)
+        entry[1][level] = result
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop all cached serializations, e.g. after nodes were modified."""
+        self._cache.clear()
+
+    def _new_cache_entry(self, node: ASTNode) -> Tuple[weakref.ref, Dict[SerializationLevel, Dict[str, Any]]]:
+        """Register a cache entry for a node that is removed when the node is collected."""
+        cache = self._cache
+        key = id(node)
+
+        def evict(ref):
+            if cache.get(key, (None,))[0] is ref:
+                del cache[key]
+
+        entry = (weakref.ref(node, evict), {})
+        cache[key] = entry
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return entry
+
+    def _build_node(self, node: ASTNode, level: SerializationLevel) -> Dict[str, Any]:
+        """Build the serialized form of a node."""
         # Base information for all nodes
         result = {
             "node_type": node.node_type.value,
@@ -80,31 +134,40 @@ class LLMSerializer:
 
         return result
 
-    def serialize_collection(self, collection: BaseCollection,
+    def serialize_collection(self, collection: Union[BaseCollection, Iterable[ASTNode]],
                            level: Optional[SerializationLevel] = None,
-                           limit: Optional[int] = None) -> Dict[str, Any]:
+                           limit: Optional[int] = None,
+                           include_total: bool = True) -> Dict[str, Any]:
         """
         Serialize a collection of nodes.
         
         Args:
-            collection: The collection to serialize
+            collection: The collection (or any iterable of nodes) to serialize
             level: Serialization level
             limit: Maximum number of items to include
+            include_total: Whether to count all elements; when False only the
+                first limit elements of a lazy collection are ever evaluated
             
         Returns:
             Dictionary with collection metadata and items
         """
         level = level or self.level
-        items = list(collection)
 
-        if limit:
-            items = items[:limit]
+        # Lazy collections are pulled element by element so that only the
+        # returned slice is filtered and serialized
+        elements = collection._iter_lazy() if isinstance(collection, BaseCollection) else iter(collection)
+        items = [self.serialize_node(item, level)
+                 for item in (islice(elements, limit) if limit else elements)]
+
+        total_count = None
+        if include_total:
+            total_count = len(collection) if hasattr(collection, '__len__') else None
 
         return {
             "collection_type": type(collection).__name__,
-            "total_count": len(collection),
+            "total_count": total_count,
             "returned_count": len(items),
-            "items": [self.serialize_node(item, level) for item in items]
+            "items": items
         }
 
     def serialize_query_result(self, result: Union[ASTNode, BaseCollection, List[ASTNode]],
@@ -162,6 +225,43 @@ class LLMSerializer:
         """
         return json.dumps(data, indent=indent, default=self._json_serializer)
 
+    def dump_json(self, data: Any, fp: TextIO) -> None:
+        """
+        Stream compact JSON to a text file object chunk by chunk.
+
+        Args:
+            data: Data to serialize
+            fp: Writable text stream
+        """
+        for chunk in self._compact_encoder.iterencode(data):
+            fp.write(chunk)
+
+    def to_json_bytes(self, data: Any) -> bytes:
+        """
+        Convert data to compact UTF-8 encoded JSON.
+
+        Args:
+            data: Data to serialize
+
+        Returns:
+            JSON document as bytes, without indentation or extra whitespace
+        """
+        return self._compact_encoder.encode(data).encode("utf-8")
+
+    def serialize_node_bytes(self, node: ASTNode,
+                             level: Optional[SerializationLevel] = None) -> bytes:
+        """
+        Serialize a single AST node directly to compact JSON bytes.
+
+        Args:
+            node: The AST node to serialize
+            level: Serialization level (uses default if not specified)
+
+        Returns:
+            JSON document as bytes
+        """
+        return self.to_json_bytes(self.serialize_node(node, level))
+
     def _serialize_location(self, location, level: SerializationLevel) -> Dict[str, Any]:
         """Serialize source location information."""
         result = {
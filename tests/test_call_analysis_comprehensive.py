@@ -189,6 +189,31 @@ class TestCallTypeDetection:
         call_type = self.detector.detect_call_type("payable(addr)")
         assert call_type == CallType.TYPE_CONVERSION
 
+    def test_compiled_pattern_groups_match_fused_patterns(self):
+        """Test that the per-pattern compiled groups agree with the fused alternations."""
+        samples = ["target.call{value: 1}(\"\")", "target.delegatecall(data)",
+                   "target.staticcall(data)", "emit Transfer(a, b, c)", "require(ok)",
+                   "SafeMath.add(1, 2)", "uint256(x)", "assembly { call(g, t, 0, 0, 0, 0, 0) }",
+                   "IERC20(token).transfer(a, 1)", "try token.foo() {} catch {}", "plain text"]
+        groups = {
+            'low_level': self.detector.compiled_low_level,
+            'delegate': self.detector.compiled_delegate,
+            'static': self.detector.compiled_static,
+            'event': self.detector.compiled_event,
+            'solidity': self.detector.compiled_solidity,
+            'library': self.detector.compiled_library,
+            'type_conversion': self.detector.compiled_type_conversion,
+            'assembly': self.detector.compiled_assembly,
+            'interface': self.detector.compiled_interface,
+            'try_catch': self.detector.compiled_try_catch,
+            'assembly_delegate': self.detector.compiled_assembly_delegate,
+            'assembly_static': self.detector.compiled_assembly_static,
+        }
+        for name, compiled in groups.items():
+            for sample in samples:
+                assert any(p.search(sample) for p in compiled) == \
+                    bool(self.detector.fused_patterns[name].search(sample)), (name, sample)
+
 
 class TestCallFiltering:
     """Test advanced call filtering capabilities."""
@@ -451,6 +476,88 @@ class TestAdvancedCallDetection:
                 if analysis.get('total_calls', 0) > 0:
                     assert len(distribution) > 0
 
+    def test_member_call_classification(self):
+        """Test classification of member calls from their text."""
+        context = {'contract_functions': ['helper'], 'contract_modifiers': []}
+        classify = self.analyzer._classify_member_call_from_text
+
+        assert classify("target.delegatecall", context) == CallType.DELEGATE
+        assert classify("target.staticcall", context) == CallType.STATIC
+        assert classify("target.call", context) == CallType.LOW_LEVEL
+        assert classify("recipient.send()", context) == CallType.LOW_LEVEL
+        assert classify("this.helper", context) == CallType.EXTERNAL
+        assert classify("self.helper", context) == CallType.INTERNAL
+        assert classify("SafeMath.add", context) == CallType.LIBRARY
+        assert classify("IERC20.transferFrom", context) == CallType.EXTERNAL
+        assert classify("helper", context) == CallType.UNKNOWN
+
+    def test_contract_context_name_sets(self):
+        """Test that contract contexts hold name sets for membership checks."""
+        contract = self.engine.contracts.with_name("CallAnalysisTest").first()
+        context = self.analyzer.build_contract_context(contract)
+
+        assert context['contract_functions'] == {f.name for f in contract.functions}
+        assert context['contract_modifiers'] == {m.name for m in contract.modifiers}
+        assert context['contract_callables'] == (context['contract_functions']
+                                                 | context['contract_modifiers'])
+
+    def test_batch_classification_matches_per_call(self):
+        """Test that batch classification agrees with classifying each call."""
+        for contract in self.engine.contracts.list():
+            context = self.analyzer.build_contract_context(contract)
+            calls = self.analyzer._find_all_calls_recursive(contract)
+            assert self.analyzer.classify_calls(calls, context) == [
+                self.analyzer._classify_call_ast(call, context) for call in calls
+            ]
+
+    def test_analyze_many_matches_per_function(self):
+        """Test that analyzing functions on threads gives the per-function results."""
+        for contract in self.engine.contracts.list():
+            context = self.analyzer.build_contract_context(contract)
+            functions = list(contract.functions)
+            expected = [(f.has_external_calls, f.has_asset_transfers,
+                         list(f.external_call_targets), list(f.asset_transfer_types))
+                        for f in functions]
+            self.analyzer.analyze_many(functions, context, max_workers=4)
+            assert [(f.has_external_calls, f.has_asset_transfers,
+                     f.external_call_targets, f.asset_transfer_types)
+                    for f in functions] == expected
+
+    def test_split_member_call_text(self):
+        """Test splitting member call text into object and method names."""
+        from sol_query.analysis.call_analyzer import _split_member
+
+        assert _split_member("token.transfer") == ("token", "transfer")
+        assert _split_member("a.b.c()") == ("a", "c")
+        assert _split_member("IERC20(token).transferFrom") == ("IERC20(token)", "transferFrom")
+        assert _split_member("transfer()") is None
+        assert _split_member("token.transfer(amount)") == ("token", "transfer")
+
+    def test_member_call_parsed_once_per_callee(self):
+        """Test that a literal callee keeps its parsed member call."""
+        from sol_query.core.ast_nodes import Literal
+
+        calls = [c for c in self.analyzer._find_all_calls_recursive(
+                     self.engine.contracts.with_name("CallAnalysisTest").first())
+                 if isinstance(c.function, Literal) and '.' in c.function.value]
+        assert calls
+        for call in calls:
+            self.analyzer._is_asset_transfer(call, {})
+            parsed = call.function._member_call_cache
+            self.analyzer._extract_transfer_type(call)
+            assert call.function._member_call_cache is parsed
+            assert '_member_call_cache' not in call.function.to_dict()
+
+    def test_member_call_parsing_is_memoized(self):
+        """Test that repeated member call text is parsed only once."""
+        from sol_query.analysis.call_analyzer import _parse_member_call
+
+        _parse_member_call.cache_clear()
+        for _ in range(3):
+            self.analyzer._classify_member_call_from_text("token.transfer", {})
+        assert _parse_member_call.cache_info().misses == 1
+        assert _parse_member_call.cache_info().hits == 2
+
 
 class TestCallAnalysisIntegration:
     """Test integration of all call analysis features."""
@@ -0,0 +1,298 @@
+"""Tests for the legacy call analyzer in sol_query.analysis.call_analyzer_old."""
+
+import pytest
+from pathlib import Path
+
+from sol_query.analysis.call_analyzer_old import CallAnalyzer
+from sol_query.core.ast_nodes import CallExpression
+from sol_query.query.engine import SolidityQueryEngine
+
+
+def _first_matching_category(pattern_table, source_code):
+    """Reference matcher: try every pattern of every category in table order."""
+    for category, patterns in pattern_table.items():
+        if any(p.search(source_code) for p in patterns):
+            return category
+    return None
+
+
+class TestLegacyCallAnalyzer:
+    """Test the legacy analyzer against the detailed scenario fixtures."""
+
+    @pytest.fixture
+    def functions(self):
+        """Load the detailed scenarios and return their functions."""
+        engine = SolidityQueryEngine()
+        fixtures_path = Path(__file__).parent / "fixtures" / "detailed_scenarios"
+        engine.load_sources(fixtures_path)
+        return engine.functions.list()
+
+    @pytest.fixture
+    def analyzer(self):
+        return CallAnalyzer()
+
+    @staticmethod
+    def _find(functions, contract_name, function_name):
+        for func in functions:
+            if (func.name == function_name and func.parent_contract is not None
+                    and func.parent_contract.name == contract_name):
+                return func
+        raise AssertionError(f"{contract_name}.{function_name} not found")
+
+    def _sources(self, analyzer, functions):
+        sources = [
+            "token.transfer(to, amount)",
+            "payable(owner).send(1 ether)",
+            "recipient.call{value: amount}(\"\")",
+            "IERC20(token).transferFrom(a, b, c)",
+            "Oracle.latestAnswer()",
+            "nft.safeTransferFrom(a, b, id)",
+            "balances[msg.sender] += amount",
+            "",
+        ]
+        for func in functions:
+            if func.body:
+                for expr in analyzer._extract_all_expressions(func):
+                    sources.append(expr.get_source_code())
+        return sources
+
+    def test_classifiers_match_pattern_tables(self, analyzer, functions):
+        """Test that the built classifiers pick the first matching category of each table."""
+        for source_code in self._sources(analyzer, functions):
+            assert analyzer._classify_external(source_code) == _first_matching_category(
+                analyzer.external_call_patterns, source_code), source_code
+            assert analyzer._classify_transfer(source_code) == _first_matching_category(
+                analyzer.asset_transfer_patterns, source_code), source_code
+
+    def test_classify_sources_collects_every_category(self, analyzer, functions):
+        """Test that batch classification finds the same categories as matching each source."""
+        tables = (
+            (analyzer.external_call_patterns, analyzer._external_match_cache,
+             analyzer._classify_external, len(analyzer._external_call_matchers)),
+            (analyzer.asset_transfer_patterns, analyzer._transfer_match_cache,
+             analyzer._classify_transfer, len(analyzer._asset_transfer_matchers)),
+        )
+        batches = [self._sources(analyzer, [func]) for func in functions]
+        batches.append(self._sources(analyzer, functions))
+        for sources in batches:
+            # Repeated texts must not change the result
+            sources = sources + sources[::-1]
+            for pattern_table, cache, classify, category_count in tables:
+                expected = {_first_matching_category(pattern_table, s) for s in sources} - {None}
+                assert analyzer._classify_sources(sources, cache, classify, category_count) == expected
+
+    def test_detect_helpers_match_per_expression_scan(self, analyzer, functions):
+        """Test the batched detectors against classifying each expression on its own."""
+        for func in functions:
+            if not func.body:
+                continue
+            expressions = analyzer._extract_all_expressions(func)
+            sources = [expr.get_source_code() for expr in expressions]
+
+            expected_calls = {_first_matching_category(analyzer.external_call_patterns, s)
+                              for s in sources} - {None}
+            expected_transfers = {_first_matching_category(analyzer.asset_transfer_patterns, s)
+                                  for s in sources} - {None}
+            for expr in expressions:
+                if isinstance(expr, CallExpression):
+                    expected_calls.add(analyzer._analyze_call_expression(expr))
+                    expected_transfers.add(analyzer._analyze_transfer_call(expr))
+                if analyzer._is_eth_value_source(expr.get_source_code()):
+                    expected_transfers.add("eth_transfer")
+            expected_calls.discard(None)
+            expected_transfers.discard(None)
+
+            assert analyzer._detect_external_calls(expressions, func) == expected_calls, func.name
+            assert analyzer._detect_asset_transfers(expressions, func) == expected_transfers, func.name
+
+    def test_analyze_function_on_fixtures(self, analyzer, functions):
+        """Test the flags and types analyze_function records on known functions."""
+        for func in functions:
+            analyzer.analyze_function(func)
+
+        deposit = self._find(functions, "RETHVault", "deposit")
+        assert deposit.has_external_calls
+        assert deposit.external_call_targets == ["external_call_transfer"]
+        assert deposit.has_asset_transfers
+        assert deposit.asset_transfer_types == ["token_transfer"]
+
+        withdraw = self._find(functions, "VulnerableNFTAuction", "vulnerableWithdraw")
+        assert withdraw.has_external_calls
+        assert withdraw.asset_transfer_types == ["eth_transfer"]
+
+        received = self._find(functions, "VulnerableNFTAuction", "onERC721Received")
+        assert received.external_call_targets == ["low_level_call_call"]
+        assert not received.has_asset_transfers
+
+        exchange_rate = self._find(functions, "RETHVault", "getCurrentExchangeRate")
+        assert exchange_rate.external_call_targets == ["external_call_getExchangeRate"]
+        assert not exchange_rate.has_asset_transfers
+
+        shares = self._find(functions, "RETHVault", "calculateShares")
+        assert not shares.has_external_calls
+        assert shares.external_call_targets == []
+        assert not shares.has_asset_transfers
+        assert shares.asset_transfer_types == []
+
+    def test_call_tree_queries_on_fixtures(self, analyzer, functions):
+        """Test that call tree queries pick up flags of called functions."""
+        for func in functions:
+            analyzer.analyze_function(func)
+
+        # calculateShares only reaches external calls through its callees
+        shares = self._find(functions, "RETHVault", "calculateShares")
+        assert analyzer.analyze_call_tree_external_calls(shares, functions)
+        assert not analyzer.analyze_call_tree_asset_transfers(shares, functions)
+
+        # lzReceive reaches processMessage, which transfers tokens
+        receive = self._find(functions, "LayerZeroApp", "lzReceive")
+        assert not receive.has_external_calls and not receive.has_asset_transfers
+        assert analyzer.analyze_call_tree_external_calls(receive, functions)
+        assert analyzer.analyze_call_tree_asset_transfers(receive, functions)
+
+        # Flags set on the function itself are reported directly
+        deposit = self._find(functions, "RETHVault", "deposit")
+        assert analyzer.analyze_call_tree_external_calls(deposit, functions)
+        assert analyzer.analyze_call_tree_asset_transfers(deposit, functions)
+
+        # Functions that are not flagged and call nothing flagged stay clean
+        for func in functions:
+            if not analyzer.analyze_call_tree_external_calls(func, functions):
+                assert not func.has_external_calls
+                assert all(not analyzer.analyze_call_tree_external_calls(c, functions)
+                           for c in analyzer._get_called_functions(func, functions))
+
+
+class _GraphAnalyzer(CallAnalyzer):
+    """Legacy analyzer reading callees from an explicit call graph."""
+
+    def __init__(self, graph):
+        super().__init__()
+        self.graph = graph
+
+    def _get_called_functions(self, function, all_functions):
+        return self.graph.get(function, [])
+
+
+class _Node:
+    """Minimal function stand-in carrying the two call analysis flags."""
+
+    def __init__(self, name, external=False, transfer=False):
+        self.name = name
+        self.has_external_calls = external
+        self.has_asset_transfers = transfer
+
+
+def _reaches_flag(analyzer, function, all_functions, flag):
+    """Reference: depth-first reachability of a flagged function, by identity."""
+    stack = [function]
+    seen = {id(function)}
+    while stack:
+        current = stack.pop()
+        if getattr(current, flag):
+            return True
+        for callee in analyzer._get_called_functions(current, all_functions):
+            if id(callee) not in seen:
+                seen.add(id(callee))
+                stack.append(callee)
+    return False
+
+
+class TestPrecomputedCallTreeFlags:
+    """Test the fallback walk and precompute_call_tree_flags against plain reachability."""
+
+    @staticmethod
+    def _answers(analyzer, functions, **kwargs):
+        return [
+            (analyzer.analyze_call_tree_external_calls(f, functions, **kwargs),
+             analyzer.analyze_call_tree_asset_transfers(f, functions, **kwargs))
+            for f in functions
+        ]
+
+    def _assert_walks_match_reference(self, analyzer, functions):
+        expected = [
+            (_reaches_flag(analyzer, f, functions, 'has_external_calls'),
+             _reaches_flag(analyzer, f, functions, 'has_asset_transfers'))
+            for f in functions
+        ]
+        # An explicit visited set always takes the fallback walk
+        assert self._answers(analyzer, functions, visited=set()) == expected
+        analyzer.precompute_call_tree_flags(functions)
+        assert self._answers(analyzer, functions) == expected
+        return expected
+
+    def test_fixture_functions(self):
+        """Test both paths on every function of the detailed scenarios."""
+        engine = SolidityQueryEngine()
+        engine.load_sources(Path(__file__).parent / "fixtures" / "detailed_scenarios")
+        functions = engine.functions.list()
+        analyzer = CallAnalyzer()
+        for func in functions:
+            analyzer.analyze_function(func)
+
+        answers = self._assert_walks_match_reference(analyzer, functions)
+        assert any(external for external, _ in answers)
+        assert any(transfer for _, transfer in answers)
+
+    def test_same_name_in_several_contracts(self, tmp_path):
+        """Test that a callee is walked even when another function shares its name."""
+        source = tmp_path / "SameName.sol"
+        source.write_text(
+            "pragma solidity ^0.8.0;\n"
+            "contract X { function foo() internal {} }\n"
+            "contract Y { function foo(address t) internal { t.call(\"\"); } }\n"
+            "contract Z { function a() public { foo(); } }\n"
+        )
+        engine = SolidityQueryEngine(source)
+        functions = engine.functions.list()
+        analyzer = CallAnalyzer()
+        for func in functions:
+            analyzer.analyze_function(func)
+        entry = next(f for f in functions if f.name == "a")
+
+        assert analyzer.analyze_call_tree_external_calls(entry, functions)
+        answers = dict(zip((id(f) for f in functions),
+                           self._assert_walks_match_reference(analyzer, functions)))
+        assert answers[id(entry)][0]
+
+    def test_same_name_stand_ins(self):
+        """Test the name clash on stand-ins, with the flagged function listed last."""
+        quiet, loud = _Node("foo"), _Node("foo", external=True)
+        entry, other = _Node("a"), _Node("b")
+        graph = {entry: [quiet, loud], other: [quiet]}
+        functions = [entry, other, quiet, loud]
+        analyzer = _GraphAnalyzer(graph)
+
+        answers = self._assert_walks_match_reference(analyzer, functions)
+        assert answers == [(True, False), (False, False), (False, False), (True, False)]
+
+    def test_cycle(self):
+        """Test that every member of a cycle shares the flags reachable from it."""
+        a, b, c = _Node("a"), _Node("b"), _Node("c", external=True)
+        caller, clean, looping = _Node("caller"), _Node("clean"), _Node("looping")
+        target = _Node("target", transfer=True)
+        graph = {
+            a: [b], b: [c], c: [a, target],
+            caller: [a], clean: [looping], looping: [looping, clean],
+        }
+        functions = [clean, caller, a, b, c, looping, target]
+        analyzer = _GraphAnalyzer(graph)
+
+        answers = dict(zip((f.name for f in functions),
+                           self._assert_walks_match_reference(analyzer, functions)))
+        for name in ("a", "b", "c", "caller"):
+            assert answers[name] == (True, True)
+        assert answers["target"] == (False, True)
+        assert answers["clean"] == answers["looping"] == (False, False)
+
+    def test_deep_chain(self):
+        """Test a call chain far deeper than the recursion limit."""
+        chain = [_Node(f"hop{i}") for i in range(1500)]
+        chain[-1].has_asset_transfers = True
+        graph = {node: [nxt] for node, nxt in zip(chain, chain[1:])}
+        # Close a loop near the bottom so the chain ends in a large component
+        graph[chain[-2]] = [chain[-1], chain[750]]
+        analyzer = _GraphAnalyzer(graph)
+
+        answers = self._assert_walks_match_reference(analyzer, chain)
+        assert answers == [(False, True)] * len(chain)
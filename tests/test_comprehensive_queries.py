@@ -421,4 +421,123 @@ class TestComprehensiveQueries:
         
         # None patterns should return all
         all_contracts = engine.find_contracts(name_patterns=None)
-        assert len(all_contracts) >= 3
\ No newline at end of file
+        assert len(all_contracts) >= 3
+
+    def test_statement_finders_match_full_traversal(self, engine):
+        """Cached per-kind statement lookups return the same nodes as a full scan."""
+        all_statements = [s for f in engine._get_all_functions() if f.body
+                          for s in engine._extract_statements_from_block(f.body)]
+        assert [id(s) for s in engine._get_all_statements()] == [id(s) for s in all_statements]
+
+        for statement_type in ["for_statement", "while_statement", "if_statement",
+                               "return_statement", "require_statement", "emit_statement"]:
+            expected = [s for s in all_statements if s.node_type.value == statement_type]
+            found = engine.find_statements(statement_types=statement_type)
+            assert [id(s) for s in found] == [id(s) for s in expected]
+
+        loops = engine.find_loops()
+        assert len(loops) > 0
+        assert all(s.node_type.value in ("for_statement", "while_statement", "do_while_statement")
+                   for s in loops)
+
+    def test_collect_statements_single_pass(self, engine):
+        """collect_statements buckets several kinds consistently with the finders."""
+        kinds = ["if_statement", "return_statement", "emit_statement"]
+        buckets = engine.collect_statements(kinds)
+        assert set(buckets) == set(kinds)
+        assert len(buckets["if_statement"]) == len(engine.find_conditionals())
+        assert len(buckets["return_statement"]) == len(engine.find_returns())
+        assert len(buckets["emit_statement"]) == len(engine.find_emits())
+
+    def test_statement_finders_share_one_walk(self, engine):
+        """All statement finders read the single cached walk, including multi-kind queries."""
+        walks = []
+        original = engine._get_all_functions
+
+        def counting_get_all_functions(*args, **kwargs):
+            walks.append(args)
+            return original(*args, **kwargs)
+
+        engine._get_all_functions = counting_get_all_functions
+        buckets = engine.collect_statements(
+            ["for_statement", "while_statement", "do_while_statement", "if_statement",
+             "assignment", "return_statement", "require_statement", "emit_statement"])
+        loops = engine.find_loops()
+        assert [id(s) for s in loops] == [
+            id(s) for s in engine.find_statements()
+            if s.node_type.value in ("for_statement", "while_statement", "do_while_statement")]
+        assert len(loops) == sum(len(buckets[k]) for k in
+                                 ("for_statement", "while_statement", "do_while_statement"))
+        assert len(engine.find_conditionals()) == len(buckets["if_statement"])
+        assert len(engine.find_assignments()) == len(buckets["assignment"])
+        assert len(engine.find_requires()) == len(buckets["require_statement"])
+        assert len(engine.find_emits()) == len(buckets["emit_statement"])
+        assert len(walks) == 1
+
+    def test_expression_index_matches_full_traversal(self, engine):
+        """Cached expression buckets return the same nodes as filtering all expressions."""
+        all_expressions = engine._collect_expressions(engine._get_all_statements())
+        assert [id(e) for e in engine.find_expressions()] == [id(e) for e in all_expressions]
+
+        for expression_type in ["call_expression", "literal", "identifier", "binary_expression"]:
+            expected = [e for e in all_expressions if e.node_type.value == expression_type]
+            assert [id(e) for e in engine.find_expressions(expression_types=expression_type)] == \
+                [id(e) for e in expected]
+        assert len(engine.find_calls()) == len(engine.find_expressions(expression_types="call_expression"))
+
+    def test_iter_expressions_matches_find_expressions(self, engine):
+        """iter_expressions() yields find_expressions() lazily and count_expressions() agrees."""
+        from itertools import islice
+
+        expressions = engine.find_expressions()
+        assert engine.count_expressions() == len(expressions)
+        assert [id(e) for e in engine.iter_expressions()] == [id(e) for e in expressions]
+        assert [id(e) for e in islice(engine.iter_expressions(), 5)] == [id(e) for e in expressions[:5]]
+
+        calls = engine.find_expressions(expression_types="call_expression")
+        assert [id(e) for e in engine.iter_expressions("call_expression")] == [id(e) for e in calls]
+
+    def test_containing_function_from_cached_walk(self, engine):
+        """Statements and expressions map to the function whose body contains them."""
+        for function in engine.functions:
+            if not function.body:
+                continue
+            statements = engine._extract_statements_from_block(function.body)
+            for statement in statements:
+                assert engine._find_containing_function(statement) == function.name
+            for expr in engine._collect_expressions(statements):
+                assert engine._find_containing_function(expr) == function.name
+
+    def test_set_operations_use_node_identity(self, engine):
+        """Engine set operations deduplicate by node identity across input kinds."""
+        process = engine.functions.with_name("*process*")
+        calculate = engine.find_functions(name_patterns="*calculate*")
+        views = engine.functions.view()
+
+        union = engine.union(process, calculate, process)
+        expected_ids = list(dict.fromkeys(id(f) for f in list(process) + calculate))
+        assert [id(f) for f in union] == expected_ids
+
+        intersection = engine.intersect(engine.functions, views, tuple(views))
+        assert intersection == views.list()
+
+        difference = engine.difference(engine.functions, views)
+        assert difference == engine.functions.not_view().list()
+
+    def test_collection_names(self, engine):
+        """names() returns element names in order for full and filtered collections."""
+        assert engine.functions.names() == [f.name for f in engine.functions]
+        names = engine.functions.names()
+        names.clear()
+        assert engine.functions.names() == [f.name for f in engine.functions]
+        assert engine.functions.public().names() == [f.name for f in engine.functions.public()]
+        assert engine.contracts.names() == engine.get_contract_names()
+        assert engine.variables.with_type("uint256").names() == [
+            v.name for v in engine.variables.with_type("uint256")]
+
+    def test_declaration_names_are_interned(self, engine):
+        """Declaration names share one string object per distinct name."""
+        import sys
+
+        for node in [*engine.contracts, *engine.functions, *engine.variables, *engine.events]:
+            assert node.name is sys.intern(node.name)
@@ -575,6 +575,68 @@ class TestSolidityQueryEngineV2API:
         assert "cache_hit" in result["query_info"]
         assert isinstance(result["query_info"]["cache_hit"], bool)
 
+    def test_repeated_queries_served_from_cache(self, engine):
+        """Identical queries are cached per source generation and returned as copies."""
+        with patch.object(engine, '_get_nodes_by_query_type', return_value=[]) as get_nodes:
+            first = engine.query_code("functions", filters={"names": ["a", "b"]})
+            first["data"]["results"].append("mutated")
+            second = engine.query_code("functions", filters={"names": ["a", "b"]})
+            assert get_nodes.call_count == 1
+
+            engine.enable_query_cache(False)
+            third = engine.query_code("functions", filters={"names": ["a", "b"]})
+            assert get_nodes.call_count == 2
+
+        assert first["query_info"]["cache_hit"] is False
+        assert second["query_info"]["cache_hit"] is True
+        assert second["data"]["results"] == []
+        assert third["query_info"]["cache_hit"] is False
+
+    def test_query_cache_evicts_least_recently_used(self):
+        """The query cache keeps at most query_cache_size responses, dropping the stalest."""
+        engine = SolidityQueryEngineV2(query_cache_size=2)
+        with patch.object(engine, '_get_nodes_by_query_type', return_value=[]) as get_nodes:
+            engine.query_code("functions", filters={"names": ["a"]})
+            engine.query_code("functions", filters={"names": ["b"]})
+            # Touch "a" so "b" is the least recently used
+            assert engine.query_code("functions", filters={"names": ["a"]})["query_info"]["cache_hit"]
+            engine.query_code("functions", filters={"names": ["c"]})
+            assert get_nodes.call_count == 3
+
+            assert engine.query_code("functions", filters={"names": ["a"]})["query_info"]["cache_hit"]
+            assert engine.query_code("functions", filters={"names": ["c"]})["query_info"]["cache_hit"]
+            assert not engine.query_code("functions", filters={"names": ["b"]})["query_info"]["cache_hit"]
+            assert get_nodes.call_count == 4
+
+        uncached = SolidityQueryEngineV2(query_cache_size=0)
+        with patch.object(uncached, '_get_nodes_by_query_type', return_value=[]) as get_nodes:
+            uncached.query_code("functions", filters={"names": ["a"]})
+            uncached.query_code("functions", filters={"names": ["a"]})
+            assert get_nodes.call_count == 2
+
+    def test_element_name_lookup_priority(self, engine):
+        """Name lookups prefer functions, then contracts, then any node, first match wins."""
+        first_func = Mock(spec=FunctionDeclaration)
+        first_func.name = "shared"
+        second_func = Mock(spec=FunctionDeclaration)
+        second_func.name = "shared"
+        contract = Mock()
+        contract.name = "Vault"
+        event = Mock()
+        event.name = "Vault"
+        other = Mock()
+        other.name = "Deposit"
+
+        with patch.object(engine, '_get_all_nodes', return_value=[event, other, first_func, second_func]), \
+             patch.object(engine.source_manager, 'get_contracts', return_value=[contract]):
+            assert engine._find_element_by_name("shared") is first_func
+            assert engine._find_element_by_name("Vault") is contract
+            assert engine._find_element_by_name("Deposit") is other
+            assert engine._find_element_by_name("missing") is None
+
+        engine._invalidate_caches()
+        assert engine._find_element_by_name("shared") is None
+
     def test_metadata_structure(self, engine):
         """Test that metadata structure is correct."""
         with patch.object(engine, '_get_nodes_by_query_type', return_value=[]):
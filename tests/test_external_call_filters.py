@@ -2,6 +2,7 @@
 
 import pytest
 from pathlib import Path
+from sol_query.analysis.call_analyzer import CallAnalyzer
 from sol_query.query.engine import SolidityQueryEngine
 
 
@@ -141,6 +142,13 @@ class TestExternalCallFilters:
         for func in functions_with_call_targets:
             print(f"  - {func.name}: targets {func.external_call_targets}")
 
+        expected = [f for f in engine.functions.list()
+                    if 'call' in f.external_call_targets or 'transfer' in f.external_call_targets]
+        assert functions_with_call_targets == expected
+        assert engine.functions.with_external_call_targets('call').list() == [
+            f for f in engine.functions.list() if 'call' in f.external_call_targets
+        ]
+
     def test_specific_transfer_types(self, engine):
         """Test filtering by specific asset transfer types."""
         # Test filtering by specific transfer types
@@ -150,6 +158,10 @@ class TestExternalCallFilters:
         for func in functions_with_transfer_types:
             print(f"  - {func.name}: types {func.asset_transfer_types}")
 
+        expected = [f for f in engine.functions.list()
+                    if 'eth_transfer' in f.asset_transfer_types or 'token_transfer' in f.asset_transfer_types]
+        assert functions_with_transfer_types == expected
+
     def test_liquidity_pool_analysis(self, engine):
         """Test analysis of the LiquidityPool contract specifically."""
         # Focus on LiquidityPool contract functions
@@ -200,6 +212,140 @@ class TestExternalCallFilters:
         assert len(deep_external) >= len(shallow_external), "Deep analysis should find at least as many external calls"
         assert len(deep_transfers) >= len(shallow_transfers), "Deep analysis should find at least as many asset transfers"
 
+    @staticmethod
+    def _deep_reference(engine, method):
+        """Names of functions whose call tree has the flag, each asked of a fresh analyzer."""
+        functions = engine.functions.list()
+        return [f.name for f in functions
+                if getattr(CallAnalyzer(), method)(f, list(functions))]
+
+    def test_deep_filters_match_fresh_analysis(self, engine):
+        """Test that repeated deep filters agree with analyzing each function on its own."""
+        external = self._deep_reference(engine, "analyze_call_tree_external_calls")
+        transfers = self._deep_reference(engine, "analyze_call_tree_asset_transfers")
+        all_names = engine.functions.names()
+        assert external and transfers
+
+        for _ in range(2):
+            assert engine.functions.with_external_calls_deep().names() == external
+            assert engine.functions.with_asset_transfers_deep().names() == transfers
+            assert len(engine.functions.without_external_calls_deep()) == len(all_names) - len(external)
+            assert len(engine.functions.without_asset_transfers_deep()) == len(all_names) - len(transfers)
+
+    def test_call_tree_answers_do_not_depend_on_query_order(self, engine):
+        """Test that a shared analyzer answers the same whichever function is asked first."""
+        functions = engine.functions.list()
+        for method in ("analyze_call_tree_external_calls", "analyze_call_tree_asset_transfers"):
+            expected = self._deep_reference(engine, method)
+            for ordering in (functions, functions[::-1]):
+                # A new list per ordering, so nothing carries over between them
+                all_functions = list(functions)
+                query = getattr(CallAnalyzer(), method)
+                answers = {id(f): query(f, all_functions) for f in ordering}
+                assert [f.name for f in functions if answers[id(f)]] == expected
+
+    def test_deep_filters_follow_loaded_sources(self, engine, tmp_path):
+        """Test that deep filters pick up functions and call edges from sources loaded later."""
+        before = engine.functions.with_external_calls_deep().names()
+        assert before == self._deep_reference(engine, "analyze_call_tree_external_calls")
+
+        extra = tmp_path / "Relay.sol"
+        extra.write_text(
+            "pragma solidity ^0.8.0;\n"
+            "contract Relay {\n"
+            "    function forward(address target) internal { target.call(\"\"); }\n"
+            "    function entry() public { forward(msg.sender); }\n"
+            "}\n"
+        )
+        engine.load_sources(extra)
+
+        after = engine.functions.with_external_calls_deep().names()
+        assert after == self._deep_reference(engine, "analyze_call_tree_external_calls")
+        assert "entry" in after and "entry" not in before
+        assert engine.functions.with_asset_transfers_deep().names() == \
+            self._deep_reference(engine, "analyze_call_tree_asset_transfers")
+
+    def test_call_tree_answers_follow_appends_to_the_same_list(self, engine, tmp_path):
+        """Test that a shared analyzer sees functions appended to the list it was given."""
+        extra = tmp_path / "Relay.sol"
+        extra.write_text(
+            "pragma solidity ^0.8.0;\n"
+            "contract Relay {\n"
+            "    function forward(address target) internal { target.call(\"\"); }\n"
+            "    function entry() public { forward(msg.sender); }\n"
+            "}\n"
+        )
+        relay = SolidityQueryEngine(extra).functions.list()
+        entry = next(f for f in relay if f.name == "entry")
+
+        analyzer = CallAnalyzer()
+        all_functions = engine.functions.list() + [entry]
+        assert not analyzer.analyze_call_tree_external_calls(entry, all_functions)
+
+        all_functions.extend(f for f in relay if f is not entry)
+        assert analyzer.analyze_call_tree_external_calls(entry, all_functions)
+        for method in ("analyze_call_tree_external_calls", "analyze_call_tree_asset_transfers"):
+            query = getattr(analyzer, method)
+            assert [query(f, all_functions) for f in all_functions] == \
+                [getattr(CallAnalyzer(), method)(f, list(all_functions)) for f in all_functions]
+
+    def test_deep_filters_agree_in_either_order(self, engine):
+        """Test that running one deep filter first does not change the other's result."""
+        external = self._deep_reference(engine, "analyze_call_tree_external_calls")
+        transfers = self._deep_reference(engine, "analyze_call_tree_asset_transfers")
+
+        assert engine.functions.with_external_calls_deep().names() == external
+        assert engine.functions.with_asset_transfers_deep().names() == transfers
+
+        other = SolidityQueryEngine()
+        other.load_sources([source.path for source in engine.source_manager.get_all_files()])
+        assert other.functions.with_asset_transfers_deep().names() == transfers
+        assert other.functions.with_external_calls_deep().names() == external
+
+    def test_callee_names_follow_call_edges(self, engine):
+        """Call tree walks follow each distinct callee name once."""
+        analyzer = CallAnalyzer()
+        for function in engine.functions:
+            if not function.body:
+                continue
+            names = analyzer._find_callee_names(function)
+            called = [analyzer._extract_called_function_name(c)
+                      for c in analyzer._find_body_calls(function)]
+            assert names == list(dict.fromkeys(n for n in called if n))
+
+    def test_precomputed_call_graph(self, engine):
+        """The call graph maps each function name to its distinct callee names."""
+        analyzer = CallAnalyzer()
+        functions = engine._get_function_table().functions
+        graph = analyzer.precompute_call_graph(functions)
+
+        assert set(graph) == {f.name for f in functions}
+        by_name = {f.name: f for f in functions}
+        for name, callees in graph.items():
+            assert callees == analyzer._find_callee_names(by_name[name])
+
+    def test_call_tree_flags_on_long_call_chains(self, tmp_path):
+        """Deep call filters handle call chains longer than the recursion limit and cycles."""
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        chain = "\n".join(f"    function hop{i}() internal {{ hop{i + 1}(); }}" for i in range(depth))
+        source = tmp_path / "Chain.sol"
+        source.write_text(
+            "pragma solidity ^0.8.0;\n"
+            "contract Chain {\n"
+            f"{chain}\n"
+            f"    function hop{depth}(address target) internal {{ target.call(\"\"); }}\n"
+            "    function ping() internal { pong(); }\n"
+            "    function pong() internal { ping(); }\n"
+            "}\n"
+        )
+        engine = SolidityQueryEngine(source)
+
+        deep = set(engine.functions.with_external_calls_deep().names())
+        assert {f"hop{i}" for i in range(depth + 1)} <= deep
+        assert not {"ping", "pong"} & deep
+
     def test_negation_filters(self, engine):
         """Test the negation filters."""
         all_functions = engine.functions.list()
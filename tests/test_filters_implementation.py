@@ -214,6 +214,219 @@ class TestFiltersImplementation:
         print(f"  Functions: {len(all_functions)}")
         print(f"  Variables: {len(all_variables)}")
 
+    def test_function_table_parameter_filter(self, engine):
+        """with_parameters agrees with reading parameter lists directly."""
+        expected = [f for f in engine.functions if len(f.parameters) > 0]
+        assert engine.functions.with_parameters().list() == expected
+
+        expected_two = [f for f in engine.functions if len(f.parameters) >= 2]
+        assert engine.functions.with_parameters(min_count=2).list() == expected_two
+
+        expected_none = [f for f in engine.functions if not f.parameters]
+        assert engine.functions.without_parameters().list() == expected_none
+
+    def test_flag_filters_match_attribute_filters(self, engine):
+        """Flag-based visibility and mutability filters agree with node attributes."""
+        functions = engine.functions.list()
+        assert engine.functions.external().view().list() == [
+            f for f in functions if f.is_external() and f.is_view()]
+        assert engine.functions.not_view().list() == [f for f in functions if not f.is_view()]
+        assert engine.functions.not_constructors().list() == [
+            f for f in functions if not f.is_constructor]
+        assert engine.functions.with_visibility("public").list() == [
+            f for f in functions if f.visibility == "public"]
+
+    def test_flag_buckets_on_full_collection(self, engine):
+        """Flag filters on the full collection agree with node attributes and are not shared."""
+        functions = engine.functions.list()
+        external = engine.functions.external()
+        assert external.list() == [f for f in functions if f.is_external()]
+        assert engine.functions.not_external().list() == [f for f in functions if not f.is_external()]
+
+        external.list().clear()
+        assert len(engine.functions.external()) == len([f for f in functions if f.is_external()])
+
+    def test_body_and_loop_filters(self, engine):
+        """Body and loop filters agree with walking each function body."""
+        functions = engine.functions.list()
+        assert engine.functions.with_body().list() == [f for f in functions if f.body]
+        assert engine.functions.without_body().list() == [f for f in functions if not f.body]
+        assert engine.functions.public().with_body().list() == [
+            f for f in engine.functions.public() if f.body]
+
+        loop_types = {"for_statement", "while_statement", "do_while_statement"}
+        expected = [f for f in functions if f.body and any(
+            s.node_type.value in loop_types for s in engine._extract_statements_from_block(f.body))]
+        assert engine.functions.with_loops().list() == expected
+        assert len(expected) > 0
+
+    def test_modifier_set_filters(self, engine):
+        """Set-based modifier filters agree with per-modifier membership tests."""
+        functions = engine.functions.list()
+        guards = ["onlyOwner", "onlyAdmin", "requiresAuth"]
+        assert engine.functions.with_modifiers(guards).list() == [
+            f for f in functions if any(m in f.modifiers for m in guards)]
+        assert engine.functions.without_any_modifiers_matching(guards).list() == [
+            f for f in functions if not any(m in f.modifiers for m in guards)]
+        assert engine.functions.without_modifier("onlyOwner").list() == [
+            f for f in functions if "onlyOwner" not in f.modifiers]
+        assert engine.find_functions(modifiers="onlyOwner") == [
+            f for f in functions if "onlyOwner" in f.modifiers]
+        for guards in [["onlyOwner"], ["onlyOwner", "validAddress"], ["unknownModifier"], []]:
+            assert engine.functions.external().without_any_modifiers_matching(guards).list() == [
+                f for f in engine.functions.external() if not any(m in f.modifiers for m in guards)]
+
+    def test_from_contract_uses_parent_pointers(self, engine):
+        """from_contract agrees with comparing parent contract names."""
+        for name in ["ComplexLogic", "Token", "DoesNotExist"]:
+            expected_functions = [f for f in engine.functions
+                                  if f.parent_contract and f.parent_contract.name == name]
+            assert engine.functions.from_contract(name).list() == expected_functions
+            expected_variables = [v for v in engine.variables
+                                  if v.parent_contract and v.parent_contract.name == name]
+            assert engine.variables.from_contract(name).list() == expected_variables
+        assert len(engine.functions.from_contract("ComplexLogic")) > 0
+        assert engine.functions.view().from_contract("ComplexLogic").list() == [
+            f for f in engine.functions.from_contract("ComplexLogic") if f.is_view()]
+
+    def test_operator_category_filters(self, engine):
+        """Operator category lookups agree with explicit operator lists."""
+        expressions = engine.expressions.list()
+        arithmetic = ["+", "-", "*", "/", "%", "**"]
+        comparison = ["==", "!=", "<", ">", "<=", ">="]
+        assert engine.expressions.with_arithmetic_operators().list() == [
+            e for e in expressions if getattr(e, 'operator', None) in arithmetic]
+        assert engine.expressions.with_comparison_operators().list() == [
+            e for e in expressions if getattr(e, 'operator', None) in comparison]
+        assert engine.expressions.with_operator("+").list() == [
+            e for e in expressions if getattr(e, 'operator', None) == "+"]
+        assert len(engine.expressions.with_arithmetic_operators()) > 0
+
+    def test_source_keyword_index(self, engine):
+        """Keyword-indexed source filters agree with scanning each function's source."""
+        functions = engine.functions.list()
+        for text in ["balance", "require", "+", "notInAnySource"]:
+            assert engine.functions.with_source_containing(text).list() == [
+                f for f in functions if text in f.get_source_code()]
+        matcher = engine.pattern_matcher
+        assert engine.functions.with_timestamp_usage().list() == [
+            f for f in functions
+            if matcher.matches_text_pattern(f.get_source_code(), r"(block\.timestamp|now\b)")]
+        time_patterns = [r"block\.timestamp", r"now\b", r"\btimestamp\b", r"\bduration\b",
+                         r"\bdeadline\b", r"\bexpiry\b", r"\btimeout\b"]
+        assert engine.functions.with_time_operations().list() == [
+            f for f in functions
+            if any(matcher.matches_text_pattern(f.get_source_code(), p) for p in time_patterns)]
+
+    def test_time_flags_match_regex_scans(self, engine):
+        """Precomputed time flags agree with running each time pattern per function."""
+        functions = engine.functions.list()
+        matcher = engine.pattern_matcher
+        arithmetic_patterns = [r"(block\.timestamp|now|timestamp|duration)\s*[+\-*/%]",
+                               r"[+\-*/%]\s*(block\.timestamp|now|timestamp|duration)"]
+        assert engine.functions.with_time_arithmetic().list() == [
+            f for f in functions
+            if any(matcher.matches_text_pattern(f.get_source_code(), p) for p in arithmetic_patterns)]
+        assert engine.find_functions_with_time_operations() == engine.functions.with_time_operations().list()
+
+    def test_variable_table_filters(self, engine):
+        """Variable type and time filters agree with direct pattern matching."""
+        variables = engine.variables.list()
+        matcher = engine.pattern_matcher
+        for pattern in ["uint256", "mapping*", "*address*"]:
+            expected = [v for v in variables if matcher.matches_name_pattern(v.type_name, pattern)]
+            assert engine.variables.with_type(pattern).list() == expected
+            assert engine.variables.not_with_type(pattern).list() == [
+                v for v in variables if v not in expected]
+
+        time_patterns = ["*timestamp*", "*time*", "*duration*", "*deadline*",
+                         "*expiry*", "*timeout*", "*delay*", "*period*"]
+        expected_time = [v for v in variables
+                         if any(matcher.matches_name_pattern(v.name, p) for p in time_patterns)]
+        assert engine.variables.time_related().list() == expected_time
+        assert engine.find_variables_time_related() == expected_time
+        assert engine.variables.not_constants().list() == [v for v in variables if not v.is_constant]
+
+    def test_type_filters_on_full_collection(self, engine):
+        """with_type() on all variables keeps engine order."""
+        matcher = engine.pattern_matcher
+        for pattern in ["uint256", "address", "mapping*", "*int*", "missing", ["bool", "uint*"]]:
+            expected = [v for v in engine.variables
+                        if matcher.matches_name_pattern(v.type_name, pattern)]
+            found = engine.variables.with_type(pattern)
+            assert [id(v) for v in found] == [id(v) for v in expected]
+
+    def test_exact_name_lookup(self, engine):
+        """Exact-name queries agree with scanning, on full and filtered collections."""
+        for name in ["Token", "ComplexLogic", "Missing"]:
+            expected = [c for c in engine.contracts if c.name == name]
+            assert engine.contracts.with_name(name).list() == expected
+            assert engine.contracts.with_name(name).first() == (expected[0] if expected else None)
+        for name in ["processNumbers", "transfer", "missing"]:
+            functions = engine.functions.list()
+            assert engine.functions.with_name(name).list() == [f for f in functions if f.name == name]
+            assert engine.functions.external().with_name(name).list() == [
+                f for f in functions if f.name == name and f.is_external()]
+
+    def test_name_index_matches_pattern_matcher(self, engine):
+        """Indexed name lookups agree with direct pattern matching."""
+        functions = engine.functions.list()
+        matcher = engine.pattern_matcher
+        for pattern in ["transfer*", "*process*", "*get*", "processNumbers", "*a?e*", ["*sum*", "get*"]]:
+            expected = [f for f in functions if matcher.matches_name_pattern(f.name, pattern)]
+            assert engine.functions.with_name(pattern).list() == expected
+            assert engine.find_functions(name_patterns=pattern) == expected
+
+    def test_name_index_follows_normcase(self, engine, monkeypatch):
+        """Prefix and substring globs match like the pattern matcher under a case-folding normcase."""
+        import ntpath
+        from sol_query.query.indexes import NameIndex
+        from sol_query.utils.pattern_matching import compile_glob
+
+        monkeypatch.setattr("os.path.normcase", ntpath.normcase)
+        compile_glob.cache_clear()
+        try:
+            matcher = engine.pattern_matcher
+            names = ["Transfer", "transferFrom", "safeTRANSFER", "approve"]
+            index = NameIndex(names, matcher)
+            for pattern in ["transfer*", "TRANSFER*", "*Transfer*", "*approve*"]:
+                expected = {n for n in names if matcher.matches_name_pattern(n, pattern)}
+                assert index.matching(pattern) == expected
+            assert index.matching("transfer*") == {"Transfer", "transferFrom"}
+        finally:
+            compile_glob.cache_clear()
+
+    def test_pattern_list_matches_union_of_patterns(self, engine):
+        """One with_name call over a glob list selects the union of the single-glob queries."""
+        globs = ["*process*", "*calculate*", "*analyze*", "*sum*"]
+        union = engine.union(*(engine.functions.with_name(g) for g in globs))
+        combined = engine.functions.with_name(globs).list()
+        assert sorted(id(f) for f in combined) == sorted(id(f) for f in union)
+        union_ids = {id(f) for f in union}
+        assert [id(f) for f in combined] == [id(f) for f in engine.functions if id(f) in union_ids]
+
+    def test_glob_list_matches_any_glob(self, engine):
+        """A list of globs matches exactly the names matched by one of its globs."""
+        import fnmatch
+        matcher = engine.pattern_matcher
+        globs = ["*time*", "get?", "[ab]x", "*Total"]
+        for name in ["startTime", "getA", "get", "ax", "cx", "[ab]x", "getTotal", "total"]:
+            expected = any(name == g or fnmatch.fnmatch(name, g) for g in globs)
+            assert matcher.matches_name_pattern(name, globs) == expected
+
+    def test_glob_matchers_match_pattern_matcher(self, engine):
+        """Prebuilt name matchers agree with matches_name_pattern."""
+        matcher = engine.pattern_matcher
+        names = ["Token", "MyToken", "token", "Vault", "transfer", "transferFrom"]
+        for pattern in ["*Token*", "transfer?rom", "[TV]*", "transfer", ["transfer*", "Vault"]]:
+            name_matches = matcher.name_pattern_matcher(pattern)
+            assert [n for n in names if name_matches(n)] == \
+                [n for n in names if matcher.matches_name_pattern(n, pattern)]
+
+        expected = [c.name for c in engine.contracts if matcher.matches_name_pattern(c.name, "*Token*")]
+        assert [c.name for c in engine.contracts.with_name("*Token*")] == expected
+        assert [c.name for c in engine.find_contracts(name_patterns="*Token*")] == expected
+
 
 if __name__ == "__main__":
     # Run a quick test
@@ -282,3 +282,90 @@ class TestLLMSerializerIntegration:
         short_source = "short code"
         short_preview = serializer._create_source_preview(short_source)
         assert short_preview == short_source, "Short source should not be truncated"
+
+    def test_serialize_node_is_cached_per_level(self):
+        """Repeated serialization reuses the cached result for the same node and level."""
+        serializer = LLMSerializer(SerializationLevel.DETAILED, cache_size=16)
+        function = self.engine.functions.first()
+
+        first = serializer.serialize_node(function)
+        second = serializer.serialize_node(function)
+        assert first == second
+        assert first == LLMSerializer(SerializationLevel.DETAILED, cache_size=0).serialize_node(function)
+
+        summary = serializer.serialize_node(function, SerializationLevel.SUMMARY)
+        assert summary == LLMSerializer(SerializationLevel.SUMMARY).serialize_node(function)
+        assert summary != first
+
+        serializer.clear_cache()
+        assert serializer.serialize_node(function) == first
+
+    def test_json_bytes_match_json_output(self):
+        """Compact byte output decodes to the same data as to_json."""
+        import json
+        serializer = LLMSerializer(SerializationLevel.DETAILED)
+        contract = self.engine.contracts.first()
+
+        encoded = serializer.serialize_node_bytes(contract)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == json.loads(serializer.to_json(serializer.serialize_node(contract)))
+
+        collection = serializer.serialize_collection(self.engine.functions, limit=3)
+        assert collection["returned_count"] == min(3, len(self.engine.functions))
+        assert collection["total_count"] == len(self.engine.functions)
+        assert json.loads(serializer.to_json_bytes(collection)) == json.loads(serializer.to_json(collection))
+
+    def test_collection_serialization_is_streamed(self):
+        """Limited serialization without a total only evaluates the returned elements."""
+        import io
+        import json
+        serializer = LLMSerializer(SerializationLevel.SUMMARY)
+        evaluated = []
+
+        def track(func):
+            evaluated.append(func)
+            return True
+
+        result = serializer.serialize_collection(self.engine.functions.where(track), limit=2,
+                                                 include_total=False)
+        assert result["returned_count"] == 2
+        assert result["total_count"] is None
+        assert len(evaluated) == 2
+
+        functions = list(self.engine.functions)
+        from_iterator = serializer.serialize_collection(iter(functions), limit=2)
+        assert from_iterator["items"] == result["items"]
+
+        stream = io.StringIO()
+        serializer.dump_json(result, stream)
+        assert json.loads(stream.getvalue()) == json.loads(serializer.to_json(result))
+
+    def test_serialization_cache_is_bounded(self, monkeypatch):
+        """Cache hits skip rebuilding; the least recently used node is rebuilt after eviction."""
+        from sol_query.core.ast_nodes import ASTNode
+
+        reads = []
+        get_source_code = ASTNode.get_source_code
+        monkeypatch.setattr(ASTNode, "get_source_code",
+                            lambda node: reads.append(node) or get_source_code(node))
+
+        def serialize_counting(serializer, node):
+            reads.clear()
+            result = serializer.serialize_node(node)
+            return result, len(reads)
+
+        functions = list(self.engine.functions)[:3]
+        serializer = LLMSerializer(SerializationLevel.SUMMARY, cache_size=2)
+        built = [serialize_counting(serializer, function) for function in functions]
+        assert all(count > 0 for _, count in built)
+
+        # The two most recent nodes are hits and do no work at all
+        assert serialize_counting(serializer, functions[2]) == (built[2][0], 0)
+        assert serialize_counting(serializer, functions[1]) == (built[1][0], 0)
+        # The first node was evicted and is rebuilt
+        assert serialize_counting(serializer, functions[0]) == built[0]
+
+        # The default serializer does not cache and returns fresh results
+        uncached = LLMSerializer(SerializationLevel.SUMMARY)
+        assert serialize_counting(uncached, functions[1]) == built[1]
+        assert serialize_counting(uncached, functions[1]) == built[1]
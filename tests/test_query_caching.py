@@ -0,0 +1,97 @@
+"""Tests for cached engine results staying correct as sources are loaded."""
+
+import pytest
+from pathlib import Path
+
+from sol_query import SolidityQueryEngine
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestQueryCaching:
+    """Cached query results must not be shared and must follow source changes."""
+
+    @pytest.fixture
+    def engine(self):
+        """Query engine loaded with sample contract."""
+        return SolidityQueryEngine(FIXTURES_DIR / "sample_contract.sol")
+
+    def test_cached_results_are_not_shared(self, engine):
+        """Mutating a returned list must not corrupt later queries."""
+        returns = engine.find_returns()
+        count = len(returns)
+        returns.clear()
+        assert len(engine.find_returns()) == count
+
+    def test_index_invalidated_on_load(self, engine):
+        """Loading more sources rebuilds cached indexes."""
+        before = len(engine.find_returns())
+        engine.load_sources(FIXTURES_DIR / "detailed_scenarios" / "MathOperations.sol")
+        after = len(engine.find_returns())
+        assert after > before
+
+    def test_batch_loading_matches_sequential_loading(self):
+        """Loading several files in one parallel batch matches loading them one by one."""
+        paths = [FIXTURES_DIR / "sample_contract.sol",
+                 FIXTURES_DIR / "detailed_scenarios" / "MathOperations.sol",
+                 FIXTURES_DIR / "composition_and_imports" / "MultipleInheritance.sol"]
+        batched = SolidityQueryEngine(paths)
+
+        sequential = SolidityQueryEngine()
+        for path in paths:
+            sequential.source_manager.add_file(path)
+
+        assert [f.path for f in batched.source_manager.get_all_files()] == [
+            f.path for f in sequential.source_manager.get_all_files()]
+        assert [c.name for c in batched.contracts] == [c.name for c in sequential.contracts]
+        assert len(batched.functions) == len(sequential.functions)
+
+    def test_unchanged_content_is_not_reparsed(self, tmp_path):
+        """Touching a file without changing it keeps the parsed AST; editing it reparses."""
+        import os
+        source = (FIXTURES_DIR / "sample_contract.sol").read_text()
+        path = tmp_path / "Sample.sol"
+        path.write_text(source)
+
+        engine = SolidityQueryEngine(path)
+        source_file = engine.source_manager.get_file(path)
+        generation = engine.source_manager.generation
+
+        later = path.stat().st_mtime + 10
+        os.utime(path, (later, later))
+        assert engine.source_manager.add_file(path) is source_file
+        assert engine.source_manager.refresh_file(path) is source_file
+        assert engine.source_manager.generation == generation
+
+        path.write_text(source + "\ncontract Extra {}\n")
+        refreshed = engine.source_manager.refresh_file(path)
+        assert refreshed is not source_file
+        assert "Extra" in [c.name for c in engine.contracts]
+
+    def test_statistics_follow_loaded_sources(self, engine):
+        """Cached statistics match direct counts and are recomputed after loading."""
+        contracts = engine.contracts.list()
+        stats = engine.get_statistics()
+        assert stats["total_functions"] == sum(len(c.functions) for c in contracts)
+        assert stats["total_state_variables"] == sum(len(c.variables) for c in contracts)
+        assert sum(stats["contracts_by_type"].values()) == len(contracts)
+
+        stats["contracts_by_type"]["contract"] = -1
+        assert engine.get_statistics()["contracts_by_type"]["contract"] >= 0
+
+        engine.load_sources(FIXTURES_DIR / "detailed_scenarios" / "MathOperations.sol")
+        assert engine.get_statistics()["total_functions"] > stats["total_functions"]
+
+    def test_read_file_errors(self, tmp_path):
+        """Missing paths and directories are reported without separate existence probes."""
+        from sol_query.core.parser import ParseError
+
+        engine = SolidityQueryEngine()
+        with pytest.raises(FileNotFoundError):
+            engine.source_manager.add_file(tmp_path / "missing.sol")
+        with pytest.raises(ParseError):
+            engine.source_manager.add_file(tmp_path)
+
+        engine.load_sources([tmp_path / "missing.sol", FIXTURES_DIR / "sample_contract.sol"])
+        assert len(engine.source_manager.get_all_files()) == 1
@@ -33,6 +33,25 @@ class TestQueryComposition:
         for contract in large_contracts.list():
             assert len(contract.functions) > 5
 
+    def test_lazy_collections_defer_filtering(self, engine):
+        """Deferred filters evaluate only as far as first() needs."""
+        calls = []
+
+        def predicate(func):
+            calls.append(func)
+            return True
+
+        lazy = engine.functions.where(predicate)
+        assert calls == []
+
+        first = lazy.first()
+        assert first is engine.functions.list()[0]
+        assert len(calls) == 1
+
+        assert len(lazy) == len(engine.functions)
+        name = engine.contracts.list()[-1].name
+        assert engine.contracts.with_name(name).first().name == name
+
     def test_and_filter_chaining(self, engine):
         """Test and_filter() method for chaining conditions."""
         # Find external functions that are also payable
@@ -163,6 +182,43 @@ class TestQueryComposition:
         for contract in inherited_contracts.list():
             assert len(contract.inheritance) > 0
 
+    def test_with_names_ignores_later_changes_to_names(self, engine):
+        """Test that with_names() filters by the names given at call time."""
+        names = [c.name for c in engine.contracts.list()[:2]]
+        expected = set(names)
+        selected = engine.contracts.with_names(names)
+
+        names.clear()
+
+        assert {c.name for c in selected.list()} == expected
+
+    def test_simple_filters_stop_at_first_match(self, engine, monkeypatch):
+        """Test that first() on chained simple filters evaluates only up to the first match."""
+        from sol_query.core.ast_nodes import ContractDeclaration, FunctionDeclaration
+
+        checked = []
+        is_interface = ContractDeclaration.is_interface
+        has_modifiers = FunctionDeclaration.has_modifiers
+        monkeypatch.setattr(ContractDeclaration, "is_interface",
+                            lambda c: checked.append(c) or is_interface(c))
+        monkeypatch.setattr(FunctionDeclaration, "has_modifiers",
+                            lambda f: checked.append(f) or has_modifiers(f))
+
+        contracts = engine.contracts.list()
+        interfaces = engine.contracts.interfaces()
+        assert checked == []
+        position = next(i for i, c in enumerate(contracts) if is_interface(c))
+        assert interfaces.first() is contracts[position]
+        assert [id(c) for c in checked] == [id(c) for c in contracts[:position + 1]]
+
+        checked.clear()
+        functions = engine.functions.list()
+        position = next(i for i, f in enumerate(functions)
+                        if not has_modifiers(f) and f.visibility != "private")
+        chained = engine.functions.without_modifiers().not_with_visibility("private")
+        assert chained.first() is functions[position]
+        assert [id(f) for f in checked] == [id(f) for f in functions[:position + 1]]
+
     def test_composition_with_variables(self, engine):
         """Test composition operations with variable collections."""
         # Find state variables that are NOT constants
@@ -242,3 +298,4 @@ class TestQueryComposition:
         # Should complete in reasonable time (less than 1 second for small test set)
         assert end_time - start_time < 1.0
         assert len(result) > 0
+